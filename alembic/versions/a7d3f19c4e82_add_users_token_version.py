@@ -0,0 +1,29 @@
+"""add_users_token_version
+
+Revision ID: a7d3f19c4e82
+Revises: e41a7c2b9d53
+Create Date: 2026-10-17 15:02:37.418905
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "a7d3f19c4e82"
+down_revision: Union[str, None] = "e41a7c2b9d53"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column("token_version", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE users DROP COLUMN IF EXISTS token_version")
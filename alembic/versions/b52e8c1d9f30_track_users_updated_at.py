@@ -0,0 +1,45 @@
+"""track_users_updated_at
+
+Revision ID: b52e8c1d9f30
+Revises: a7d3f19c4e82
+Create Date: 2026-10-17 18:20:11.204517
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b52e8c1d9f30"
+down_revision: Union[str, None] = "a7d3f19c4e82"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "UPDATE users SET updated_at = COALESCE(created_at, now()) "
+        "WHERE updated_at IS NULL"
+    )
+    # Every write, including raw SQL that bumps token_version or deactivates a
+    # user, moves updated_at, which UserStates uses as its watermark
+    op.execute("""
+        CREATE OR REPLACE FUNCTION users_set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """)
+    op.execute(
+        "CREATE TRIGGER users_set_updated_at BEFORE INSERT OR UPDATE ON users "
+        "FOR EACH ROW EXECUTE FUNCTION users_set_updated_at()"
+    )
+    op.create_index(op.f("ix_users_updated_at"), "users", ["updated_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_users_updated_at")
+    op.execute("DROP TRIGGER IF EXISTS users_set_updated_at ON users")
+    op.execute("DROP FUNCTION IF EXISTS users_set_updated_at()")
@@ -0,0 +1,52 @@
+"""create_analysis_cache_table
+
+Revision ID: bdb942ec36ce
+Revises: 79b07bc6d325
+Create Date: 2026-10-17 09:12:40.512318
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "bdb942ec36ce"
+down_revision: Union[str, None] = "79b07bc6d325"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "analysis_cache",
+        sa.Column("id", sa.BigInteger(), nullable=False),
+        sa.Column("text_hash", sa.String(64), nullable=False),
+        sa.Column("topic_version", sa.String(64), nullable=False),
+        sa.Column("sentiment", sa.String(), nullable=False),
+        sa.Column("topics", sa.JSON(), nullable=False, server_default="[]"),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.text("now()")
+        ),
+        sa.Column(
+            "last_used_at", sa.DateTime(timezone=True), server_default=sa.text("now()")
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("text_hash", "topic_version", name="uq_analysis_cache_key"),
+    )
+    op.create_index(
+        op.f("ix_analysis_cache_id"), "analysis_cache", ["id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_analysis_cache_last_used_at"),
+        "analysis_cache",
+        ["last_used_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_analysis_cache_last_used_at")
+    op.execute("DROP INDEX IF EXISTS ix_analysis_cache_id")
+    op.execute("DROP TABLE IF EXISTS analysis_cache")
@@ -0,0 +1,43 @@
+"""create_word_count_tables
+
+Revision ID: c695d5f47084
+Revises: bdb942ec36ce
+Create Date: 2026-10-17 10:03:18.220417
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c695d5f47084"
+down_revision: Union[str, None] = "bdb942ec36ce"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "word_totals",
+        sa.Column("word", sa.String(50), nullable=False),
+        sa.Column("count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("word"),
+    )
+    op.create_index("ix_word_totals_count", "word_totals", ["count"], unique=False)
+
+    op.create_table(
+        "word_daily_counts",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("product_name", sa.String(), nullable=False, server_default=""),
+        sa.Column("word", sa.String(50), nullable=False),
+        sa.Column("count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("day", "product_name", "word"),
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS word_daily_counts")
+    op.execute("DROP INDEX IF EXISTS ix_word_totals_count")
+    op.execute("DROP TABLE IF EXISTS word_totals")
@@ -0,0 +1,44 @@
+"""create_feedback_rollups_table
+
+Revision ID: e41a7c2b9d53
+Revises: c695d5f47084
+Create Date: 2026-10-17 11:24:51.804316
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "e41a7c2b9d53"
+down_revision: Union[str, None] = "c695d5f47084"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "feedback_rollups",
+        sa.Column("granularity", sa.String(8), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("product_name", sa.String(), nullable=False, server_default=""),
+        sa.Column("dimension", sa.String(16), nullable=False),
+        sa.Column("value", sa.String(), nullable=False, server_default=""),
+        sa.Column("count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint(
+            "granularity", "bucket_start", "product_name", "dimension", "value"
+        ),
+    )
+    op.create_index(
+        "ix_feedback_rollups_product",
+        "feedback_rollups",
+        ["granularity", "product_name", "bucket_start"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_feedback_rollups_product")
+    op.execute("DROP TABLE IF EXISTS feedback_rollups")
@@ -1,37 +1,68 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from src.routes import setup_routes
 from config import get_config
 from src.utils.logger import get_logger
-from alembic.config import Config
-from alembic import command
-
-import multiprocessing
+from src.database.config import dispose_async_engine
+from src.auth.user_states import user_states
+from src.services.search_service import (
+    init_async_search_client,
+    close_async_search_client,
+)
+from src.utils.startup_profile import phase
 
 logger = get_logger(__name__)
 
 config = get_config()
-app = FastAPI()
 
 
-def run_migrations():
-    """Run database migrations on application startup."""
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Create per-worker shared clients before the first request and close them
+    on shutdown. With READ_AUTH_MODE=token each worker refreshes its user
+    states in the background.
+    """
+    with phase("search_client"):
+        await init_async_search_client(config)
+    if config["READ_AUTH_MODE"] == "token":
+        user_states.start()
     try:
-        alembic_cfg = Config("alembic.ini")
-        command.upgrade(alembic_cfg, "head")
-        logger.info("Database migrations completed successfully")
-    except Exception as e:
-        logger.error(f"Failed to run migrations: {e}")
+        yield
+    finally:
+        await user_states.stop()
+        await close_async_search_client()
+        await dispose_async_engine()
+
+
+app = FastAPI(lifespan=lifespan)
+
+
+# Deployments run `python -m src.jobs.migrate` before starting workers instead.
+# Imported only when used, so workers that skip it never load Alembic.
+if config["RUN_MIGRATIONS_ON_STARTUP"]:
+    with phase("migrations"):
+        from src.jobs.migrate import run_migrations
+
+        run_migrations()
 
+if config["OPENSEARCH_BOOTSTRAP_ON_STARTUP"]:
+    with phase("index_bootstrap"):
+        from src.jobs.index_bootstrap import run_index_bootstrap
 
-run_migrations()
+        run_index_bootstrap(config)
 
-setup_routes(app, config)
+with phase("routes"):
+    setup_routes(app, config)
 
 if __name__ == "__main__":
-    import uvicorn
+    import sys
 
-    workers = multiprocessing.cpu_count()
-    workers = workers * 2
+    from gunicorn.app.wsgiapp import run
 
-    logger.info(f"Starting server with {workers} workers")
-    uvicorn.run("app:app", host="0.0.0.0", port=8000, reload=True, workers=workers)
+    # Same launcher as production: gunicorn with uvicorn workers, see
+    # gunicorn.conf.py. `uvicorn app:app --reload` is the development server.
+    # Gunicorn imports "app"; reuse this module rather than initializing twice.
+    sys.modules["app"] = sys.modules["__main__"]
+    sys.argv = ["gunicorn", "-c", "gunicorn.conf.py", "app:app"]
+    run()
@@ -1,5 +1,7 @@
 import os
 import json
+import time
+from functools import lru_cache
 from dotenv import load_dotenv
 from src.utils.logger import get_logger
 
@@ -7,40 +9,205 @@ load_dotenv()
 logger = get_logger(__name__)
 
 
+# Config keys loaded from AWS Secrets Manager, and the secret each comes from
+SECRET_KEYS = {
+    "OPENAI_API_KEY": "OPENAI_API_KEY",
+    "INTELLIGENCE_API_SECRET": "INTELLIGENCE_API_SECRET",
+    "TWILIO_ACCOUNT_SID": "TWILIO_ACCOUNT_SID",
+    "TWILIO_AUTH_TOKEN": "TWILIO_AUTH_TOKEN",
+    "TWILIO_WHATSAPP_FROM": "TWILIO_WHATSAPP_FROM",
+    "DATABASE_URL": "DATABASE_URL",
+    "JWT_SECRET_KEY": "INTELLIGENCE_API_SECRET",
+    "OPENSEARCH_PASSWORD": "OPENSEARCH_PASS",
+    "OPENSEARCH_USERNAME": "OPENSEARCH_USER",
+    "OPENSEARCH_ENDPOINT": "OPENSEARCH_ENDPOINT",
+}
+
+# Secrets the app cannot start without; the others only back optional features
+REQUIRED_SECRETS = frozenset(
+    {
+        "DATABASE_URL",
+        "INTELLIGENCE_API_SECRET",
+        "OPENSEARCH_ENDPOINT",
+        "OPENSEARCH_USER",
+        "OPENSEARCH_PASS",
+    }
+)
+
+# BatchGetSecretValue accepts at most 20 ids per call
+SECRETS_BATCH_SIZE = 20
+
+# How the last get_config() call was served, for the startup report
+load_report = {}
+
+
+def get_secrets_client():
+    """Secrets Manager client; SECRETS_MANAGER_ENDPOINT_URL points it at a stub."""
+    import boto3
+
+    return boto3.client(
+        "secretsmanager",
+        region_name=os.getenv("AWS_REGION", "us-east-1"),
+        endpoint_url=os.getenv("SECRETS_MANAGER_ENDPOINT_URL") or None,
+    )
+
+
+def _get_secret_values(client, names: list) -> dict:
+    """Fetch secrets one call each, concurrently."""
+    from concurrent.futures import ThreadPoolExecutor
+    from botocore.exceptions import ClientError
+
+    def get_secret(secret_name: str) -> str:
+        """Retrieve a secret string from AWS Secrets Manager."""
+        try:
+            response = client.get_secret_value(SecretId=secret_name)
+            return response.get("SecretString", "")
+        except ClientError as e:
+            raise RuntimeError(
+                f"Unable to retrieve secret '{secret_name}': {e.response['Error']['Message']}"
+            )
+
+    with ThreadPoolExecutor(max_workers=len(names)) as pool:
+        return dict(zip(names, pool.map(get_secret, names)))
+
+
+def _batch_get_secret_values(client, names: list) -> dict:
+    """Fetch secrets with BatchGetSecretValue, 20 per call, calls in parallel."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    def get_batch(batch: list) -> dict:
+        response = client.batch_get_secret_value(SecretIdList=batch)
+        if response.get("Errors"):
+            error = response["Errors"][0]
+            raise RuntimeError(
+                f"Unable to retrieve secret '{error.get('SecretId')}': "
+                f"{error.get('Message', error.get('ErrorCode'))}"
+            )
+        return {
+            secret["Name"]: secret.get("SecretString", "")
+            for secret in response.get("SecretValues", [])
+        }
+
+    batches = [
+        names[i : i + SECRETS_BATCH_SIZE]
+        for i in range(0, len(names), SECRETS_BATCH_SIZE)
+    ]
+    values = {}
+    with ThreadPoolExecutor(max_workers=len(batches)) as pool:
+        for batch_values in pool.map(get_batch, batches):
+            values.update(batch_values)
+    missing = set(names) - set(values)
+    if missing:
+        raise RuntimeError(f"Secrets not returned: {sorted(missing)}")
+    return values
+
+
+def fetch_secrets(client=None) -> dict:
+    """
+    Return {secret name: value} for every secret in SECRET_KEYS.
+
+    With AWS_SECRETS_JSON_ID set, all values come from that one JSON secret;
+    a missing required key raises, and other missing keys are logged and left
+    out. Otherwise they are fetched with BatchGetSecretValue, falling back to
+    concurrent GetSecretValue calls if the batch API is not allowed.
+    """
+    from botocore.exceptions import ClientError
+
+    client = client or get_secrets_client()
+    names = sorted(set(SECRET_KEYS.values()))
+
+    json_secret_id = os.getenv("AWS_SECRETS_JSON_ID")
+    if json_secret_id:
+        load_report["method"] = "json"
+        values = json.loads(
+            client.get_secret_value(SecretId=json_secret_id)["SecretString"]
+        )
+        missing = sorted(set(names) - set(values))
+        for name in missing:
+            logger.warning(f"Secret {json_secret_id} has no key {name}")
+        missing_required = REQUIRED_SECRETS.intersection(missing)
+        if missing_required:
+            raise RuntimeError(
+                f"Secret {json_secret_id} is missing required keys: "
+                f"{sorted(missing_required)}"
+            )
+        return {name: values[name] for name in names if name in values}
+
+    try:
+        load_report["method"] = "batch"
+        return _batch_get_secret_values(client, names)
+    except ClientError as e:
+        logger.warning(
+            f"BatchGetSecretValue failed ({e.response['Error']['Code']}), "
+            "fetching secrets individually"
+        )
+        load_report["method"] = "individual"
+        return _get_secret_values(client, names)
+
+
+def _secrets_cache_cipher():
+    """Fernet cipher for the on-disk secrets cache, or None if it is disabled."""
+    key = os.getenv("SECRETS_CACHE_KEY")
+    if not os.getenv("SECRETS_CACHE_PATH") or not key:
+        return None
+    if int(os.getenv("SECRETS_CACHE_TTL_SECONDS", "300")) <= 0:
+        return None
+    try:
+        from cryptography.fernet import Fernet
+    except ImportError:
+        logger.warning("SECRETS_CACHE_PATH is set but cryptography is not installed")
+        return None
+    return Fernet(key)
+
+
+def read_secrets_cache() -> dict:
+    """Return cached secret values younger than SECRETS_CACHE_TTL_SECONDS, or {}."""
+    cipher = _secrets_cache_cipher()
+    path = os.getenv("SECRETS_CACHE_PATH")
+    if cipher is None or not os.path.exists(path):
+        return {}
+    ttl = int(os.getenv("SECRETS_CACHE_TTL_SECONDS", "300"))
+    try:
+        with open(path, "rb") as f:
+            return json.loads(cipher.decrypt(f.read(), ttl=ttl))
+    except Exception as e:
+        # Expired, written with another key, or corrupt
+        logger.info(f"Ignoring secrets cache {path}: {type(e).__name__}")
+        return {}
+
+
+def write_secrets_cache(values: dict) -> None:
+    """Encrypt `values` to SECRETS_CACHE_PATH, readable by the owner only."""
+    cipher = _secrets_cache_cipher()
+    if cipher is None:
+        return
+    path = os.getenv("SECRETS_CACHE_PATH")
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(cipher.encrypt(json.dumps(values).encode()))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Failed to write secrets cache {path}: {e}")
+
+
 def get_aws_secrets():
-    """Get secrets from AWS Secrets Manager."""
+    """
+    Get secrets from AWS Secrets Manager, or the on-disk cache if fresh.
+    Keys missing from the secrets keep their environment values, and an
+    incomplete result is never written to the disk cache.
+    """
     try:
-        import boto3
-        from botocore.exceptions import ClientError
-
-        secrets_client = boto3.client("secretsmanager", region_name="us-east-1")
-
-        def get_secret(secret_name: str) -> str:
-            """Retrieve a secret string from AWS Secrets Manager."""
-            try:
-                response = secrets_client.get_secret_value(SecretId=secret_name)
-                return response.get("SecretString", "")
-            except ClientError as e:
-                raise RuntimeError(
-                    f"Unable to retrieve secret '{secret_name}': {e.response['Error']['Message']}"
-                )
-            except Exception as e:
-                raise RuntimeError(
-                    f"Unexpected error retrieving secret '{secret_name}': {str(e)}"
-                )
-
-        # Get all secrets
+        values = read_secrets_cache()
+        if values:
+            load_report["method"] = "disk cache"
+        else:
+            values = fetch_secrets()
+            if set(SECRET_KEYS.values()) <= set(values):
+                write_secrets_cache(values)
         aws_config = {
-            "OPENAI_API_KEY": get_secret("OPENAI_API_KEY"),
-            "INTELLIGENCE_API_SECRET": get_secret("INTELLIGENCE_API_SECRET"),
-            "TWILIO_ACCOUNT_SID": get_secret("TWILIO_ACCOUNT_SID"),
-            "TWILIO_AUTH_TOKEN": get_secret("TWILIO_AUTH_TOKEN"),
-            "TWILIO_WHATSAPP_FROM": get_secret("TWILIO_WHATSAPP_FROM"),
-            "DATABASE_URL": get_secret("DATABASE_URL"),
-            "JWT_SECRET_KEY": get_secret("INTELLIGENCE_API_SECRET"),
-            "OPENSEARCH_PASSWORD": get_secret("OPENSEARCH_PASS"),
-            "OPENSEARCH_USERNAME": get_secret("OPENSEARCH_USER"),
-            "OPENSEARCH_ENDPOINT": get_secret("OPENSEARCH_ENDPOINT"),
+            key: values[name] for key, name in SECRET_KEYS.items() if name in values
         }
         logger.info("Successfully loaded configuration from AWS Secrets Manager")
         return aws_config
@@ -50,9 +217,13 @@ def get_aws_secrets():
         return None
 
 
+@lru_cache(maxsize=None)
 def get_config():
     """Get configuration from environment variables or AWS Secrets Manager.
-    Falls back to environment variables if AWS Secrets Manager fails."""
+    Falls back to environment variables if AWS Secrets Manager fails.
+    Loaded once per process; call get_config.cache_clear() to reload."""
+    started = time.perf_counter()
+    load_report.clear()
     config = {
         "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY"),
         "INTELLIGENCE_API_SECRET": os.getenv("INTELLIGENCE_API_SECRET"),
@@ -64,6 +235,114 @@ def get_config():
         "OPENSEARCH_PASSWORD": os.getenv("OPENSEARCH_PASS"),
         "OPENSEARCH_USERNAME": os.getenv("OPENSEARCH_USER"),
         "OPENSEARCH_ENDPOINT": os.getenv("OPENSEARCH_ENDPOINT"),
+        # Connections kept open per worker to OpenSearch
+        "OPENSEARCH_POOL_MAXSIZE": int(os.getenv("OPENSEARCH_POOL_MAXSIZE", "25")),
+        "OPENSEARCH_TIMEOUT": int(os.getenv("OPENSEARCH_TIMEOUT", "30")),
+        # Applied by src/jobs/index_bootstrap.py; shards only when an index is created
+        "OPENSEARCH_SHARDS": int(os.getenv("OPENSEARCH_SHARDS", "1")),
+        "OPENSEARCH_REPLICAS": int(os.getenv("OPENSEARCH_REPLICAS", "1")),
+        "OPENSEARCH_REFRESH_INTERVAL": os.getenv("OPENSEARCH_REFRESH_INTERVAL", "5s"),
+        # Off when migrations run as a pre-start step (python -m src.jobs.migrate)
+        "RUN_MIGRATIONS_ON_STARTUP": os.getenv(
+            "RUN_MIGRATIONS_ON_STARTUP", "true"
+        ).lower()
+        == "true",
+        # Deployments run `python -m src.jobs.index_bootstrap` before start instead
+        "OPENSEARCH_BOOTSTRAP_ON_STARTUP": os.getenv(
+            "OPENSEARCH_BOOTSTRAP_ON_STARTUP", "false"
+        ).lower()
+        == "true",
+        # Throttle for src/jobs/reindex.py copies; -1 is unthrottled
+        "REINDEX_REQUESTS_PER_SECOND": float(
+            os.getenv("REINDEX_REQUESTS_PER_SECOND", "2000")
+        ),
+        # Rollover period of feedback-analysis indices: none, year, month or day
+        "FEEDBACK_INDEX_PERIOD": os.getenv("FEEDBACK_INDEX_PERIOD", "none"),
+        # How long the list of indices behind a read alias is reused
+        "INDEX_ALIAS_CACHE_SECONDS": float(
+            os.getenv("INDEX_ALIAS_CACHE_SECONDS", "60")
+        ),
+        # Dashboard aggregation cache; a TTL of 0 disables it
+        "SEARCH_CACHE_TTL_SECONDS": float(os.getenv("SEARCH_CACHE_TTL_SECONDS", "60")),
+        "SEARCH_CACHE_STALE_SECONDS": float(
+            os.getenv("SEARCH_CACHE_STALE_SECONDS", "300")
+        ),
+        # "memory" (per worker LRU) or "sqlite" (one file shared by all workers)
+        "SEARCH_CACHE_BACKEND": os.getenv("SEARCH_CACHE_BACKEND", "memory"),
+        "SEARCH_CACHE_MAX_ENTRIES": int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "1024")),
+        "SEARCH_CACHE_SQLITE_PATH": os.getenv(
+            "SEARCH_CACHE_SQLITE_PATH", "/tmp/feedback-api-search-cache.sqlite3"
+        ),
+        # Sentiment/topic analysis: "openai" (batched model calls) or "local"
+        "ANALYSIS_ENGINE": os.getenv("ANALYSIS_ENGINE", "openai"),
+        "ANALYSIS_MODEL": os.getenv("ANALYSIS_MODEL", "gpt-4o-mini"),
+        "ANALYSIS_BATCH_SIZE": int(os.getenv("ANALYSIS_BATCH_SIZE", "50")),
+        "ANALYSIS_CONCURRENCY": int(os.getenv("ANALYSIS_CONCURRENCY", "4")),
+        # Memoized results by normalized text hash and topic-set version
+        "ANALYSIS_CACHE_ENABLED": os.getenv("ANALYSIS_CACHE_ENABLED", "true").lower()
+        == "true",
+        "ANALYSIS_CACHE_MAX_AGE_DAYS": int(
+            os.getenv("ANALYSIS_CACHE_MAX_AGE_DAYS", "90")
+        ),
+        # Source of /dashboard/wordcount-analysis: "opensearch" or "store"
+        "WORDCOUNT_SOURCE": os.getenv("WORDCOUNT_SOURCE", "opensearch"),
+        # Default wordcount mode: "exact" (WORDCOUNT_SOURCE) or "approximate"
+        # (heavy-hitters sketch snapshot written by the indexer)
+        "WORDCOUNT_MODE": os.getenv("WORDCOUNT_MODE", "exact"),
+        "WORD_SKETCH_PATH": os.getenv(
+            "WORD_SKETCH_PATH", "/tmp/feedback-api-word-sketch.json.gz"
+        ),
+        "WORD_SKETCH_SNAPSHOT_SECONDS": float(
+            os.getenv("WORD_SKETCH_SNAPSHOT_SECONDS", "60")
+        ),
+        # Overestimate is at most (e / width) * total words with
+        # probability 1 - e^-depth
+        "WORD_SKETCH_WIDTH": int(os.getenv("WORD_SKETCH_WIDTH", "16384")),
+        "WORD_SKETCH_DEPTH": int(os.getenv("WORD_SKETCH_DEPTH", "4")),
+        "WORD_SKETCH_CAPACITY": int(os.getenv("WORD_SKETCH_CAPACITY", "200")),
+        # Authenticated users cached per worker; a TTL of 0 disables it
+        "PRINCIPAL_CACHE_TTL_SECONDS": float(
+            os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "30")
+        ),
+        "PRINCIPAL_CACHE_MAX_ENTRIES": int(
+            os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", "10000")
+        ),
+        # Auth for read-only endpoints: "database" (users row, via the principal
+        # cache) or "token" (trust the claims signed into the access token)
+        "READ_AUTH_MODE": os.getenv("READ_AUTH_MODE", "database"),
+        # In token mode, revocations and deactivations apply within this long;
+        # each worker refreshes user states in the background at this interval
+        "READ_AUTH_REFRESH_SECONDS": float(
+            os.getenv("READ_AUTH_REFRESH_SECONDS", "30")
+        ),
+        # JWT library used to sign and verify tokens: "jose" or "pyjwt"
+        "JWT_BACKEND": os.getenv("JWT_BACKEND", "jose"),
+        # Verified tokens cached per worker until they expire; 0 disables it
+        "TOKEN_CACHE_MAX_ENTRIES": int(os.getenv("TOKEN_CACHE_MAX_ENTRIES", "10000")),
+        # Production server (gunicorn.conf.py); workers default to the CPU count
+        "SERVER_BIND": os.getenv("SERVER_BIND", "0.0.0.0:8000"),
+        "SERVER_WORKERS": int(os.getenv("SERVER_WORKERS", "0")),
+        # Event loop and HTTP parser: "auto" picks uvloop/httptools when installed
+        "SERVER_LOOP": os.getenv("SERVER_LOOP", "auto"),
+        "SERVER_HTTP": os.getenv("SERVER_HTTP", "auto"),
+        # Load the app in the master before forking so workers share it
+        "SERVER_PRELOAD": os.getenv("SERVER_PRELOAD", "true").lower() == "true",
+        "SERVER_KEEPALIVE": int(os.getenv("SERVER_KEEPALIVE", "5")),
+        "SERVER_BACKLOG": int(os.getenv("SERVER_BACKLOG", "2048")),
+        # Concurrent connections per worker before answering 503; 0 is unlimited
+        "SERVER_LIMIT_CONCURRENCY": int(os.getenv("SERVER_LIMIT_CONCURRENCY", "0")),
+        "SERVER_TIMEOUT": int(os.getenv("SERVER_TIMEOUT", "60")),
+        # Time in-flight requests get to finish on restart or reload
+        "SERVER_GRACEFUL_TIMEOUT": int(os.getenv("SERVER_GRACEFUL_TIMEOUT", "30")),
+        # Recycle workers after this many requests (plus jitter); 0 disables it
+        "SERVER_MAX_REQUESTS": int(os.getenv("SERVER_MAX_REQUESTS", "0")),
+        "SERVER_MAX_REQUESTS_JITTER": int(os.getenv("SERVER_MAX_REQUESTS_JITTER", "0")),
+        # SQLAlchemy connection pool, applied per engine per worker
+        "DB_POOL_SIZE": int(os.getenv("DB_POOL_SIZE", "5")),
+        "DB_MAX_OVERFLOW": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        "DB_POOL_PRE_PING": os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+        "DB_POOL_RECYCLE": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        "DB_POOL_TIMEOUT": int(os.getenv("DB_POOL_TIMEOUT", "30")),
     }
 
     # Only use AWS Secrets Manager if not in local environment
@@ -72,8 +351,15 @@ def get_config():
         if aws_config:
             config.update(aws_config)
         else:
+            load_report["method"] = "environment"
             logger.info("Using environment variables for configuration")
     else:
+        load_report["method"] = "environment"
         logger.info("Running in local environment, using environment variables")
 
+    load_report["seconds"] = round(time.perf_counter() - started, 4)
+    logger.info(
+        f"Configuration loaded in {load_report['seconds'] * 1000:.1f} ms "
+        f"(secrets: {load_report['method']}, pid {os.getpid()})"
+    )
     return config
@@ -0,0 +1,75 @@
+"""
+Production server settings.
+
+    gunicorn -c gunicorn.conf.py app:app
+
+Values come from the SERVER_* settings in config.py. With SERVER_PRELOAD the
+app is imported once in the master and forked, so config, models and other
+read-only state are shared copy-on-write; anything holding sockets is reset
+in `post_fork`.
+
+Signals to the master:
+- HUP: start new workers and let the old ones finish in-flight requests
+  (up to SERVER_GRACEFUL_TIMEOUT). Without preload each new worker imports
+  the app, so this deploys new code with no downtime. With preload they are
+  forked from the code the master already loaded; new code needs a restart.
+- TERM: stop accepting connections, drain in-flight requests, then exit.
+
+With PROMETHEUS_MULTIPROC_DIR set, workers write metrics to files there that
+/metrics merges. Empty the directory before starting the master (the systemd
+unit does it in ExecStartPre); with preload the app has already written to
+it by the time gunicorn's hooks run.
+"""
+
+import gc
+import multiprocessing
+import os
+
+from config import get_config
+
+app_config = get_config()
+
+bind = app_config["SERVER_BIND"]
+workers = app_config["SERVER_WORKERS"] or multiprocessing.cpu_count()
+worker_class = "src.server.UvicornWorker"
+preload_app = app_config["SERVER_PRELOAD"]
+keepalive = app_config["SERVER_KEEPALIVE"]
+backlog = app_config["SERVER_BACKLOG"]
+timeout = app_config["SERVER_TIMEOUT"]
+graceful_timeout = app_config["SERVER_GRACEFUL_TIMEOUT"]
+max_requests = app_config["SERVER_MAX_REQUESTS"]
+max_requests_jitter = app_config["SERVER_MAX_REQUESTS_JITTER"]
+
+if preload_app:
+    # Only imported by the first request in each worker otherwise
+    import opensearchpy  # noqa: F401
+
+
+def on_starting(server):
+    """Make sure the metrics directory exists; it is emptied before start."""
+    metrics_dir = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    if metrics_dir:
+        os.makedirs(metrics_dir, exist_ok=True)
+
+
+def pre_fork(server, worker):
+    # Keep objects loaded so far out of the collector, so it does not touch
+    # (and un-share) the pages they live on
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    """Drop connections inherited from the master; each worker opens its own."""
+    from src.database.config import async_engine, engine
+    from src.services.search_service import SearchService
+
+    engine.dispose(close=False)
+    async_engine.sync_engine.dispose(close=False)
+    SearchService._instance = None
+
+
+def child_exit(server, worker):
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,86 @@
+"""
+Microbenchmark of per-request authentication overhead.
+
+Times the token checks a request goes through, for each JWT backend:
+- decode: signature and expiry check only (no cache), i.e. the old path
+- verify_token: the same token again, served by the token cache
+- get_current_user: the full dependency with token and principal cached
+
+No database or network is used; the principal is put in the cache up front.
+
+Usage:
+    python -m src.auth.benchmark
+    python -m src.auth.benchmark --iterations 50000
+"""
+
+import argparse
+import asyncio
+import time
+
+from src.auth import jwt_handler
+from src.auth.principal_cache import Principal, principal_cache
+from src.auth.token_cache import token_cache
+
+BACKENDS = ("jose", "pyjwt")
+
+
+def _per_call_us(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+async def _per_await_us(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def run(iterations: int) -> dict:
+    """Return {backend: {step: microseconds per call}}."""
+    principal_cache.put(
+        Principal(id=1, email="bench@example.com", full_name=None, is_active=True)
+    )
+    results = {}
+    for backend in BACKENDS:
+        jwt_handler.JWT_BACKEND = backend
+        token_cache.clear()
+        token = jwt_handler.create_access_token({"sub": "1"})
+        jwt_handler.verify_token(token)
+        results[backend] = {
+            "decode": _per_call_us(lambda: jwt_handler.decode_token(token), iterations),
+            "verify_token": _per_call_us(
+                lambda: jwt_handler.verify_token(token), iterations
+            ),
+            "get_current_user": asyncio.run(
+                _per_await_us(
+                    lambda: jwt_handler.get_current_user(token, None), iterations
+                )
+            ),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time per-request auth overhead")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    if not jwt_handler.SECRET_KEY:
+        jwt_handler.SECRET_KEY = "benchmark-secret"
+    results = run(args.iterations)
+    print(
+        f"{'backend':<8} {'decode':>10} {'verify_token':>14} {'get_current_user':>18}"
+    )
+    for backend, timings in results.items():
+        print(
+            f"{backend:<8} {timings['decode']:>8.1f}us "
+            f"{timings['verify_token']:>12.2f}us "
+            f"{timings['get_current_user']:>16.2f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,12 @@ from typing import Optional
 from jose import JWTError, jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
-from src.database.config import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.auth.principal_cache import Principal, principal_cache
+from src.auth.token_cache import token_cache
+from src.auth.user_states import user_states
+from src.database.config import AsyncSessionLocal, get_async_db
 from src.models.user import User
 from config import get_config
 
@@ -13,9 +17,12 @@ config = get_config()
 SECRET_KEY = config.get("JWT_SECRET_KEY")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 24 * 60
+JWT_BACKEND = config["JWT_BACKEND"]
+READ_AUTH_MODE = config["READ_AUTH_MODE"]
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -25,31 +32,58 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
 
     to_encode.update({"exp": expire, "type": "access"})
+    if JWT_BACKEND == "pyjwt":
+        import jwt as pyjwt
+
+        return pyjwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
+def decode_token(token: str) -> dict:
+    """
+    Check the signature and expiry of a token with the configured backend.
+    Both backends raise JWTError for any invalid token.
+    """
+    if JWT_BACKEND == "pyjwt":
+        # PyJWT pulls in cryptography, so it is only loaded when selected
+        import jwt as pyjwt
+
+        try:
+            return pyjwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        except pyjwt.PyJWTError as e:
+            raise JWTError(str(e))
+    return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+
+
 def verify_token(token: str, token_type: str = "access") -> dict:
-    """Verify and decode a JWT token."""
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        if payload.get("type") != token_type:
+    """Verify and decode a JWT token, reusing earlier verifications."""
+    payload = token_cache.get(token)
+    if payload is None:
+        try:
+            payload = decode_token(token)
+        except JWTError:
             raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token type"
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Could not validate credentials",
+                headers={"WWW-Authenticate": "Bearer"},
             )
-        return payload
-    except JWTError:
+        token_cache.put(token, payload)
+    if payload.get("type") != token_type:
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token type"
         )
+    return payload
 
 
 async def get_current_user(
-    token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
-) -> User:
-    """Get the current authenticated user from JWT token."""
+    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)
+) -> Principal:
+    """
+    Get the current authenticated user from JWT token.
+    Users are read from the principal cache when possible; the session only
+    checks out a connection on a cache miss.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -61,11 +95,20 @@ async def get_current_user(
         user_id: int = payload.get("sub")
         if user_id is None:
             raise credentials_exception
-    except HTTPException:
+        user_id = int(user_id)
+    except (HTTPException, ValueError):
         raise credentials_exception
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = principal_cache.get(user_id)
     if user is None:
+        result = await db.execute(select(User).where(User.id == user_id))
+        row = result.scalars().first()
+        if row is None:
+            raise credentials_exception
+        user = Principal.from_user(row)
+        principal_cache.put(user)
+
+    if payload.get("ver", 0) != user.token_version:
         raise credentials_exception
 
     if not user.is_active:
@@ -77,9 +120,51 @@ async def get_current_user(
 
 
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: Principal = Depends(get_current_user),
+) -> Principal:
     """Get current active user."""
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
+
+
+async def get_read_principal(token: str = Depends(oauth2_scheme)) -> Principal:
+    """
+    Get the current user for read-only endpoints.
+    With READ_AUTH_MODE=token the claims signed into the token are trusted,
+    and checked against the per-worker user states (see UserStates), so no
+    session is opened per request. A bumped token version or a deactivation
+    applies within READ_AUTH_REFRESH_SECONDS, or at once when this worker's
+    principal cache has seen it. Otherwise, for tokens issued before claims
+    were added, for users the states do not know yet (new, or deleted), and
+    while the states are stale because refreshes fail, this is
+    get_current_active_user.
+    """
+    principal = None
+    if READ_AUTH_MODE == "token":
+        try:
+            principal = Principal.from_claims(verify_token(token, "access"))
+        except (KeyError, ValueError):
+            principal = None
+
+    state = None if principal is None else user_states.get(principal.id)
+    if state is None:
+        async with AsyncSessionLocal() as db:
+            return await get_current_active_user(await get_current_user(token, db))
+
+    token_version, is_active = state
+    known = principal_cache.peek(principal.id)
+    if known is not None:
+        token_version = max(token_version, known.token_version)
+        is_active = is_active and known.is_active
+    if principal.token_version != token_version:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if not principal.is_active or not is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
+        )
+    return principal
@@ -0,0 +1,130 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import event
+
+from config import get_config
+from src.models.user import User
+from src.utils.metrics import CACHE_EVENTS
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Immutable snapshot of the user fields authenticated routes read."""
+
+    id: int
+    email: str
+    full_name: Optional[str]
+    is_active: bool
+    token_version: int = 0
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            full_name=user.full_name,
+            is_active=user.is_active,
+            token_version=user.token_version or 0,
+        )
+
+    def to_claims(self) -> dict:
+        """Claims signed into access tokens so they can be trusted without a lookup."""
+        return {
+            "sub": str(self.id),
+            "email": self.email,
+            "name": self.full_name,
+            "active": self.is_active,
+            "ver": self.token_version,
+        }
+
+    @classmethod
+    def from_claims(cls, claims: dict) -> Optional["Principal"]:
+        """Rebuild a principal from token claims, or None for older tokens."""
+        if "email" not in claims or "ver" not in claims:
+            return None
+        return cls(
+            id=int(claims["sub"]),
+            email=claims["email"],
+            full_name=claims.get("name"),
+            is_active=bool(claims.get("active", True)),
+            token_version=int(claims["ver"]),
+        )
+
+
+class PrincipalCache:
+    """
+    Per-process LRU of principals by user id, each kept for `ttl_seconds`.
+
+    Entries are dropped as soon as this process updates or deletes the user
+    (see the mapper events below); changes made elsewhere, such as another
+    worker or a SQL console, are picked up once the TTL lapses.
+    """
+
+    # Label for the cache_events_total counter
+    metrics_name = "principal"
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 30):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+        self._counters = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def _count(self, event: str) -> None:
+        self._counters[event] += 1
+        CACHE_EVENTS.labels(self.metrics_name, event).inc()
+
+    def get(self, user_id: int) -> Optional[Principal]:
+        entry = self._entries.get(user_id)
+        if entry is None or time.monotonic() - entry[0] >= self.ttl_seconds:
+            self._count("misses")
+            return None
+        self._entries.move_to_end(user_id)
+        self._count("hits")
+        return entry[1]
+
+    def peek(self, user_id: int) -> Optional[Principal]:
+        """Return a live entry without touching counters or LRU order."""
+        entry = self._entries.get(user_id)
+        if entry is None or time.monotonic() - entry[0] >= self.ttl_seconds:
+            return None
+        return entry[1]
+
+    def put(self, principal: Principal) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        self._entries[principal.id] = (time.monotonic(), principal)
+        self._entries.move_to_end(principal.id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: Optional[int] = None) -> None:
+        """Drop one user, or every user when no id is given."""
+        self._count("invalidations")
+        if user_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(user_id, None)
+
+    def stats(self) -> dict:
+        return {
+            **self._counters,
+            "entries": len(self._entries),
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+config = get_config()
+principal_cache = PrincipalCache(
+    max_entries=config["PRINCIPAL_CACHE_MAX_ENTRIES"],
+    ttl_seconds=config["PRINCIPAL_CACHE_TTL_SECONDS"],
+)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_principal(mapper, connection, target: User) -> None:
+    # Fires on ORM flushes, including deactivation (is_active=False)
+    principal_cache.invalidate(target.id)
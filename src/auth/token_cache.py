@@ -0,0 +1,60 @@
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from config import get_config
+from src.utils.metrics import CACHE_EVENTS
+
+
+class TokenCache:
+    """
+    Per-process LRU of verified bearer tokens to their claims.
+
+    A token is only cached after its signature and expiry were checked, and
+    is served until its own `exp` passes, so a cache hit never accepts a
+    token the decoder would reject. Tokens without `exp` are not cached.
+    """
+
+    # Label for the cache_events_total counter
+    metrics_name = "token"
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._counters = {"hits": 0, "misses": 0}
+
+    def _count(self, event: str) -> None:
+        self._counters[event] += 1
+        CACHE_EVENTS.labels(self.metrics_name, event).inc()
+
+    def get(self, token: str) -> Optional[dict]:
+        entry = self._entries.get(token)
+        if entry is None:
+            self._count("misses")
+            return None
+        if time.time() >= entry[0]:
+            del self._entries[token]
+            self._count("misses")
+            return None
+        self._entries.move_to_end(token)
+        self._count("hits")
+        return dict(entry[1])
+
+    def put(self, token: str, claims: dict) -> None:
+        expires_at = claims.get("exp")
+        if self.max_entries <= 0 or not isinstance(expires_at, (int, float)):
+            return
+        self._entries[token] = (expires_at, dict(claims))
+        self._entries.move_to_end(token)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {**self._counters, "entries": len(self._entries)}
+
+
+config = get_config()
+token_cache = TokenCache(max_entries=config["TOKEN_CACHE_MAX_ENTRIES"])
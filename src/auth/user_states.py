@@ -0,0 +1,106 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import select
+
+from config import get_config
+from src.database.config import AsyncSessionLocal
+from src.models.user import User
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Rows are re-read this far behind the watermark, since updated_at is the
+# start of the writing transaction and it may commit after a refresh
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+
+class UserStates:
+    """
+    Per-process map of user id to (token_version, is_active), kept current by
+    a background task (see start()) every `refresh_seconds`.
+
+    READ_AUTH_MODE=token checks token claims against it, so a bumped
+    token_version or a deactivation reaches every worker within one refresh
+    interval, without a lookup per request. Each refresh only reads users
+    whose updated_at is past the watermark; every `full_reload_every`
+    refreshes the whole table is read again, which also drops deleted users.
+
+    If refreshes fail for `max_stale_intervals` intervals, get() returns
+    None, so callers fall back to a per-request lookup rather than trusting
+    a stale map.
+    """
+
+    def __init__(
+        self,
+        refresh_seconds: float = 30,
+        max_stale_intervals: int = 3,
+        full_reload_every: int = 20,
+    ):
+        self.refresh_seconds = refresh_seconds
+        self.max_stale_intervals = max_stale_intervals
+        self.full_reload_every = full_reload_every
+        self._states: Optional[Dict[int, Tuple[int, bool]]] = None
+        self._watermark: Optional[datetime] = None
+        self._refreshes = 0
+        self._loaded_at = float("-inf")
+        self._task: Optional[asyncio.Task] = None
+
+    def get(self, user_id: int) -> Optional[Tuple[int, bool]]:
+        """
+        Return (token_version, is_active), or None for users not loaded yet
+        and for every user while the map is stale.
+        """
+        if self._states is None:
+            return None
+        age = time.monotonic() - self._loaded_at
+        if age > self.refresh_seconds * self.max_stale_intervals:
+            return None
+        return self._states.get(user_id)
+
+    async def refresh(self) -> None:
+        """Apply users changed since the last refresh, or reload them all."""
+        full = self._states is None or self._refreshes % self.full_reload_every == 0
+        query = select(User.id, User.token_version, User.is_active, User.updated_at)
+        if not full and self._watermark is not None:
+            query = query.where(User.updated_at >= self._watermark - WATERMARK_OVERLAP)
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(query)).all()
+
+        states = {} if full else self._states
+        for row in rows:
+            states[row.id] = (row.token_version or 0, bool(row.is_active))
+            if row.updated_at is not None and (
+                self._watermark is None or row.updated_at > self._watermark
+            ):
+                self._watermark = row.updated_at
+        self._states = states
+        self._refreshes += 1
+        self._loaded_at = time.monotonic()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Failed to refresh user states: {str(e)}")
+            await asyncio.sleep(self.refresh_seconds)
+
+    def start(self) -> None:
+        """Start refreshing in the background; called from the app lifespan."""
+        if self._task is None and self.refresh_seconds > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+user_states = UserStates(get_config()["READ_AUTH_REFRESH_SECONDS"])
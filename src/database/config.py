@@ -1,20 +1,99 @@
+import time
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from config import get_config
+from src.utils.metrics import DB_POOL_WAIT
 
 config = get_config()
 
 DATABASE_URL = config.get("DATABASE_URL")
 
-engine = create_engine(DATABASE_URL)
+# Shared pool settings for the sync and async engines
+POOL_OPTIONS = {
+    "pool_size": config["DB_POOL_SIZE"],
+    "max_overflow": config["DB_MAX_OVERFLOW"],
+    "pool_pre_ping": config["DB_POOL_PRE_PING"],
+    "pool_recycle": config["DB_POOL_RECYCLE"],
+    "pool_timeout": config["DB_POOL_TIMEOUT"],
+}
+
+
+class TimedPoolMixin:
+    """
+    Records how long each checkout waits for a connection in DB_POOL_WAIT.
+    Sessions check out lazily, so this is time spent inside the first query
+    of a request rather than in get_db/get_async_db.
+    """
+
+    metrics_label = "sync"
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            DB_POOL_WAIT.labels(self.metrics_label).observe(
+                time.perf_counter() - started
+            )
+
+
+class TimedQueuePool(TimedPoolMixin, QueuePool):
+    metrics_label = "sync"
+
+
+class TimedAsyncQueuePool(TimedPoolMixin, AsyncAdaptedQueuePool):
+    metrics_label = "async"
+
+
+def get_async_database_url(url: str) -> str:
+    """Return DATABASE_URL rewritten for the asyncpg driver."""
+    url = make_url(url)
+    query = dict(url.query)
+    # asyncpg takes `ssl` rather than libpq's `sslmode`
+    if "sslmode" in query:
+        query["ssl"] = query.pop("sslmode")
+    return url.set(drivername="postgresql+asyncpg", query=query).render_as_string(
+        hide_password=False
+    )
+
+
+# Sync engine, used by Alembic and batch jobs
+engine = create_engine(DATABASE_URL, poolclass=TimedQueuePool, **POOL_OPTIONS)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine, used by request handlers
+async_engine = create_async_engine(
+    get_async_database_url(DATABASE_URL), poolclass=TimedAsyncQueuePool, **POOL_OPTIONS
+)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False, class_=AsyncSession
+)
+
 Base = declarative_base()
 
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """
+    Yield a request-scoped AsyncSession that does not block the event loop.
+    A pool connection is only checked out once the handler runs a statement.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    """Close pooled async connections. Called from the app lifespan on shutdown."""
+    await async_engine.dispose()
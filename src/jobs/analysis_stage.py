@@ -0,0 +1,100 @@
+import asyncio
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+
+from src.database.config import SessionLocal
+from src.jobs.feedback_indexer import IndexingStage
+from src.models.topic import Topic
+from src.services.analysis_memo import AnalysisMemo, text_hash
+from src.services.analysis_service import (
+    AnalysisResult,
+    FeedbackClassifier,
+    TopicLabel,
+)
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def load_active_topics() -> List[TopicLabel]:
+    """Return the active topic labels the classifier may assign."""
+    with SessionLocal() as session:
+        rows = session.execute(
+            select(Topic.label, Topic.description)
+            .where(Topic.is_active.is_(True))
+            .order_by(Topic.created_at)
+        ).all()
+    return [TopicLabel(label=row.label, description=row.description) for row in rows]
+
+
+class AnalysisStage(IndexingStage):
+    """
+    Adds `sentiment` and `topics` to each document before it is indexed.
+
+    Texts are deduplicated by normalized hash within each batch, and with a
+    memo, across runs: only texts never seen under the current topic set
+    reach the classifier. Texts with no words to hash are always classified.
+    """
+
+    def __init__(
+        self,
+        classifier: FeedbackClassifier,
+        topics: Optional[List[TopicLabel]] = None,
+        memo: Optional[AnalysisMemo] = None,
+    ):
+        self.classifier = classifier
+        self.topics = load_active_topics() if topics is None else topics
+        self.memo = memo
+        # One loop for the whole run so async clients keep their connections
+        self._loop = asyncio.new_event_loop()
+        self.counters = {"documents": 0, "memo_hits": 0, "classified": 0}
+        logger.info(
+            f"Analysis stage using {type(classifier).__name__} "
+            f"with {len(self.topics)} topics"
+        )
+
+    def enrich(self, rows: List[dict], docs: List[dict]) -> None:
+        texts = [row["feedback_text"] or "" for row in rows]
+        hashes = [text_hash(text) for text in texts]
+
+        results: Dict[str, AnalysisResult] = {}
+        if self.memo is not None:
+            results = self.memo.lookup(key for key in hashes if key is not None)
+        hits = len(results)
+
+        # First text for every hash that still needs classifying; texts
+        # without a hash are classified one by one and never memoized
+        pending: Dict[str, str] = {}
+        unhashed: List[int] = []
+        for position, (key, text) in enumerate(zip(hashes, texts)):
+            if key is None:
+                unhashed.append(position)
+            elif key not in results and key not in pending:
+                pending[key] = text
+
+        row_results: Dict[int, AnalysisResult] = {}
+        if pending or unhashed:
+            classified = self._loop.run_until_complete(
+                self.classifier.classify(
+                    list(pending.values()) + [texts[i] for i in unhashed],
+                    self.topics,
+                )
+            )
+            new_results = dict(zip(pending.keys(), classified))
+            row_results = dict(zip(unhashed, classified[len(pending) :]))
+            if self.memo is not None:
+                self.memo.store(new_results)
+            results.update(new_results)
+
+        self.counters["documents"] += len(hashes)
+        self.counters["memo_hits"] += hits
+        self.counters["classified"] += len(pending) + len(unhashed)
+
+        for position, (doc, key) in enumerate(zip(docs, hashes)):
+            result = row_results[position] if key is None else results[key]
+            doc["sentiment"] = result.sentiment
+            doc["topics"] = list(result.topics)
+
+    def close(self) -> None:
+        self._loop.close()
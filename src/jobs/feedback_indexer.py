@@ -0,0 +1,406 @@
+"""
+Incremental feedbacks -> OpenSearch indexing job.
+
+Reads `feedbacks` in primary-key order starting after `Job.last_processed_id`,
+builds documents matching `opensearch/feedback-analysis.mapping.json` and
+writes them with parallel bulk requests. `last_processed_id` is advanced only
+after every document of a batch has been acknowledged, so a crashed run
+resumes at the first unacknowledged batch. Documents are indexed with the
+feedback id as `_id`, so replaying that batch overwrites rather than
+duplicates. With FEEDBACK_INDEX_PERIOD set, each document goes to the rollover
+index for its `created_at` (see src/services/index_manager.py).
+
+Usage:
+    python -m src.jobs.feedback_indexer --batch-size 5000 --threads 4
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from opensearchpy import helpers
+from sqlalchemy import func, select, text, update
+
+from config import get_config
+from src.database.config import SessionLocal, engine
+from src.models.feedback import Feedback
+from src.models.job import Job, JobStatus
+from src.services.index_manager import (
+    RolloverIndex,
+    alias_indices,
+    closed_period_indices,
+    ensure_period_index,
+    ensure_write_index,
+    put_index_template,
+)
+from src.services.search_service import SearchService
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+JOB_NAME = "feedback-indexer"
+
+
+@contextmanager
+def job_lock(job_name: str):
+    """
+    Hold a Postgres advisory lock for `job_name`. Yields False, without
+    waiting, if another process already holds it.
+
+    The lock is session-level, so its connection runs in autocommit and is not
+    left idle in a transaction for the whole run.
+    """
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as lock_conn:
+        locked = lock_conn.execute(
+            text("SELECT pg_try_advisory_lock(hashtext(:name))"), {"name": job_name}
+        ).scalar()
+        try:
+            yield locked
+        finally:
+            if locked:
+                lock_conn.execute(
+                    text("SELECT pg_advisory_unlock(hashtext(:name))"),
+                    {"name": job_name},
+                )
+
+
+class IndexingStage:
+    """
+    Extension point for work that runs alongside indexing.
+
+    `enrich` runs before a batch is sent to OpenSearch and may add fields to
+    the documents. `on_checkpoint` runs inside the transaction that advances
+    `last_processed_id`, so database writes made there commit exactly once
+    per batch. `after_checkpoint` runs once that transaction has committed,
+    for state kept outside the database, and `close` runs when the job ends.
+    """
+
+    def enrich(self, rows: List[dict], docs: List[dict]) -> None:
+        return None
+
+    def on_checkpoint(self, session, rows: List[dict], docs: List[dict]) -> None:
+        return None
+
+    def after_checkpoint(self, rows: List[dict], docs: List[dict]) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+class BulkIndexError(RuntimeError):
+    """Raised when OpenSearch rejects documents from a batch."""
+
+
+class FeedbackIndexer:
+    def __init__(
+        self,
+        batch_size: int = 5000,
+        chunk_size: int = 1000,
+        thread_count: int = 4,
+        stages: Optional[List[IndexingStage]] = None,
+        client=None,
+        index: Optional[str] = None,
+        job_name: str = JOB_NAME,
+        index_period: str = "none",
+        bulk_load: bool = False,
+        force_merge: bool = False,
+    ):
+        search_service = SearchService() if client is None or index is None else None
+        self.client = client or search_service.opensearch_client
+        self.index = index or search_service.feedback_analysis_index
+        # With a rollover period, `index` is the alias and documents go to the
+        # index for their created_at
+        self.rollover_index = RolloverIndex(self.index, index_period)
+        self._period_indices: List[str] = []
+        self.bulk_load = bulk_load
+        # Compact closed periods after a bulk load; never the write index
+        self.force_merge = force_merge
+        # Settings to restore per index while bulk load settings are applied
+        self._bulk_restore: Optional[Dict[str, dict]] = None
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.thread_count = thread_count
+        self.stages = stages or []
+        self.job_name = job_name
+
+    def build_document(self, row: dict) -> dict:
+        """Build a feedback-analysis document from a feedbacks row."""
+        return {
+            "feedback_id": str(row["id"]),
+            "product_name": row["product_name"],
+            "feedback_text": row["feedback_text"],
+            "media_urls": row["media_urls"] or [],
+            "created_at": (
+                row["created_at"].isoformat() if row["created_at"] else None
+            ),
+        }
+
+    def _fetch_batch(self, after_id: int) -> List[dict]:
+        """Read the next batch of feedbacks in keyset order."""
+        with SessionLocal() as session:
+            result = session.execute(
+                select(
+                    Feedback.id,
+                    Feedback.product_name,
+                    Feedback.feedback_text,
+                    Feedback.media_urls,
+                    Feedback.created_at,
+                )
+                .where(Feedback.id > after_id)
+                .order_by(Feedback.id)
+                .limit(self.batch_size)
+            )
+            return [dict(row) for row in result.mappings()]
+
+    def _target_index(self, doc: dict) -> str:
+        if not self.rollover_index.rolls_over:
+            return self.index
+        created_at = doc.get("created_at")
+        return self.rollover_index.resolve(
+            self._period_indices,
+            datetime.fromisoformat(created_at) if created_at else None,
+        )
+
+    def _prepare_indices(self) -> None:
+        """Apply the index template and roll the write alias to this period."""
+        put_index_template(self.client, self.rollover_index)
+        ensure_write_index(self.client, self.rollover_index)
+        # Periods may be served by reindexed copies (src/jobs/reindex.py)
+        self._period_indices = alias_indices(
+            self.client, self.rollover_index.read_alias
+        )
+
+    def _ensure_period_index(self, index: str) -> None:
+        """Create a period index, relaxed like the others during a bulk load."""
+        if self._bulk_restore is None:
+            ensure_period_index(self.client, self.rollover_index, index)
+            return
+        from src.jobs.index_bootstrap import BULK_LOAD_SETTINGS, index_settings
+
+        if ensure_period_index(
+            self.client, self.rollover_index, index, settings=BULK_LOAD_SETTINGS
+        ):
+            self._bulk_restore[index] = index_settings(get_config(), creating=False)
+
+    def _index_batch(self, docs: List[dict]) -> None:
+        """Bulk index a batch and raise unless every document was acknowledged."""
+        targets = [self._target_index(doc) for doc in docs]
+        if self.rollover_index.rolls_over:
+            # Create indices for periods not seen yet, inside the read alias
+            known = set(self._period_indices) | {self.rollover_index.write_alias}
+            for index in sorted(set(targets) - known):
+                self._ensure_period_index(index)
+                self._period_indices.append(index)
+        actions = (
+            {"_index": target, "_id": doc["feedback_id"], "_source": doc}
+            for target, doc in zip(targets, docs)
+        )
+        failed = []
+        for ok, info in helpers.parallel_bulk(
+            self.client,
+            actions,
+            thread_count=self.thread_count,
+            chunk_size=self.chunk_size,
+            raise_on_error=False,
+        ):
+            if not ok:
+                failed.append(info)
+        if failed:
+            raise BulkIndexError(
+                f"{len(failed)} of {len(docs)} documents failed, first: {failed[0]}"
+            )
+
+    def _get_or_create_job(self, session) -> tuple:
+        """Return (job id, last processed id), creating the job row on first run."""
+        row = session.execute(
+            select(Job.id, Job.last_processed_id)
+            .where(Job.job_name == self.job_name)
+            .order_by(Job.id)
+            .limit(1)
+        ).first()
+        if row is None:
+            job = Job(job_name=self.job_name, last_processed_id=0)
+            session.add(job)
+            session.commit()
+            return job.id, 0
+        return row.id, row.last_processed_id or 0
+
+    def _set_status(self, session, job_id: int, status: JobStatus) -> None:
+        session.execute(
+            update(Job)
+            .where(Job.id == job_id)
+            .values(status=status, updated_at=func.now())
+        )
+        session.commit()
+
+    def _checkpoint(
+        self, session, job_id: int, rows: List[dict], docs: List[dict]
+    ) -> None:
+        """Advance last_processed_id and run stage writes in one transaction."""
+        try:
+            for stage in self.stages:
+                stage.on_checkpoint(session, rows, docs)
+            session.execute(
+                update(Job)
+                .where(Job.id == job_id)
+                .values(last_processed_id=rows[-1]["id"], updated_at=func.now())
+            )
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        for stage in self.stages:
+            stage.after_checkpoint(rows, docs)
+
+    def run(self, max_batches: Optional[int] = None) -> int:
+        """Index every feedback after the checkpoint. Returns documents indexed."""
+        # One indexer per job name; a second run exits instead of racing
+        with job_lock(self.job_name) as locked:
+            if not locked:
+                logger.warning(f"Job {self.job_name} is already running, skipping")
+                return 0
+            if not self.bulk_load:
+                return self._run(max_batches)
+            from src.jobs.index_bootstrap import bulk_load_settings, force_merge
+
+            if self.rollover_index.rolls_over:
+                self._prepare_indices()
+            with bulk_load_settings(self.client, self.index) as restore:
+                self._bulk_restore = restore
+                try:
+                    indexed = self._run(max_batches)
+                finally:
+                    self._bulk_restore = None
+            if self.force_merge:
+                force_merge(
+                    self.client,
+                    closed_period_indices(self.client, self.rollover_index),
+                )
+            return indexed
+
+    def _run(self, max_batches: Optional[int]) -> int:
+        indexed = 0
+        batches = 0
+        status = JobStatus.COMPLETED
+        started = time.monotonic()
+        with SessionLocal() as session, ThreadPoolExecutor(max_workers=1) as prefetch:
+            job_id, last_id = self._get_or_create_job(session)
+            if self.rollover_index.rolls_over:
+                self._prepare_indices()
+            self._set_status(session, job_id, JobStatus.PROCESSING)
+            logger.info(f"Starting {self.job_name} after feedback id {last_id}")
+            try:
+                pending = prefetch.submit(self._fetch_batch, last_id)
+                while True:
+                    rows = pending.result()
+                    if not rows:
+                        break
+                    # Read the next batch while this one is being indexed
+                    batches += 1
+                    more = max_batches is None or batches < max_batches
+                    if more:
+                        pending = prefetch.submit(self._fetch_batch, rows[-1]["id"])
+
+                    docs = [self.build_document(row) for row in rows]
+                    for stage in self.stages:
+                        stage.enrich(rows, docs)
+                    self._index_batch(docs)
+                    self._checkpoint(session, job_id, rows, docs)
+
+                    indexed += len(docs)
+                    elapsed = time.monotonic() - started
+                    logger.info(
+                        f"Indexed {indexed} documents up to feedback id "
+                        f"{rows[-1]['id']} ({indexed / max(elapsed, 1e-6):.0f} docs/s)"
+                    )
+                    if not more:
+                        # A full batch means there may be rows left for the next run
+                        if len(rows) == self.batch_size:
+                            status = JobStatus.PARTIAL
+                        break
+            except Exception as e:
+                logger.error(f"Job {self.job_name} failed: {str(e)}")
+                session.rollback()
+                self._set_status(session, job_id, JobStatus.FAILED)
+                raise
+            finally:
+                for stage in self.stages:
+                    stage.close()
+
+            self._set_status(session, job_id, status)
+        for stage in self.stages:
+            counters = getattr(stage, "counters", None)
+            if counters:
+                logger.info(f"{type(stage).__name__}: {counters}")
+        return indexed
+
+
+def build_stages() -> List[IndexingStage]:
+    """Return the stages every indexer run should apply."""
+    from src.jobs.analysis_stage import AnalysisStage, load_active_topics
+    from src.jobs.rollup_stage import RollupStage
+    from src.jobs.word_sketch_stage import WordSketchStage
+    from src.jobs.wordcount_stage import WordCountStage
+    from src.services.analysis_memo import AnalysisMemo, topic_set_version
+    from src.services.analysis_service import create_classifier
+
+    config = get_config()
+    classifier = create_classifier(config)
+    topics = load_active_topics()
+
+    memo = None
+    if config["ANALYSIS_CACHE_ENABLED"]:
+        memo = AnalysisMemo(SessionLocal, topic_set_version(topics, classifier.name))
+        purged = memo.purge_other_versions()
+        evicted = memo.evict_older_than(config["ANALYSIS_CACHE_MAX_AGE_DAYS"])
+        logger.info(
+            f"Analysis cache ready: {purged} stale-topic and {evicted} expired "
+            "results removed"
+        )
+
+    return [
+        AnalysisStage(classifier, topics=topics, memo=memo),
+        WordCountStage(),
+        RollupStage(),
+        WordSketchStage.from_config(config),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index feedbacks into OpenSearch")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--max-batches", type=int, default=None)
+    parser.add_argument(
+        "--bulk-load",
+        action="store_true",
+        help="Disable refresh and replicas while indexing (backfills)",
+    )
+    parser.add_argument(
+        "--force-merge",
+        action="store_true",
+        help="After a bulk load, merge closed period indices to one segment",
+    )
+    args = parser.parse_args()
+    if args.force_merge and not args.bulk_load:
+        parser.error("--force-merge requires --bulk-load")
+
+    indexer = FeedbackIndexer(
+        batch_size=args.batch_size,
+        chunk_size=args.chunk_size,
+        thread_count=args.threads,
+        stages=build_stages(),
+        index_period=get_config()["FEEDBACK_INDEX_PERIOD"],
+        bulk_load=args.bulk_load,
+        force_merge=args.force_merge,
+    )
+    indexer.run(max_batches=args.max_batches)
+
+
+if __name__ == "__main__":
+    main()
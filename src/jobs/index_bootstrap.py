@@ -0,0 +1,197 @@
+"""
+Create or update OpenSearch indices and templates from `opensearch/*.mapping.json`.
+
+This is to the indices what `run_migrations()` is to the SQL schema: it runs
+before the service starts (and on application startup with
+OPENSEARCH_BOOTSTRAP_ON_STARTUP=true) and can be run by hand. Missing indices
+are created with the configured shard, replica and refresh settings; existing
+ones get new mapping fields. Their replica and refresh settings are only
+overwritten with --apply-settings, so a running bulk load or manual tuning is
+left alone. Changes OpenSearch cannot apply in place, such as a new type for
+an existing field, are reported as errors and need a reindex.
+
+`bulk_load_settings()` relaxes refresh and replicas around large writes and
+restores them afterwards; `force_merge()` compacts indices no longer written.
+
+Usage:
+    python -m src.jobs.index_bootstrap
+    python -m src.jobs.index_bootstrap --index feedback-analysis
+    python -m src.jobs.index_bootstrap --apply-settings
+"""
+
+import argparse
+from contextlib import contextmanager
+from typing import Dict, Iterable, Optional
+
+from config import get_config
+from src.services.index_manager import (
+    RolloverIndex,
+    ensure_write_index,
+    load_mapping,
+    put_index_template,
+)
+from src.services.search_service import SearchService
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Force-merges rewrite every segment, so allow far more than a search takes
+FORCE_MERGE_TIMEOUT = 3600
+
+# Applied for the duration of a bulk load
+BULK_LOAD_SETTINGS = {"refresh_interval": "-1", "number_of_replicas": 0}
+
+
+def index_settings(config: dict, creating: bool = True) -> dict:
+    """Return index settings from config; shard count only applies at creation."""
+    settings = {
+        "number_of_replicas": config["OPENSEARCH_REPLICAS"],
+        "refresh_interval": config["OPENSEARCH_REFRESH_INTERVAL"],
+    }
+    if creating:
+        settings["number_of_shards"] = config["OPENSEARCH_SHARDS"]
+    return settings
+
+
+def managed_indices(config: dict) -> Dict[str, RolloverIndex]:
+    """Index families the app reads, keyed by mapping file name."""
+    feedback_index = SearchService.feedback_analysis_index
+    wordcount_index = SearchService.wordcount_analysis_index
+    return {
+        feedback_index: RolloverIndex(feedback_index, config["FEEDBACK_INDEX_PERIOD"]),
+        wordcount_index: RolloverIndex(wordcount_index),
+    }
+
+
+def apply_index(
+    client, rollover_index: RolloverIndex, config: dict, apply_settings: bool = False
+) -> None:
+    """
+    Create or update one index family from its mapping file. Existing indices
+    only get the configured dynamic settings with `apply_settings`.
+    """
+    base = rollover_index.base
+    if rollover_index.rolls_over:
+        if client.indices.exists(index=base) and not client.indices.exists_alias(
+            name=base
+        ):
+            raise RuntimeError(
+                f"{base} is a concrete index; reindex it behind the {base} alias "
+                "before enabling rollover"
+            )
+        put_index_template(client, rollover_index, index_settings(config))
+        ensure_write_index(client, rollover_index)
+        # Existing period indices pick up mapping changes as well
+        client.indices.put_mapping(index=base, body=load_mapping(base)["mappings"])
+        if apply_settings:
+            client.indices.put_settings(
+                index=base, body={"index": index_settings(config, creating=False)}
+            )
+        logger.info(f"Index template and alias for {base} are up to date")
+        return
+
+    if not client.indices.exists(index=base):
+        client.indices.create(
+            index=base,
+            body={**load_mapping(base), "settings": index_settings(config)},
+        )
+        logger.info(f"Created index {base}")
+        return
+
+    client.indices.put_mapping(index=base, body=load_mapping(base)["mappings"])
+    if apply_settings:
+        client.indices.put_settings(
+            index=base, body={"index": index_settings(config, creating=False)}
+        )
+    logger.info(f"Index {base} is up to date")
+
+
+def bootstrap_indices(
+    client=None,
+    only: Optional[str] = None,
+    config: Optional[dict] = None,
+    apply_settings: bool = False,
+) -> None:
+    """Apply every mapping file, or just `only`. Failures are raised."""
+    config = config or get_config()
+    client = client or SearchService().opensearch_client
+    for name, rollover_index in managed_indices(config).items():
+        if only is None or name == only:
+            apply_index(client, rollover_index, config, apply_settings)
+
+
+def run_index_bootstrap(config: Optional[dict] = None) -> None:
+    """Apply the OpenSearch mappings on application startup."""
+    try:
+        bootstrap_indices(config=config)
+        logger.info("OpenSearch indices bootstrapped successfully")
+    except Exception as e:
+        logger.error(f"Failed to bootstrap OpenSearch indices: {e}")
+
+
+@contextmanager
+def bulk_load_settings(client, index: str):
+    """
+    Turn off refresh and replicas on `index` (an index, alias or pattern) for
+    the duration of a bulk load, then restore each index's previous values
+    and refresh.
+
+    Yields the settings to restore per index. Indices created during the load
+    should be created with BULK_LOAD_SETTINGS and added to it, with the
+    settings they would otherwise have had (see index_settings()).
+
+    Documents written inside the block are not searchable until it exits.
+    """
+    current = client.indices.get_settings(
+        index=index, name="index.refresh_interval,index.number_of_replicas"
+    )
+    restore: Dict[str, dict] = {}
+    for name, response in current.items():
+        settings = response.get("settings", {}).get("index", {})
+        restore[name] = {
+            # null resets a setting that was left at its default
+            "refresh_interval": settings.get("refresh_interval"),
+            "number_of_replicas": settings.get("number_of_replicas"),
+        }
+    client.indices.put_settings(index=index, body={"index": BULK_LOAD_SETTINGS})
+    logger.info(f"Bulk load settings applied to {index}")
+    try:
+        yield restore
+    finally:
+        for name, settings in restore.items():
+            client.indices.put_settings(index=name, body={"index": settings})
+        client.indices.refresh(index=index)
+        logger.info(f"Restored refresh and replica settings on {index}")
+
+
+def force_merge(client, indices: Iterable[str]) -> None:
+    """
+    Merge each index down to one segment. Only for indices that no longer
+    receive writes (see closed_period_indices()); merging one that does
+    leaves a huge segment that every later write has to merge into again.
+    """
+    for index in indices:
+        client.indices.forcemerge(
+            index=index, max_num_segments=1, request_timeout=FORCE_MERGE_TIMEOUT
+        )
+        logger.info(f"Force-merged {index}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply OpenSearch index mappings")
+    parser.add_argument(
+        "--index",
+        default=None,
+        help="Only apply this mapping (e.g. feedback-analysis)",
+    )
+    parser.add_argument(
+        "--apply-settings",
+        action="store_true",
+        help="Also reset replicas and refresh_interval on existing indices",
+    )
+    args = parser.parse_args()
+    bootstrap_indices(only=args.index, apply_settings=args.apply_settings)
+
+
+if __name__ == "__main__":
+    main()
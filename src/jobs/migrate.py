@@ -0,0 +1,124 @@
+"""
+Bring the database schema to the Alembic head, once per deployment.
+
+Run it as a pre-start step (systemd ExecStartPre) so workers boot against an
+up-to-date schema without migrating themselves:
+
+    python -m src.jobs.migrate
+
+When RUN_MIGRATIONS_ON_STARTUP is left on, app.py calls `run_migrations()`
+in every worker instead. The common case, a schema already at head, is a
+single query. Otherwise the upgrade runs under a Postgres advisory lock, so
+exactly one process migrates while the others wait for it and then find the
+schema at head.
+"""
+
+import argparse
+import sys
+import time
+from contextlib import contextmanager
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+
+from src.database.config import engine
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+ALEMBIC_INI = "alembic.ini"
+LOCK_NAME = "alembic-migrations"
+
+
+def is_at_head(connection, alembic_cfg: Config) -> bool:
+    """Return True if the database revision matches every script head."""
+    heads = set(ScriptDirectory.from_config(alembic_cfg).get_heads())
+    current = set(MigrationContext.configure(connection).get_current_heads())
+    return current == heads
+
+
+@contextmanager
+def migration_lock(connection, wait: bool = True):
+    """
+    Hold a Postgres advisory lock while migrating. Yields False if `wait` is
+    off and another process holds it. Other databases are not locked.
+    """
+    if connection.dialect.name != "postgresql":
+        yield True
+        return
+    if wait:
+        connection.execute(
+            text("SELECT pg_advisory_lock(hashtext(:name))"), {"name": LOCK_NAME}
+        )
+        locked = True
+    else:
+        locked = connection.execute(
+            text("SELECT pg_try_advisory_lock(hashtext(:name))"), {"name": LOCK_NAME}
+        ).scalar()
+    try:
+        yield locked
+    finally:
+        if locked:
+            connection.execute(
+                text("SELECT pg_advisory_unlock(hashtext(:name))"), {"name": LOCK_NAME}
+            )
+
+
+def migrate(wait: bool = True) -> bool:
+    """
+    Upgrade to head unless already there. Returns True if this process ran
+    the upgrade. Failures are raised.
+    """
+    started = time.perf_counter()
+    alembic_cfg = Config(ALEMBIC_INI)
+    with engine.connect() as connection:
+        if is_at_head(connection, alembic_cfg):
+            logger.info("Database schema is already at head")
+            return False
+
+        with migration_lock(connection, wait) as locked:
+            if not locked:
+                logger.info("Another process is migrating, skipping")
+                return False
+            # Whoever held the lock before us may have finished the job
+            if is_at_head(connection, alembic_cfg):
+                logger.info("Database schema was migrated by another process")
+                return False
+            # Keep no transaction open on alembic_version during the upgrade
+            connection.rollback()
+            command.upgrade(alembic_cfg, "head")
+
+    logger.info(
+        f"Database migrations completed in {time.perf_counter() - started:.1f}s"
+    )
+    return True
+
+
+def run_migrations():
+    """Run database migrations on application startup."""
+    try:
+        migrate()
+    except Exception as e:
+        logger.error(f"Failed to run migrations: {e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Upgrade the database to head")
+    parser.add_argument(
+        "--no-wait",
+        action="store_true",
+        help="Exit instead of waiting if another process is migrating",
+    )
+    args = parser.parse_args()
+    try:
+        migrate(wait=not args.no_wait)
+    except Exception as e:
+        logger.error(f"Failed to run migrations: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""
+Zero-downtime reindex for mapping changes.
+
+Copies every index behind `feedback-analysis` (or the concrete index of that
+name) into a new versioned index built from the current mapping file, using
+sliced, throttled `_reindex` tasks. Once document counts match, the read and
+write aliases are moved to the new indices in a single atomic alias update,
+so readers switch over without ever seeing an empty index. The indexer's job
+lock is held throughout so no documents are written to the old indices
+mid-copy; the indexer catches up on its next run.
+
+Usage:
+    python -m src.jobs.reindex --requests-per-second 2000 --slices auto
+    python -m src.jobs.reindex --delete-old
+"""
+
+import argparse
+import re
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from config import get_config
+from src.jobs.feedback_indexer import JOB_NAME, job_lock
+from src.jobs.index_bootstrap import index_settings
+from src.services.index_manager import RolloverIndex, alias_indices, load_mapping
+from src.services.search_service import SearchService
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds between _reindex task status checks
+TASK_POLL_SECONDS = 5
+
+VERSION_SUFFIX = re.compile(r"-v\d+$")
+
+
+class ReindexError(RuntimeError):
+    """Raised when a copy fails or its document count does not match."""
+
+
+def versioned_name(index: str, version: str) -> str:
+    """Return `index` with its `-v<version>` suffix replaced by `version`."""
+    return f"{VERSION_SUFFIX.sub('', index)}-v{version}"
+
+
+class Reindexer:
+    def __init__(
+        self,
+        rollover_index: RolloverIndex,
+        client=None,
+        requests_per_second: float = -1,
+        slices="auto",
+        config: Optional[dict] = None,
+    ):
+        self.rollover_index = rollover_index
+        self.client = client or SearchService().opensearch_client
+        self.requests_per_second = requests_per_second
+        self.slices = slices
+        self.config = config or get_config()
+
+    def _source_indices(self) -> List[str]:
+        """Return the concrete indices currently served under the read alias."""
+        alias = self.rollover_index.read_alias
+        indices = alias_indices(self.client, alias)
+        if not indices and self.client.indices.exists(index=alias):
+            return [alias]
+        return indices
+
+    def _create_target(self, index: str) -> None:
+        # Replicas and refresh are restored after the copy
+        settings = {
+            **index_settings(self.config),
+            "number_of_replicas": 0,
+            "refresh_interval": "-1",
+        }
+        self.client.indices.create(
+            index=index,
+            body={**load_mapping(self.rollover_index.base), "settings": settings},
+        )
+
+    def _copy(self, source: str, target: str) -> dict:
+        """Run a sliced, throttled _reindex task and wait for it to finish."""
+        task = self.client.reindex(
+            body={"source": {"index": source}, "dest": {"index": target}},
+            slices=self.slices,
+            requests_per_second=self.requests_per_second,
+            wait_for_completion=False,
+        )
+        task_id = task["task"]
+        logger.info(f"Copying {source} -> {target} (task {task_id})")
+        while True:
+            status = self.client.tasks.get(task_id=task_id)
+            if status.get("completed"):
+                break
+            progress = status.get("task", {}).get("status", {})
+            logger.info(
+                f"{source}: {progress.get('created', 0)} of "
+                f"{progress.get('total', 0)} documents copied"
+            )
+            time.sleep(TASK_POLL_SECONDS)
+
+        if "error" in status:
+            raise ReindexError(f"Reindex of {source} failed: {status['error']}")
+        response = status.get("response", {})
+        if response.get("failures"):
+            raise ReindexError(
+                f"Reindex of {source} had {len(response['failures'])} failures, "
+                f"first: {response['failures'][0]}"
+            )
+        return response
+
+    def _finish_target(self, index: str) -> None:
+        self.client.indices.put_settings(
+            index=index,
+            body={"index": index_settings(self.config, creating=False)},
+        )
+        self.client.indices.refresh(index=index)
+
+    def _verify(self, pairs: Dict[str, str]) -> None:
+        for source, target in pairs.items():
+            expected = self.client.count(index=source)["count"]
+            copied = self.client.count(index=target)["count"]
+            if expected != copied:
+                raise ReindexError(
+                    f"{target} has {copied} documents, {source} has {expected}"
+                )
+            logger.info(f"Verified {target}: {copied} documents")
+
+    def _swap_actions(self, pairs: Dict[str, str]) -> List[dict]:
+        read_alias = self.rollover_index.read_alias
+        write_alias = self.rollover_index.write_alias
+        write_sources = set()
+        if write_alias != read_alias:
+            write_sources = set(alias_indices(self.client, write_alias))
+
+        actions = []
+        for source, target in pairs.items():
+            actions.append({"add": {"index": target, "alias": read_alias}})
+            if source == read_alias:
+                # An alias cannot share a name with an index, so the original
+                # concrete index is dropped in the same atomic update
+                actions.append({"remove_index": {"index": source}})
+                continue
+            actions.append({"remove": {"index": source, "alias": read_alias}})
+            if source in write_sources:
+                actions.append({"remove": {"index": source, "alias": write_alias}})
+                actions.append(
+                    {
+                        "add": {
+                            "index": target,
+                            "alias": write_alias,
+                            "is_write_index": True,
+                        }
+                    }
+                )
+        return actions
+
+    def run(self, delete_old: bool = False) -> Dict[str, str]:
+        """Reindex and swap. Returns {old index: new index}."""
+        with job_lock(JOB_NAME) as locked:
+            if not locked:
+                raise ReindexError(f"Job {JOB_NAME} is running, try again later")
+            return self._run(delete_old)
+
+    def _run(self, delete_old: bool) -> Dict[str, str]:
+        sources = self._source_indices()
+        if not sources:
+            logger.info(f"Nothing to reindex for {self.rollover_index.read_alias}")
+            return {}
+
+        version = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+        pairs = {source: versioned_name(source, version) for source in sources}
+        for target in pairs.values():
+            if target in pairs or self.client.indices.exists(index=target):
+                raise ReindexError(f"{target} already exists, retry in a second")
+        try:
+            for source, target in pairs.items():
+                self._create_target(target)
+                self._copy(source, target)
+                self._finish_target(target)
+            self._verify(pairs)
+        except Exception:
+            logger.error("Reindex failed, removing the new indices")
+            self.client.indices.delete(
+                index=",".join(pairs.values()), ignore_unavailable=True
+            )
+            raise
+
+        self.client.indices.update_aliases(body={"actions": self._swap_actions(pairs)})
+        logger.info(
+            f"{self.rollover_index.read_alias} now serves {list(pairs.values())}"
+        )
+
+        old = [source for source in pairs if source != self.rollover_index.read_alias]
+        if delete_old and old:
+            # Let API workers' cached alias lookups expire before dropping
+            time.sleep(self.config["INDEX_ALIAS_CACHE_SECONDS"])
+            self.client.indices.delete(index=",".join(old))
+            logger.info(f"Deleted old indices {old}")
+        return pairs
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rebuild feedback-analysis from its mapping file and swap aliases"
+    )
+    parser.add_argument("--requests-per-second", type=float, default=None)
+    parser.add_argument("--slices", default="auto")
+    parser.add_argument(
+        "--delete-old",
+        action="store_true",
+        help="Delete the old indices after the swap",
+    )
+    args = parser.parse_args()
+
+    config = get_config()
+    requests_per_second = args.requests_per_second
+    if requests_per_second is None:
+        requests_per_second = config["REINDEX_REQUESTS_PER_SECOND"]
+    reindexer = Reindexer(
+        RolloverIndex(
+            SearchService.feedback_analysis_index, config["FEEDBACK_INDEX_PERIOD"]
+        ),
+        requests_per_second=requests_per_second,
+        slices=args.slices,
+        config=config,
+    )
+    reindexer.run(delete_old=args.delete_old)
+
+
+if __name__ == "__main__":
+    main()
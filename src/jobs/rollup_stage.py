@@ -0,0 +1,15 @@
+from typing import List
+
+from src.jobs.feedback_indexer import IndexingStage
+from src.services.rollup_store import apply_rollups, count_rollups
+
+
+class RollupStage(IndexingStage):
+    """
+    Adds each batch's hourly and daily sentiment/topic counts to
+    `feedback_rollups` in the same transaction as the indexer checkpoint.
+    Must run after AnalysisStage, which fills `sentiment` and `topics`.
+    """
+
+    def on_checkpoint(self, session, rows: List[dict], docs: List[dict]) -> None:
+        apply_rollups(session, count_rollups(rows, docs))
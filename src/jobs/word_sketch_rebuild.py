@@ -0,0 +1,114 @@
+"""
+Rebuild or merge heavy-hitters sketch snapshots.
+
+`rebuild` recounts every feedback the indexer has checkpointed into a fresh
+sketch and swaps it in with an atomic rename, holding the indexer's job lock
+so no batch is missed or counted twice. `merge` combines snapshots of
+adjacent feedback id ranges, built by separate workers, into one.
+
+Usage:
+    python -m src.jobs.word_sketch_rebuild rebuild --batch-size 10000
+    python -m src.jobs.word_sketch_rebuild merge out.json.gz a.json.gz b.json.gz
+"""
+
+import argparse
+from typing import List
+
+from sqlalchemy import select
+
+from config import get_config
+from src.database.config import SessionLocal
+from src.jobs.feedback_indexer import JOB_NAME, job_lock
+from src.models.feedback import Feedback
+from src.models.job import Job
+from src.services.word_sketch import HeavyHitters
+from src.utils.logger import get_logger
+from src.utils.tokenizer import tokenize_words
+
+logger = get_logger(__name__)
+
+
+def rebuild_word_sketch(batch_size: int = 10000, job_name: str = JOB_NAME) -> int:
+    """Recount all checkpointed feedbacks. Returns the number of feedbacks read."""
+    config = get_config()
+    with job_lock(job_name) as locked:
+        if not locked:
+            logger.warning(f"Job {job_name} is running, try the rebuild later")
+            return 0
+
+        sketch = HeavyHitters(
+            width=config["WORD_SKETCH_WIDTH"],
+            depth=config["WORD_SKETCH_DEPTH"],
+            capacity=config["WORD_SKETCH_CAPACITY"],
+        )
+        with SessionLocal() as session:
+            checkpoint = session.execute(
+                select(Job.last_processed_id)
+                .where(Job.job_name == job_name)
+                .order_by(Job.id)
+                .limit(1)
+            ).scalar()
+            if not checkpoint:
+                logger.info("Nothing has been indexed yet, nothing to rebuild")
+                return 0
+
+            processed = 0
+            last_id = 0
+            while True:
+                rows = session.execute(
+                    select(Feedback.id, Feedback.feedback_text)
+                    .where(Feedback.id > last_id, Feedback.id <= checkpoint)
+                    .order_by(Feedback.id)
+                    .limit(batch_size)
+                ).all()
+                if not rows:
+                    break
+                for row in rows:
+                    sketch.update(tokenize_words(row.feedback_text or ""))
+                processed += len(rows)
+                last_id = rows[-1].id
+                logger.info(f"Sketched words for {processed} feedbacks")
+
+        sketch.through_id = checkpoint
+        sketch.save(config["WORD_SKETCH_PATH"])
+        logger.info(
+            f"Word sketch rebuilt from {processed} feedbacks "
+            f"(error bound {sketch.error_bound} over {sketch.total} words)"
+        )
+        return processed
+
+
+def merge_word_sketches(output: str, inputs: List[str]) -> HeavyHitters:
+    """
+    Merge snapshot files into `output`. All inputs must share dimensions and
+    together cover one contiguous id range; they may be given in any order.
+    """
+    sketches = sorted(
+        (HeavyHitters.load(path) for path in inputs), key=lambda s: s.from_id
+    )
+    merged = sketches[0]
+    for sketch in sketches[1:]:
+        merged.merge(sketch)
+    merged.save(output)
+    logger.info(f"Merged {len(inputs)} word sketches into {output}")
+    return merged
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild or merge word sketches")
+    commands = parser.add_subparsers(dest="command", required=True)
+    rebuild = commands.add_parser("rebuild", help="Recount from the feedbacks table")
+    rebuild.add_argument("--batch-size", type=int, default=10000)
+    merge = commands.add_parser("merge", help="Merge snapshot files")
+    merge.add_argument("output")
+    merge.add_argument("inputs", nargs="+")
+    args = parser.parse_args()
+
+    if args.command == "rebuild":
+        rebuild_word_sketch(batch_size=args.batch_size)
+    else:
+        merge_word_sketches(args.output, args.inputs)
+
+
+if __name__ == "__main__":
+    main()
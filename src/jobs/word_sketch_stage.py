@@ -0,0 +1,71 @@
+import time
+from typing import List
+
+from src.jobs.feedback_indexer import IndexingStage
+from src.services.word_sketch import HeavyHitters
+from src.utils.logger import get_logger
+from src.utils.tokenizer import tokenize_words
+
+logger = get_logger(__name__)
+
+
+class WordSketchStage(IndexingStage):
+    """
+    Feeds each committed batch into the heavy-hitters sketch behind the
+    approximate wordcount mode, snapshotting it to disk every
+    `snapshot_interval` seconds and when the job ends.
+
+    Rows at or below the snapshot's `through_id` are skipped, so batches
+    replayed after a crash are not counted twice. A crash between snapshots
+    loses at most that interval; `python -m src.jobs.word_sketch_rebuild`
+    recounts from the feedbacks table.
+    """
+
+    def __init__(self, path: str, snapshot_interval: float = 60, **sketch_options):
+        self.path = path
+        self.snapshot_interval = snapshot_interval
+        self.sketch = HeavyHitters.load_or_create(path, **sketch_options)
+        self._saved_at = time.monotonic()
+        self._dirty = False
+        self.counters = {"documents": 0, "skipped": 0, "snapshots": 0}
+
+    @classmethod
+    def from_config(cls, config: dict) -> "WordSketchStage":
+        return cls(
+            config["WORD_SKETCH_PATH"],
+            snapshot_interval=config["WORD_SKETCH_SNAPSHOT_SECONDS"],
+            width=config["WORD_SKETCH_WIDTH"],
+            depth=config["WORD_SKETCH_DEPTH"],
+            capacity=config["WORD_SKETCH_CAPACITY"],
+        )
+
+    def after_checkpoint(self, rows: List[dict], docs: List[dict]) -> None:
+        if self.sketch.is_empty:
+            # A new sketch starts where the indexer is, not at the first id
+            self.sketch.from_id = self.sketch.through_id = rows[0]["id"] - 1
+        words = []
+        for row in rows:
+            if row["id"] <= self.sketch.through_id:
+                self.counters["skipped"] += 1
+                continue
+            words.extend(tokenize_words(row.get("feedback_text") or ""))
+            self.counters["documents"] += 1
+        # One update per batch, so repeated words are hashed once
+        self.sketch.update(words)
+        self.sketch.through_id = max(self.sketch.through_id, rows[-1]["id"])
+        self._dirty = True
+        if time.monotonic() - self._saved_at >= self.snapshot_interval:
+            self.save()
+
+    def save(self) -> None:
+        self.sketch.save(self.path)
+        self._saved_at = time.monotonic()
+        self._dirty = False
+        self.counters["snapshots"] += 1
+
+    def close(self) -> None:
+        if self._dirty:
+            try:
+                self.save()
+            except Exception as e:
+                logger.error(f"Failed to save word sketch snapshot: {str(e)}")
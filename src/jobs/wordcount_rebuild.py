@@ -0,0 +1,86 @@
+"""
+Rebuild the word-frequency store from the feedbacks table.
+
+Counts every feedback the indexer has already checkpointed, then swaps the
+result in with a single commit, so readers see the old totals until the
+rebuild finishes. The indexer's job lock is held throughout so no batch is
+counted twice.
+
+Usage:
+    python -m src.jobs.wordcount_rebuild --batch-size 10000
+"""
+
+import argparse
+
+from sqlalchemy import delete, select
+
+from src.database.config import SessionLocal
+from src.jobs.feedback_indexer import JOB_NAME, job_lock
+from src.models.feedback import Feedback
+from src.models.job import Job
+from src.models.word_count import WordDailyCount, WordTotal
+from src.services.wordcount_store import apply_word_counts, count_words
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def rebuild_word_counts(batch_size: int = 10000, job_name: str = JOB_NAME) -> int:
+    """Recount all checkpointed feedbacks. Returns the number of feedbacks read."""
+    with job_lock(job_name) as locked:
+        if not locked:
+            logger.warning(f"Job {job_name} is running, try the rebuild later")
+            return 0
+
+        with SessionLocal() as session:
+            checkpoint = session.execute(
+                select(Job.last_processed_id)
+                .where(Job.job_name == job_name)
+                .order_by(Job.id)
+                .limit(1)
+            ).scalar()
+            if not checkpoint:
+                logger.info("Nothing has been indexed yet, nothing to rebuild")
+                return 0
+
+            session.execute(delete(WordDailyCount))
+            session.execute(delete(WordTotal))
+
+            processed = 0
+            last_id = 0
+            while True:
+                rows = [
+                    dict(row)
+                    for row in session.execute(
+                        select(
+                            Feedback.id,
+                            Feedback.product_name,
+                            Feedback.feedback_text,
+                            Feedback.created_at,
+                        )
+                        .where(Feedback.id > last_id, Feedback.id <= checkpoint)
+                        .order_by(Feedback.id)
+                        .limit(batch_size)
+                    ).mappings()
+                ]
+                if not rows:
+                    break
+                apply_word_counts(session, *count_words(rows))
+                processed += len(rows)
+                last_id = rows[-1]["id"]
+                logger.info(f"Counted words for {processed} feedbacks")
+
+            session.commit()
+        logger.info(f"Word counts rebuilt from {processed} feedbacks")
+        return processed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the word-frequency store")
+    parser.add_argument("--batch-size", type=int, default=10000)
+    args = parser.parse_args()
+    rebuild_word_counts(batch_size=args.batch_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+from typing import List
+
+from src.jobs.feedback_indexer import IndexingStage
+from src.services.wordcount_store import apply_word_counts, count_words
+
+
+class WordCountStage(IndexingStage):
+    """
+    Adds each batch's word counts to the word-frequency store in the same
+    transaction as the indexer checkpoint, so every feedback is counted once.
+    """
+
+    def on_checkpoint(self, session, rows: List[dict], docs: List[dict]) -> None:
+        apply_word_counts(session, *count_words(rows))
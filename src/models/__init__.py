@@ -6,5 +6,18 @@ from src.models.feedback import Feedback
 from src.models.job import Job
 from src.models.job_config import JobConfig
 from src.models.topic import Topic
+from src.models.analysis_cache import AnalysisCache
+from src.models.word_count import WordTotal, WordDailyCount
+from src.models.feedback_rollup import FeedbackRollup
 
-__all__ = ["User", "Feedback", "Job", "JobConfig", "Topic"]
+__all__ = [
+    "User",
+    "Feedback",
+    "Job",
+    "JobConfig",
+    "Topic",
+    "AnalysisCache",
+    "WordTotal",
+    "WordDailyCount",
+    "FeedbackRollup",
+]
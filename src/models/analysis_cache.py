@@ -0,0 +1,20 @@
+from sqlalchemy import Column, BigInteger, String, DateTime, JSON, UniqueConstraint
+from sqlalchemy.sql import func
+from src.database.config import Base
+
+
+class AnalysisCache(Base):
+    __tablename__ = "analysis_cache"
+    __table_args__ = (
+        UniqueConstraint("text_hash", "topic_version", name="uq_analysis_cache_key"),
+    )
+
+    id = Column(BigInteger, primary_key=True, index=True)
+    text_hash = Column(String(64), nullable=False)
+    topic_version = Column(String(64), nullable=False)
+    sentiment = Column(String, nullable=False)
+    topics = Column(JSON, nullable=False, default=lambda: [])
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_used_at = Column(
+        DateTime(timezone=True), server_default=func.now(), index=True
+    )
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, BigInteger, String, DateTime, Index
+from src.database.config import Base
+
+
+class FeedbackRollup(Base):
+    """
+    Feedback counts per time bucket and product, for trend reads.
+
+    `dimension` is "total" (value ""), "sentiment" or "topic"; `granularity`
+    is "hour" or "day", with `bucket_start` in UTC.
+    """
+
+    __tablename__ = "feedback_rollups"
+    __table_args__ = (
+        Index(
+            "ix_feedback_rollups_product",
+            "granularity",
+            "product_name",
+            "bucket_start",
+        ),
+    )
+
+    granularity = Column(String(8), primary_key=True)
+    bucket_start = Column(DateTime(timezone=True), primary_key=True)
+    product_name = Column(String, primary_key=True, default="")
+    dimension = Column(String(16), primary_key=True)
+    value = Column(String, primary_key=True, default="")
+    count = Column(BigInteger, nullable=False, default=0)
@@ -7,6 +7,8 @@ import enum
 class JobStatus(str, enum.Enum):
     PROCESSING = "processing"
     COMPLETED = "completed"
+    # Stopped by --max-batches with feedbacks still left to index
+    PARTIAL = "partial"
     FAILED = "failed"
 
 
@@ -16,6 +18,14 @@ class Job(Base):
     id = Column(BigInteger, primary_key=True, index=True)
     job_name = Column(String, index=True)
     last_processed_id = Column(BigInteger, nullable=True)
-    status = Column(Enum(JobStatus), default=JobStatus.PROCESSING)
+    # Stored as the lowercase value in a plain string column, as in the migration
+    status = Column(
+        Enum(
+            JobStatus,
+            native_enum=False,
+            values_callable=lambda statuses: [status.value for status in statuses],
+        ),
+        default=JobStatus.PROCESSING,
+    )
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -13,5 +13,9 @@ class User(Base):
         String, nullable=True
     )  # this is on purpose nullable for now
     is_active = Column(Boolean, nullable=False, default=True, server_default="true")
+    # Bump to revoke every token issued to the user so far
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # Set on every insert and update by a trigger, so raw SQL updates count too;
+    # UserStates reads the users changed since its last refresh by it
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), index=True)
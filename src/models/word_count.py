@@ -0,0 +1,23 @@
+from sqlalchemy import Column, BigInteger, String, Date, Index
+from src.database.config import Base
+
+
+class WordTotal(Base):
+    """Running all-time count per word, for O(N) top-N reads."""
+
+    __tablename__ = "word_totals"
+    __table_args__ = (Index("ix_word_totals_count", "count"),)
+
+    word = Column(String(50), primary_key=True)
+    count = Column(BigInteger, nullable=False, default=0)
+
+
+class WordDailyCount(Base):
+    """Per-day, per-product word counts, for filtered reads."""
+
+    __tablename__ = "word_daily_counts"
+
+    day = Column(Date, primary_key=True)
+    product_name = Column(String, primary_key=True, default="")
+    word = Column(String(50), primary_key=True)
+    count = Column(BigInteger, nullable=False, default=0)
@@ -1,8 +1,10 @@
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.utils.metrics import MetricsMiddleware
+
 
 def setup_routes(app, config):
-    from . import health, auth, topic, dashboard
+    from . import health, auth, topic, dashboard, metrics
 
     # Setup CORS middleware
     app.add_middleware(
@@ -12,10 +14,14 @@ def setup_routes(app, config):
         allow_methods=["*"],  # Allows all methods
         allow_headers=["*"],  # Allows all headers
     )
+    # Added last so it is outermost and times the whole request
+    app.add_middleware(MetricsMiddleware)
 
     app.include_router(health.router, prefix="/health", tags=["health"])
     app.include_router(auth.router, prefix="/auth", tags=["auth"])
     app.include_router(topic.router, prefix="/topic", tags=["topic"])
     app.include_router(dashboard.router, prefix="/dashboard", tags=["dashboard"])
+    app.include_router(metrics.router, tags=["metrics"])
 
     auth.router.config = config
+    dashboard.router.config = config
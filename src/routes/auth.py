@@ -1,14 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 from pydantic import BaseModel, EmailStr
 from datetime import timedelta
 
-from src.database.config import get_db
+from src.database.config import get_async_db
 from src.models.user import User
+from src.auth.principal_cache import Principal
 from src.auth.jwt_handler import (
     create_access_token,
-    get_current_active_user,
+    get_read_principal,
     ACCESS_TOKEN_EXPIRE_MINUTES,
 )
 
@@ -34,9 +36,12 @@ class Token(BaseModel):
 
 
 @router.post("/login", response_model=Token)
-async def login(login_data: UserLoginRequest, db: Session = Depends(get_db)):
+async def login(login_data: UserLoginRequest, db: AsyncSession = Depends(get_async_db)):
     """Login user and return JWT tokens using email."""
-    user = db.query(User).filter(User.email == login_data.email.lower()).first()
+    result = await db.execute(
+        select(User).where(User.email == login_data.email.lower())
+    )
+    user = result.scalars().first()
 
     if not user:
         raise HTTPException(
@@ -52,7 +57,8 @@ async def login(login_data: UserLoginRequest, db: Session = Depends(get_db)):
 
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": str(user.id)}, expires_delta=access_token_expires
+        data=Principal.from_user(user).to_claims(),
+        expires_delta=access_token_expires,
     )
 
     return {
@@ -64,7 +70,9 @@ async def login(login_data: UserLoginRequest, db: Session = Depends(get_db)):
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: User = Depends(get_current_active_user)):
+async def get_current_user_info(
+    current_user: Principal = Depends(get_read_principal),
+):
     """Get current authenticated user information."""
     return {
         "id": current_user.id,
@@ -1,20 +1,71 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+import asyncio
+import re
+from datetime import date, datetime, time, timezone
+from typing import Annotated, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BeforeValidator
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.utils.logger import get_logger
-from src.database.config import get_db
-from src.models.user import User
-from src.services.search_service import SearchService, get_search_service
-from src.auth.jwt_handler import get_current_active_user
+from src.database.config import AsyncSessionLocal, get_async_db
+from src.auth.principal_cache import Principal
+from src.services.search_service import (
+    AsyncSearchService,
+    CursorExpiredError,
+    SearchFilters,
+    get_async_search_service,
+    MAX_RESULT_WINDOW,
+)
+from src.services.export_service import EXPORT_FORMATS, stream_messages_export
+from src.services.wordcount_store import WORDCOUNT_TOP_N, get_top_words, utc_day
+from src.services.rollup_store import get_trends
+from src.services.word_sketch import SketchReader, get_sketch_reader
+from src.auth.jwt_handler import get_read_principal
 
 router = APIRouter()
 logger = get_logger(__name__)
 
 
+DATE_ONLY = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _end_of_day(value):
+    """Read a date-only created_to as the last instant of that UTC day."""
+    if isinstance(value, str) and DATE_ONLY.fullmatch(value):
+        return datetime.combine(date.fromisoformat(value), time.max, timezone.utc)
+    return value
+
+
+def get_search_filters(
+    sentiment: Optional[str] = None,
+    topic: Optional[str] = None,
+    product_name: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Annotated[Optional[datetime], BeforeValidator(_end_of_day)] = None,
+) -> SearchFilters:
+    """
+    Build dashboard filters from query parameters; created_* are inclusive.
+    A date-only created_to covers that whole UTC day, as the word-count store
+    (bucketed by UTC day) does, so OpenSearch and the store agree.
+    """
+    if created_from and created_to and created_from > created_to:
+        raise HTTPException(
+            status_code=400, detail="created_from must not be after created_to"
+        )
+    return SearchFilters(
+        sentiment=sentiment,
+        topic=topic,
+        product_name=product_name,
+        created_from=created_from,
+        created_to=created_to,
+    )
+
+
 @router.get("/statistics")
 async def get_dashboard_statistics(
-    db: Session = Depends(get_db),
-    search_service: SearchService = Depends(get_search_service),
-    current_user: User = Depends(get_current_active_user),
+    filters: SearchFilters = Depends(get_search_filters),
+    search_service: AsyncSearchService = Depends(get_async_search_service),
+    current_user: Principal = Depends(get_read_principal),
 ):
     """
     Get statistics including total document count from OpenSearch and active topics.
@@ -22,7 +73,7 @@ async def get_dashboard_statistics(
     """
     try:
         # Get statistics from OpenSearch
-        search_stats = search_service.get_dashboard_statistics()
+        search_stats = await search_service.get_dashboard_statistics(filters)
 
         return {
             "statistics": {
@@ -39,22 +90,135 @@ async def get_dashboard_statistics(
         raise
 
 
+# Top words are counted per day and product only
+UNSUPPORTED_WORDCOUNT_FILTERS = "top words cannot be filtered by sentiment or topic"
+
+
+def _get_wordcount_source(mode: Optional[str], filters: SearchFilters) -> Optional[str]:
+    """
+    Pick where top words are read from: "sketch", "store" or "opensearch".
+    Returns None for sentiment or topic filters, which no source supports.
+    """
+    if filters.sentiment is not None or filters.topic is not None:
+        return None
+    if filters != SearchFilters():
+        # Only the store keeps per-day, per-product counts
+        return "store"
+    mode = mode or router.config["WORDCOUNT_MODE"]
+    if mode == "approximate":
+        return "sketch"
+    if router.config["WORDCOUNT_SOURCE"] == "store":
+        return "store"
+    return "opensearch"
+
+
+async def _get_local_top_words(
+    source: str, filters: SearchFilters, sketch_reader: SketchReader
+) -> dict:
+    """
+    Read top words from the sketch snapshot or the word-count store. Only the
+    store opens a database session.
+    """
+    if source == "sketch":
+        sketch_stats = await sketch_reader.top_words(WORDCOUNT_TOP_N)
+        return {
+            "words": sketch_stats["words"],
+            "mode": "approximate",
+            "error_bound": sketch_stats["error_bound"],
+        }
+    async with AsyncSessionLocal() as db:
+        return await get_top_words(
+            db,
+            start_date=filters.created_from and utc_day(filters.created_from),
+            end_date=filters.created_to and utc_day(filters.created_to),
+            product_name=filters.product_name,
+        )
+
+
+@router.get("/overview")
+async def get_dashboard_overview(
+    page_size: int = Query(100, ge=1, le=1000),
+    mode: Optional[str] = Query(None, pattern="^(exact|approximate)$"),
+    filters: SearchFilters = Depends(get_search_filters),
+    search_service: AsyncSearchService = Depends(get_async_search_service),
+    sketch_reader: SketchReader = Depends(get_sketch_reader),
+    current_user: Principal = Depends(get_read_principal),
+):
+    """
+    Get statistics, top words and the first messages page in one call.
+    The OpenSearch parts go out as a single _msearch; a section that fails is
+    returned empty and named in `errors` instead of failing the whole page.
+    Top words cannot be filtered by sentiment or topic, so with those filters
+    `words` is empty and named in `errors` as well.
+    Returns a JSON object with all three sections and success status.
+    """
+    try:
+        source = _get_wordcount_source(mode, filters)
+        overview_task = search_service.get_dashboard_overview(
+            filters, page_size=page_size, include_wordcount=source == "opensearch"
+        )
+        if source == "opensearch":
+            overview = await overview_task
+            words = {"words": overview["words"]}
+        elif source is None:
+            overview = await overview_task
+            overview["errors"].append("words")
+            words = {"words": []}
+        else:
+            overview, words = await asyncio.gather(
+                overview_task,
+                _get_local_top_words(source, filters, sketch_reader),
+                return_exceptions=True,
+            )
+            if isinstance(overview, Exception):
+                raise overview
+            if isinstance(words, Exception):
+                logger.error(f"Error fetching overview words: {str(words)}")
+                overview["errors"].append("words")
+                words = {"words": []}
+
+        return {
+            "statistics": overview["statistics"],
+            **words,
+            "messages": overview["messages"],
+            "errors": overview["errors"],
+            "success": True,
+        }
+    except Exception as e:
+        logger.error(f"Error fetching overview: {str(e)}")
+        raise
+
+
 @router.get("/wordcount-analysis")
 async def get_wordcount_analysis(
-    db: Session = Depends(get_db),
-    search_service: SearchService = Depends(get_search_service),
-    current_user: User = Depends(get_current_active_user),
+    mode: Optional[str] = Query(None, pattern="^(exact|approximate)$"),
+    filters: SearchFilters = Depends(get_search_filters),
+    search_service: AsyncSearchService = Depends(get_async_search_service),
+    sketch_reader: SketchReader = Depends(get_sketch_reader),
+    current_user: Principal = Depends(get_read_principal),
 ):
     """
-    Get statistics including total document count from OpenSearch and active topics.
-    Returns a JSON object with statistics and success status.
+    Get the most frequent words across analyzed feedback.
+    In exact mode they come from OpenSearch or the incremental word-count store
+    depending on WORDCOUNT_SOURCE. In approximate mode they come from the
+    heavy-hitters sketch, and `error_bound` is the most any count may be
+    overstated by (with probability 1 - e^-WORD_SKETCH_DEPTH).
+    The sketch and the wordcount-analysis index are global, so product and
+    date filters are always answered exactly from the store (by UTC day).
+    Sentiment and topic filters are rejected with 400.
+    Returns a JSON object with words and success status.
     """
+    source = _get_wordcount_source(mode, filters)
+    if source is None:
+        raise HTTPException(status_code=400, detail=UNSUPPORTED_WORDCOUNT_FILTERS)
     try:
-        # Get statistics from OpenSearch
-        search_stats = search_service.get_wordcount_analysis()
+        if source == "opensearch":
+            search_stats = await search_service.get_wordcount_analysis()
+        else:
+            search_stats = await _get_local_top_words(source, filters, sketch_reader)
 
         return {
-            "words": search_stats["words"],
+            **search_stats,
             "success": True,
         }
     except Exception as e:
@@ -62,23 +226,97 @@ async def get_wordcount_analysis(
         raise
 
 
+@router.get("/trends")
+async def get_dashboard_trends(
+    granularity: str = Query("day", pattern="^(hour|day)$"),
+    periods: int = Query(30, ge=1, le=366),
+    product_name: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_read_principal),
+):
+    """
+    Get message, sentiment and topic counts per hour or day for the last
+    `periods` buckets (UTC), read from the feedback rollups.
+    Returns a JSON object with buckets and success status.
+    """
+    try:
+        buckets = await get_trends(
+            db, granularity=granularity, periods=periods, product_name=product_name
+        )
+
+        return {
+            "granularity": granularity,
+            "buckets": buckets,
+            "success": True,
+        }
+    except Exception as e:
+        logger.error(f"Error fetching trends: {str(e)}")
+        raise
+
+
 @router.get("/messages")
 async def get_dashboard_messages(
-    db: Session = Depends(get_db),
-    search_service: SearchService = Depends(get_search_service),
-    current_user: User = Depends(get_current_active_user),
+    page: int = Query(0, ge=0),
+    page_size: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    snapshot: bool = False,
+    filters: SearchFilters = Depends(get_search_filters),
+    search_service: AsyncSearchService = Depends(get_async_search_service),
+    current_user: Principal = Depends(get_read_principal),
 ):
     """
     Get messages from the feedback analysis index.
+    Pass the returned `next_cursor` as `cursor` to fetch the following page;
+    `snapshot=true` pins the walk to a point-in-time. A cursor whose
+    point-in-time has expired is answered with 410, and any other failure
+    past the first page with 500, never with an empty page.
     Returns a JSON object with messages and success status.
     """
+    if cursor is None and (page + 1) * page_size > MAX_RESULT_WINDOW:
+        raise HTTPException(
+            status_code=400,
+            detail=f"page is limited to the first {MAX_RESULT_WINDOW} results, "
+            "use cursor pagination to go further",
+        )
+
     try:
-        messages = search_service.get_dashboard_messages()
+        messages = await search_service.get_dashboard_messages(
+            page=page,
+            page_size=page_size,
+            filters=filters,
+            cursor=cursor,
+            snapshot=snapshot,
+        )
 
         return {
             **messages,
             "success": True,
         }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except CursorExpiredError as e:
+        raise HTTPException(status_code=410, detail=str(e))
     except Exception as e:
-        logger.error(f"Error fetching statistics: {str(e)}")
+        logger.error(f"Error fetching messages: {str(e)}")
         raise
+
+
+@router.get("/messages/export")
+async def export_dashboard_messages(
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    filters: SearchFilters = Depends(get_search_filters),
+    search_service: AsyncSearchService = Depends(get_async_search_service),
+    current_user: Principal = Depends(get_read_principal),
+):
+    """
+    Stream every matching message from the feedback analysis index.
+    Returns NDJSON (default) or CSV with the same fields as /messages.
+    """
+    return StreamingResponse(
+        stream_messages_export(search_service, export_format, filters),
+        media_type=EXPORT_FORMATS[export_format],
+        headers={
+            "Content-Disposition": "attachment; "
+            f'filename="feedback-messages.{export_format}"'
+        },
+    )
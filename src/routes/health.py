@@ -1,5 +1,8 @@
 from fastapi import APIRouter
 from src.utils.logger import get_logger
+from src.services.search_service import get_search_cache_stats
+from src.auth.principal_cache import principal_cache
+from src.auth.token_cache import token_cache
 
 router = APIRouter()
 logger = get_logger(__name__)
@@ -12,3 +15,18 @@ async def health_check():
     Returns 200 OK with service status.
     """
     return {"status": "healthy"}
+
+
+@router.get("/cache")
+async def cache_stats():
+    """
+    Report hit/miss/refresh counters for this worker's search result cache
+    and the auth token and principal caches. Read-only: `cache` is null if
+    the search service has not been created in this worker.
+    """
+    return {
+        "cache": await get_search_cache_stats(),
+        "principal_cache": principal_cache.stats(),
+        "token_cache": token_cache.stats(),
+        "success": True,
+    }
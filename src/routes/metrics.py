@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Response
+
+from src.utils.metrics import render_metrics
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """
+    Prometheus scrape endpoint: request latency by route, OpenSearch call and
+    `took` times, DB pool wait and cache events, merged across workers.
+    Not authenticated; nginx only exposes it to the local scraper.
+    """
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
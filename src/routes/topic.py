@@ -1,12 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 from pydantic import BaseModel
 from src.utils.logger import get_logger
-from src.database.config import get_db
+from src.database.config import get_async_db
 from src.models.topic import Topic
-from src.models.user import User
-from src.auth.jwt_handler import get_current_active_user
+from src.auth.principal_cache import Principal
+from src.auth.jwt_handler import get_current_active_user, get_read_principal
 
 
 class TopicCreate(BaseModel):
@@ -20,20 +21,20 @@ logger = get_logger(__name__)
 
 @router.get("/all")
 async def get_topics(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_read_principal),
 ):
     """
     Get a list of all active topics sorted by creation date.
     Returns a JSON object with topics array and success status.
     """
     try:
-        topics = (
-            db.query(Topic.id, Topic.label, Topic.description)
-            .filter(Topic.is_active.is_(True))
+        result = await db.execute(
+            select(Topic.id, Topic.label, Topic.description)
+            .where(Topic.is_active.is_(True))
             .order_by(Topic.created_at)
-            .all()
         )
+        topics = result.all()
         return {
             "topics": [
                 {"id": topic[0], "label": topic[1], "description": topic[2]}
@@ -49,8 +50,8 @@ async def get_topics(
 @router.post("/create")
 async def create_topic(
     topic: TopicCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_active_user),
 ):
     """
     Create a new topic.
@@ -58,7 +59,8 @@ async def create_topic(
     """
     try:
         topic.label = topic.label.lower()
-        existing_topic = db.query(Topic).filter(Topic.label == topic.label).first()
+        result = await db.execute(select(Topic).where(Topic.label == topic.label))
+        existing_topic = result.scalars().first()
         if existing_topic:
             raise HTTPException(
                 status_code=400, detail="Topic with this label already exists"
@@ -66,8 +68,8 @@ async def create_topic(
 
         db_topic = Topic(label=topic.label, description=topic.description)
         db.add(db_topic)
-        db.commit()
-        db.refresh(db_topic)
+        await db.commit()
+        await db.refresh(db_topic)
 
         return {
             "topic": {
@@ -81,31 +83,30 @@ async def create_topic(
         raise
     except Exception as e:
         logger.error(f"Error creating topic: {str(e)}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail="Failed to create topic")
 
 
 @router.delete("/{topic_id}")
 async def delete_topic(
     topic_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_active_user),
 ):
     """
     Soft delete a topic by setting is_active to False.
     Returns success status.
     """
     try:
-        topic = (
-            db.query(Topic)
-            .filter(Topic.id == topic_id, Topic.is_active.is_(True))
-            .first()
+        result = await db.execute(
+            select(Topic).where(Topic.id == topic_id, Topic.is_active.is_(True))
         )
+        topic = result.scalars().first()
         if not topic:
             raise HTTPException(status_code=404, detail="Topic not found")
 
         topic.is_active = False
-        db.commit()
+        await db.commit()
 
         return {
             "success": True,
@@ -114,5 +115,5 @@ async def delete_topic(
         raise
     except Exception as e:
         logger.error(f"Error deactivating topic: {str(e)}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail="Failed to deactivate topic")
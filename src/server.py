@@ -0,0 +1,23 @@
+"""
+Gunicorn worker class for the production server (see gunicorn.conf.py).
+"""
+
+from uvicorn.workers import UvicornWorker as BaseUvicornWorker
+
+from config import get_config
+
+config = get_config()
+
+
+class UvicornWorker(BaseUvicornWorker):
+    """
+    Uvicorn worker with the event loop, HTTP parser and concurrency limit
+    taken from config. Keep-alive, backlog and max-requests come from the
+    gunicorn settings.
+    """
+
+    CONFIG_KWARGS = {
+        "loop": config["SERVER_LOOP"],
+        "http": config["SERVER_HTTP"],
+        "limit_concurrency": config["SERVER_LIMIT_CONCURRENCY"] or None,
+    }
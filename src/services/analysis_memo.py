@@ -0,0 +1,135 @@
+import hashlib
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Optional, Sequence
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.sql import func
+
+from src.models.analysis_cache import AnalysisCache
+from src.services.analysis_service import AnalysisResult, TopicLabel
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Bumped whenever text_hash changes, so rows keyed the old way are purged
+KEY_SCHEME_VERSION = "2"
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def text_hash(text: str) -> Optional[str]:
+    """
+    Hash feedback text after normalization, so texts that differ only in case,
+    whitespace or punctuation ("Good!!" vs "good") share a key.
+
+    Normalization is Unicode-aware. Text with no word characters at all
+    (e.g. only emoji) returns None and must not be memoized.
+    """
+    normalized = " ".join(WORD_PATTERN.findall((text or "").casefold()))
+    if not normalized:
+        return None
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+def topic_set_version(topics: Sequence[TopicLabel], classifier_name: str) -> str:
+    """
+    Version of the inputs that decide a classification besides the text.
+    Any change to the active topics (or the classifier) yields a new version.
+    """
+    parts = [KEY_SCHEME_VERSION, classifier_name] + sorted(
+        f"{topic.label}\x00{topic.description or ''}" for topic in topics
+    )
+    return hashlib.sha256("\x01".join(parts).encode()).hexdigest()
+
+
+class AnalysisMemo:
+    """
+    Postgres-backed memo of analysis results keyed by
+    (normalized text hash, topic-set version).
+    """
+
+    def __init__(self, session_factory, topic_version: str):
+        self.session_factory = session_factory
+        self.topic_version = topic_version
+
+    def lookup(self, hashes: Iterable[str]) -> Dict[str, AnalysisResult]:
+        """Return cached results for the given hashes and mark them as used."""
+        hashes = list(set(hashes))
+        if not hashes:
+            return {}
+        with self.session_factory() as session:
+            rows = session.execute(
+                select(
+                    AnalysisCache.id,
+                    AnalysisCache.text_hash,
+                    AnalysisCache.sentiment,
+                    AnalysisCache.topics,
+                ).where(
+                    AnalysisCache.topic_version == self.topic_version,
+                    AnalysisCache.text_hash.in_(hashes),
+                )
+            ).all()
+            if rows:
+                session.execute(
+                    update(AnalysisCache)
+                    .where(AnalysisCache.id.in_([row.id for row in rows]))
+                    .values(last_used_at=func.now())
+                )
+                session.commit()
+        return {
+            row.text_hash: AnalysisResult(sentiment=row.sentiment, topics=row.topics)
+            for row in rows
+        }
+
+    def store(self, results: Dict[str, AnalysisResult]) -> None:
+        """
+        Persist new results; rows another run already stored are kept.
+
+        Fallback results are not stored, so texts classified during an API
+        outage are sent to the primary classifier again on the next run.
+        """
+        results = {
+            key: result for key, result in results.items() if not result.fallback
+        }
+        if not results:
+            return
+        with self.session_factory() as session:
+            session.execute(
+                insert(AnalysisCache)
+                .values(
+                    [
+                        {
+                            "text_hash": key,
+                            "topic_version": self.topic_version,
+                            "sentiment": result.sentiment,
+                            "topics": list(result.topics),
+                        }
+                        for key, result in results.items()
+                    ]
+                )
+                .on_conflict_do_nothing(index_elements=["text_hash", "topic_version"])
+            )
+            session.commit()
+
+    def purge_other_versions(self) -> int:
+        """Drop results computed against a different topic set."""
+        with self.session_factory() as session:
+            deleted = session.execute(
+                delete(AnalysisCache).where(
+                    AnalysisCache.topic_version != self.topic_version
+                )
+            ).rowcount
+            session.commit()
+        return deleted
+
+    def evict_older_than(self, max_age_days: int) -> int:
+        """Drop results that have not been used for `max_age_days`."""
+        cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+        with self.session_factory() as session:
+            deleted = session.execute(
+                delete(AnalysisCache).where(AnalysisCache.last_used_at < cutoff)
+            ).rowcount
+            session.commit()
+        return deleted
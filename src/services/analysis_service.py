@@ -0,0 +1,255 @@
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, replace
+from typing import List, Optional, Sequence
+
+from src.utils.logger import get_logger
+from src.utils.tokenizer import tokenize
+
+logger = get_logger(__name__)
+
+SENTIMENTS = ("positive", "negative", "neutral")
+
+# Longest feedback text sent to the model, in characters
+MAX_TEXT_CHARS = 1000
+
+POSITIVE_WORDS = {
+    "amazing",
+    "awesome",
+    "best",
+    "excellent",
+    "fantastic",
+    "fast",
+    "fine",
+    "good",
+    "great",
+    "happy",
+    "helpful",
+    "like",
+    "love",
+    "loved",
+    "nice",
+    "perfect",
+    "pleased",
+    "recommend",
+    "satisfied",
+    "thank",
+    "thanks",
+    "wonderful",
+}
+NEGATIVE_WORDS = {
+    "angry",
+    "awful",
+    "bad",
+    "broken",
+    "delay",
+    "delayed",
+    "disappointed",
+    "expensive",
+    "fail",
+    "failed",
+    "hate",
+    "horrible",
+    "late",
+    "poor",
+    "problem",
+    "refund",
+    "slow",
+    "terrible",
+    "unhappy",
+    "wrong",
+    "worse",
+    "worst",
+}
+NEGATIONS = {"not", "no", "never", "don't", "didn't", "isn't", "wasn't"}
+
+
+@dataclass(frozen=True)
+class TopicLabel:
+    label: str
+    description: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class AnalysisResult:
+    sentiment: str
+    topics: List[str] = field(default_factory=list)
+    # Produced by a fallback classifier after the primary one failed
+    fallback: bool = False
+
+
+class FeedbackClassifier(ABC):
+    """Classifies feedback texts into a sentiment and a subset of topic labels."""
+
+    # Identifies the classifier in memoized results
+    name = "base"
+
+    @abstractmethod
+    async def classify(
+        self, texts: Sequence[str], topics: Sequence[TopicLabel]
+    ) -> List[AnalysisResult]:
+        """Return one result per text, in order."""
+
+
+class KeywordClassifier(FeedbackClassifier):
+    """
+    Deterministic lexicon-based classifier for offline runs and tests.
+
+    Sentiment is the sign of positive minus negative lexicon hits (a preceding
+    negation flips a hit). A topic matches when every word of its label
+    appears in the text, ignoring a trailing plural "s".
+    """
+
+    name = "keyword-v2"
+
+    @staticmethod
+    def _stem(token: str) -> str:
+        return token[:-1] if len(token) > 3 and token.endswith("s") else token
+
+    def classify_one(self, text: str, topics: Sequence[TopicLabel]) -> AnalysisResult:
+        tokens = tokenize(text)
+        score = 0
+        for i, token in enumerate(tokens):
+            polarity = (token in POSITIVE_WORDS) - (token in NEGATIVE_WORDS)
+            if polarity and i > 0 and tokens[i - 1] in NEGATIONS:
+                polarity = -polarity
+            score += polarity
+        sentiment = "positive" if score > 0 else "negative" if score < 0 else "neutral"
+
+        stems = {self._stem(token) for token in tokens}
+        matched = [
+            topic.label
+            for topic in topics
+            if all(self._stem(word) in stems for word in tokenize(topic.label))
+        ]
+        return AnalysisResult(sentiment=sentiment, topics=matched)
+
+    async def classify(
+        self, texts: Sequence[str], topics: Sequence[TopicLabel]
+    ) -> List[AnalysisResult]:
+        return [self.classify_one(text, topics) for text in texts]
+
+
+class OpenAIClassifier(FeedbackClassifier):
+    """
+    Classifies many feedback items per chat completion.
+
+    Texts are split into batches of `batch_size`; at most `concurrency` batch
+    requests are in flight at once. Any batch or item the model fails to
+    answer is classified by `fallback` instead.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o-mini",
+        batch_size: int = 50,
+        concurrency: int = 4,
+        fallback: Optional[FeedbackClassifier] = None,
+    ):
+        from openai import AsyncOpenAI
+
+        self.client = AsyncOpenAI(api_key=api_key)
+        self.model = model
+        self.name = f"openai:{model}"
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.fallback = fallback or KeywordClassifier()
+
+    def _build_messages(
+        self, texts: Sequence[str], topics: Sequence[TopicLabel]
+    ) -> List[dict]:
+        topic_lines = "\n".join(
+            f"- {topic.label}" + (f": {topic.description}" if topic.description else "")
+            for topic in topics
+        )
+        items = [
+            {"i": i, "text": text[:MAX_TEXT_CHARS]} for i, text in enumerate(texts)
+        ]
+        return [
+            {
+                "role": "system",
+                "content": (
+                    "You classify customer feedback. For every item return its "
+                    "sentiment (positive, negative or neutral) and the labels from "
+                    "the topic list that it is about (possibly none). Only use "
+                    "labels from the list.\n\nTopics:\n"
+                    f"{topic_lines or '(none)'}\n\n"
+                    'Reply with JSON: {"results": [{"i": <item index>, '
+                    '"sentiment": "...", "topics": ["..."]}]}'
+                ),
+            },
+            {"role": "user", "content": json.dumps(items)},
+        ]
+
+    async def _classify_batch(
+        self, texts: Sequence[str], topics: Sequence[TopicLabel]
+    ) -> List[AnalysisResult]:
+        results: List[Optional[AnalysisResult]] = [None] * len(texts)
+        labels = {topic.label for topic in topics}
+        try:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=self._build_messages(texts, topics),
+                response_format={"type": "json_object"},
+                temperature=0,
+            )
+            payload = json.loads(response.choices[0].message.content)
+            for item in payload.get("results", []):
+                i = item.get("i")
+                sentiment = str(item.get("sentiment", "")).lower()
+                if not isinstance(i, int) or not 0 <= i < len(texts):
+                    continue
+                if sentiment not in SENTIMENTS:
+                    continue
+                # A bare string would otherwise be matched character by character
+                item_topics = item.get("topics")
+                if not isinstance(item_topics, list):
+                    item_topics = []
+                results[i] = AnalysisResult(
+                    sentiment=sentiment,
+                    topics=[t for t in item_topics if t in labels],
+                )
+        except Exception as e:
+            logger.error(f"Batch classification failed, using fallback: {str(e)}")
+
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            fallback = await self.fallback.classify([texts[i] for i in missing], topics)
+            for i, result in zip(missing, fallback):
+                results[i] = replace(result, fallback=True)
+        return results
+
+    async def classify(
+        self, texts: Sequence[str], topics: Sequence[TopicLabel]
+    ) -> List[AnalysisResult]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(batch: Sequence[str]) -> List[AnalysisResult]:
+            async with semaphore:
+                return await self._classify_batch(batch, topics)
+
+        batches = [
+            texts[start : start + self.batch_size]
+            for start in range(0, len(texts), self.batch_size)
+        ]
+        batch_results = await asyncio.gather(*(run(batch) for batch in batches))
+        return [result for batch in batch_results for result in batch]
+
+
+def create_classifier(config: dict) -> FeedbackClassifier:
+    """Build the classifier selected by ANALYSIS_ENGINE."""
+    engine = config["ANALYSIS_ENGINE"]
+    if engine == "openai":
+        if config.get("OPENAI_API_KEY"):
+            return OpenAIClassifier(
+                api_key=config["OPENAI_API_KEY"],
+                model=config["ANALYSIS_MODEL"],
+                batch_size=config["ANALYSIS_BATCH_SIZE"],
+                concurrency=config["ANALYSIS_CONCURRENCY"],
+            )
+        logger.warning("OPENAI_API_KEY is not set, using the keyword classifier")
+    elif engine != "local":
+        logger.warning(f"Unknown ANALYSIS_ENGINE '{engine}', using local")
+    return KeywordClassifier()
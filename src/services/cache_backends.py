@@ -0,0 +1,205 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    stored_at: float
+
+
+class CacheBackend(ABC):
+    """
+    Storage for ResultCache entries.
+
+    `shared` backends are visible to every worker on the host; ResultCache then
+    uses leases so only one worker refreshes a given key at a time.
+    """
+
+    shared = False
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry stored under `key`, or None."""
+
+    @abstractmethod
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        """Store `entry` under `key`, replacing any previous one."""
+
+    @abstractmethod
+    async def delete(self, key: Optional[str] = None) -> None:
+        """Delete one key, or every key when none is given."""
+
+    async def acquire_lease(self, key: str, ttl_seconds: float) -> bool:
+        """Try to become the single loader for `key` across workers."""
+        return True
+
+    async def release_lease(self, key: str) -> None:
+        return None
+
+    async def size(self) -> int:
+        return 0
+
+    def close(self) -> None:
+        return None
+
+
+class InMemoryLRUBackend(CacheBackend):
+    """Per-process LRU store bounded by entry count."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: Optional[str] = None) -> None:
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def size(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteBackend(CacheBackend):
+    """
+    Host-wide store in a SQLite file, shared by every worker on the machine.
+
+    Values must be JSON-serializable. Writes use WAL mode so readers in other
+    workers are never blocked; blocking calls run in a thread off the event loop.
+    """
+
+    shared = True
+
+    def __init__(self, path: str, max_age_seconds: float = 3600):
+        self.path = path
+        self.max_age_seconds = max_age_seconds
+        self._owner = f"{os.getpid()}-{uuid.uuid4().hex}"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=5, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_leases ("
+            "key TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _execute(self, sql: str, params: tuple = (), fetch: bool = False):
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            rows = cursor.fetchall() if fetch else cursor.rowcount
+            self._conn.commit()
+            return rows
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        rows = await asyncio.to_thread(
+            self._execute,
+            "SELECT value, stored_at FROM cache_entries WHERE key = ?",
+            (key,),
+            True,
+        )
+        if not rows:
+            return None
+        value, stored_at = rows[0]
+        return CacheEntry(value=json.loads(value), stored_at=stored_at)
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        await asyncio.to_thread(self._set, key, entry)
+
+    def _set(self, key: str, entry: CacheEntry) -> None:
+        self._execute(
+            "INSERT INTO cache_entries (key, value, stored_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET "
+            "value = excluded.value, stored_at = excluded.stored_at",
+            (key, json.dumps(entry.value), entry.stored_at),
+        )
+        self._execute(
+            "DELETE FROM cache_entries WHERE stored_at < ?",
+            (time.time() - self.max_age_seconds,),
+        )
+
+    async def delete(self, key: Optional[str] = None) -> None:
+        if key is None:
+            await asyncio.to_thread(self._execute, "DELETE FROM cache_entries")
+        else:
+            await asyncio.to_thread(
+                self._execute, "DELETE FROM cache_entries WHERE key = ?", (key,)
+            )
+
+    async def acquire_lease(self, key: str, ttl_seconds: float) -> bool:
+        now = time.time()
+        changed = await asyncio.to_thread(
+            self._execute,
+            "INSERT INTO cache_leases (key, owner, expires_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET "
+            "owner = excluded.owner, expires_at = excluded.expires_at "
+            "WHERE cache_leases.expires_at < ?",
+            (key, self._owner, now + ttl_seconds, now),
+        )
+        return changed == 1
+
+    async def release_lease(self, key: str) -> None:
+        await asyncio.to_thread(
+            self._execute,
+            "DELETE FROM cache_leases WHERE key = ? AND owner = ?",
+            (key, self._owner),
+        )
+
+    async def size(self) -> int:
+        rows = await asyncio.to_thread(
+            self._execute, "SELECT COUNT(*) FROM cache_entries", fetch=True
+        )
+        return rows[0][0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def create_cache_backend(config: dict) -> CacheBackend:
+    """Build the cache backend selected by SEARCH_CACHE_BACKEND."""
+    backend = config["SEARCH_CACHE_BACKEND"]
+    if backend == "sqlite":
+        try:
+            return SQLiteBackend(
+                config["SEARCH_CACHE_SQLITE_PATH"],
+                max_age_seconds=config["SEARCH_CACHE_TTL_SECONDS"]
+                + config["SEARCH_CACHE_STALE_SECONDS"],
+            )
+        except sqlite3.Error as e:
+            logger.error(
+                f"Failed to open shared search cache, falling back to memory: {str(e)}"
+            )
+    elif backend != "memory":
+        logger.warning(f"Unknown SEARCH_CACHE_BACKEND '{backend}', using memory")
+    return InMemoryLRUBackend(max_entries=config["SEARCH_CACHE_MAX_ENTRIES"])
@@ -0,0 +1,84 @@
+import csv
+import io
+import json
+from typing import AsyncIterator, Optional
+
+from src.services.search_service import (
+    AsyncSearchService,
+    SearchFilters,
+    MESSAGE_SOURCE_FIELDS,
+)
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _csv_value(value) -> str:
+    """Flatten list/dict fields to JSON so CSV cells stay lossless."""
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    return "" if value is None else str(value)
+
+
+async def stream_messages_export(
+    search_service: AsyncSearchService,
+    export_format: str,
+    filters: Optional[SearchFilters] = None,
+    batch_size: int = 1000,
+) -> AsyncIterator[bytes]:
+    """
+    Stream the feedback-analysis index as NDJSON or CSV.
+
+    The CSV header goes out immediately and each page from OpenSearch is
+    written as one chunk as soon as it arrives, so memory stays bounded by
+    `batch_size`.
+
+    The status line is already sent when a page fails, so the body ends with
+    an error trailer instead: `{"error": ..., "rows": n}` in NDJSON, or a row
+    starting with `#error` in CSV. The exception is then re-raised, which
+    aborts the response instead of ending it cleanly.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if export_format == "csv":
+        writer.writerow(MESSAGE_SOURCE_FIELDS)
+        yield _flush(buffer)
+
+    rows = 0
+    try:
+        async for page in search_service.iter_message_pages(filters, batch_size):
+            for doc in page:
+                if export_format == "csv":
+                    writer.writerow(
+                        [_csv_value(doc.get(field)) for field in MESSAGE_SOURCE_FIELDS]
+                    )
+                else:
+                    buffer.write(json.dumps(doc))
+                    buffer.write("\n")
+            rows += len(page)
+            yield _flush(buffer)
+    except Exception as e:
+        logger.error(f"Error streaming messages export after {rows} rows: {str(e)}")
+        message = f"export truncated after {rows} rows: {str(e)}"
+        if export_format == "csv":
+            writer.writerow(["#error", message])
+        else:
+            buffer.write(json.dumps({"error": message, "rows": rows}))
+            buffer.write("\n")
+        yield _flush(buffer)
+        raise
+
+    logger.info(f"Messages export finished with {rows} rows")
+
+
+def _flush(buffer: io.StringIO) -> bytes:
+    """Return the buffered text as bytes and empty the buffer."""
+    data = buffer.getvalue().encode()
+    buffer.seek(0)
+    buffer.truncate()
+    return data
@@ -0,0 +1,255 @@
+"""
+Time-based rollover indices behind read/write aliases.
+
+With a period other than "none", documents live in one concrete index per
+period (`feedback-analysis-2026.10` for "month") chosen by their `created_at`.
+An index template built from `opensearch/<base>.mapping.json` supplies the
+mapping and settings, and every period index is created in the read alias
+`feedback-analysis`, so readers keep using the base name. The alias is not in
+the template, so reindex copies (src/jobs/reindex.py) stay out of it until
+they are swapped in. The write alias `<base>-write` points at the current
+period for writers that have no `created_at`.
+
+Readers with a created_at range can ask for just the indices whose period
+overlaps it instead of the whole alias.
+"""
+
+import json
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from src.utils.logger import get_logger
+from src.utils.metrics import SearchTimer
+
+logger = get_logger(__name__)
+
+MAPPINGS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "opensearch",
+)
+
+# Index name suffix per rollover period
+PERIOD_FORMATS = {"year": "%Y", "month": "%Y.%m", "day": "%Y.%m.%d"}
+
+
+def load_mapping(base: str) -> dict:
+    """Return the contents of opensearch/<base>.mapping.json."""
+    with open(os.path.join(MAPPINGS_DIR, f"{base}.mapping.json")) as f:
+        return json.load(f)
+
+
+def _as_utc(moment: datetime) -> datetime:
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+@dataclass(frozen=True)
+class RolloverIndex:
+    """Naming rules for an index family such as feedback-analysis."""
+
+    base: str
+    period: str = "none"
+
+    @property
+    def rolls_over(self) -> bool:
+        return self.period in PERIOD_FORMATS
+
+    @property
+    def read_alias(self) -> str:
+        return self.base
+
+    @property
+    def write_alias(self) -> str:
+        return f"{self.base}-write" if self.rolls_over else self.base
+
+    @property
+    def pattern(self) -> str:
+        return f"{self.base}-*"
+
+    def index_for(self, moment: Optional[datetime]) -> str:
+        """Return the concrete index a document created at `moment` belongs in."""
+        if not self.rolls_over:
+            return self.base
+        if moment is None:
+            return self.write_alias
+        return f"{self.base}-{_as_utc(moment).strftime(PERIOD_FORMATS[self.period])}"
+
+    def resolve(self, indices: List[str], moment: Optional[datetime]) -> str:
+        """
+        Return the index serving `moment`'s period among `indices` (those
+        behind the read alias), preferring the newest reindexed version, or
+        the period's default name when none exists yet.
+        """
+        if not self.rolls_over or moment is None:
+            return self.index_for(moment)
+        moment = _as_utc(moment)
+        serving = [
+            index
+            for index in indices
+            if (bounds := self.period_bounds(index)) and bounds[0] <= moment < bounds[1]
+        ]
+        return max(serving) if serving else self.index_for(moment)
+
+    def period_bounds(self, index: str) -> Optional[Tuple[datetime, datetime]]:
+        """
+        Return [start, end) of the period an index name covers, or None if the
+        name does not follow the pattern. Suffixes after the period, such as a
+        `-v2` reindex version, are ignored.
+        """
+        prefix = f"{self.base}-"
+        if not self.rolls_over or not index.startswith(prefix):
+            return None
+        stamp = index[len(prefix) :].split("-")[0]
+        try:
+            start = datetime.strptime(stamp, PERIOD_FORMATS[self.period])
+        except ValueError:
+            return None
+        start = start.replace(tzinfo=timezone.utc)
+        if self.period == "day":
+            end = start + timedelta(days=1)
+        elif self.period == "month":
+            end = (start + timedelta(days=32)).replace(day=1)
+        else:
+            end = start.replace(year=start.year + 1)
+        return start, end
+
+    def select(
+        self,
+        indices: List[str],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> List[str]:
+        """
+        Return the indices that may hold documents created in [start, end].
+        Indices whose name cannot be parsed are always kept.
+        """
+        start = _as_utc(start) if start else None
+        end = _as_utc(end) if end else None
+        selected = []
+        for index in indices:
+            bounds = self.period_bounds(index)
+            if bounds is not None:
+                if end is not None and bounds[0] > end:
+                    continue
+                if start is not None and bounds[1] <= start:
+                    continue
+            selected.append(index)
+        return sorted(selected)
+
+    def template_body(self, settings: Optional[dict] = None) -> dict:
+        """Composable index template applying the mapping and settings."""
+        template = load_mapping(self.base)
+        if settings:
+            template["settings"] = settings
+        return {"index_patterns": [self.pattern], "priority": 100, "template": template}
+
+
+def put_index_template(
+    client, rollover_index: RolloverIndex, settings: Optional[dict] = None
+) -> None:
+    """Create or update the index template for a rolling index family."""
+    client.indices.put_index_template(
+        name=rollover_index.base, body=rollover_index.template_body(settings)
+    )
+
+
+def alias_indices(client, alias: str) -> List[str]:
+    """Return the concrete indices behind `alias`, or [] if it does not exist."""
+    if not client.indices.exists_alias(name=alias):
+        return []
+    return sorted(client.indices.get_alias(name=alias))
+
+
+def closed_period_indices(
+    client, rollover_index: RolloverIndex, now: Optional[datetime] = None
+) -> List[str]:
+    """
+    Return the indices behind the read alias whose period has ended and that
+    the write alias does not point at; nothing is written to them any more.
+    """
+    if not rollover_index.rolls_over:
+        return []
+    now = _as_utc(now or datetime.now(timezone.utc))
+    writing = set(alias_indices(client, rollover_index.write_alias))
+    return [
+        index
+        for index in alias_indices(client, rollover_index.read_alias)
+        if index not in writing
+        and (bounds := rollover_index.period_bounds(index)) is not None
+        and bounds[1] <= now
+    ]
+
+
+def ensure_period_index(
+    client,
+    rollover_index: RolloverIndex,
+    index: str,
+    settings: Optional[dict] = None,
+) -> bool:
+    """
+    Create a period index in the read alias unless it already exists.
+    `settings` override the template's. Returns True if it was created.
+    """
+    if client.indices.exists(index=index):
+        return False
+    # The template adds the mapping and settings
+    body = {"aliases": {rollover_index.read_alias: {}}}
+    if settings:
+        body["settings"] = settings
+    client.indices.create(index=index, body=body)
+    logger.info(f"Created index {index}")
+    return True
+
+
+def ensure_write_index(
+    client, rollover_index: RolloverIndex, now: Optional[datetime] = None
+) -> str:
+    """
+    Create the current period's index if needed and point the write alias at
+    it, in one alias update. Returns the index name.
+    """
+    index = rollover_index.resolve(
+        alias_indices(client, rollover_index.read_alias),
+        now or datetime.now(timezone.utc),
+    )
+    ensure_period_index(client, rollover_index, index)
+
+    alias = rollover_index.write_alias
+    current = alias_indices(client, alias)
+    if current != [index]:
+        actions = [{"remove": {"index": old, "alias": alias}} for old in current]
+        actions.append(
+            {"add": {"index": index, "alias": alias, "is_write_index": True}}
+        )
+        client.indices.update_aliases(body={"actions": actions})
+        logger.info(f"Write alias {alias} now points at {index}")
+    return index
+
+
+class AliasResolver:
+    """
+    Caches which concrete indices sit behind an alias, so range-aware reads do
+    not add a round-trip per request. Entries are refreshed after `ttl_seconds`.
+    """
+
+    def __init__(self, client, ttl_seconds: float = 60):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self._indices: Dict[str, Tuple[float, List[str]]] = {}
+
+    async def indices(self, alias: str) -> List[str]:
+        cached = self._indices.get(alias)
+        if cached is not None and time.monotonic() - cached[0] < self.ttl_seconds:
+            return cached[1]
+        with SearchTimer("get_alias"):
+            response = await self.client.indices.get_alias(name=alias)
+        indices = sorted(response)
+        self._indices[alias] = (time.monotonic(), indices)
+        return indices
+
+    def clear(self) -> None:
+        self._indices.clear()
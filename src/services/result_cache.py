@@ -0,0 +1,180 @@
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from src.services.cache_backends import CacheBackend, CacheEntry, InMemoryLRUBackend
+from src.utils.logger import get_logger
+from src.utils.metrics import CACHE_EVENTS
+
+logger = get_logger(__name__)
+
+# How often a worker waiting on another worker's load re-reads the backend
+LEASE_POLL_SECONDS = 0.05
+
+
+class ResultCache:
+    """
+    Async result cache with a TTL, stale-while-revalidate and single-flight loads.
+
+    - Entries younger than `ttl_seconds` are served directly.
+    - Entries older than that but within `stale_seconds` more are served
+      immediately while one background task refreshes them.
+    - Concurrent misses for the same key share a single loader call. With a
+      shared backend, a lease extends this across workers: one worker loads and
+      the others wait for its result (up to `lease_seconds`).
+
+    Loader exceptions propagate to the caller and are never cached.
+    """
+
+    # Label for the cache_events_total counter
+    metrics_name = "search"
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        stale_seconds: float = 0,
+        backend: Optional[CacheBackend] = None,
+        lease_seconds: float = 30,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.backend = backend or InMemoryLRUBackend()
+        self.lease_seconds = lease_seconds
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._counters = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "peer_loads": 0,
+            "refreshes": 0,
+            "refresh_errors": 0,
+        }
+
+    def _count(self, event: str) -> None:
+        self._counters[event] += 1
+        CACHE_EVENTS.labels(self.metrics_name, event).inc()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    @staticmethod
+    def _key(key: Hashable) -> str:
+        return json.dumps(key, sort_keys=True, default=str)
+
+    async def get_or_load(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached value for `key`, calling `loader` when needed."""
+        if not self.enabled:
+            return await loader()
+
+        key = self._key(key)
+        entry = await self.backend.get(key)
+        if entry is not None:
+            age = time.time() - entry.stored_at
+            if age < self.ttl_seconds:
+                self._count("hits")
+                return entry.value
+            if age < self.ttl_seconds + self.stale_seconds:
+                self._count("stale_hits")
+                self._schedule_refresh(key, loader)
+                return entry.value
+
+        self._count("misses")
+        return await self._load(key, loader)
+
+    async def peek(self, key: Hashable) -> Any:
+        """Return the value for `key` if it is within its TTL, else None."""
+        if not self.enabled:
+            return None
+        entry = await self.backend.get(self._key(key))
+        if entry is None or time.time() - entry.stored_at >= self.ttl_seconds:
+            return None
+        self._count("hits")
+        return entry.value
+
+    async def put(self, key: Hashable, value: Any) -> None:
+        """Store a value loaded outside get_or_load(), e.g. by a batched request."""
+        if self.enabled:
+            await self.backend.set(
+                self._key(key), CacheEntry(value=value, stored_at=time.time())
+            )
+
+    async def invalidate(self, key: Hashable = None) -> None:
+        """Drop one entry, or every entry when no key is given."""
+        await self.backend.delete(None if key is None else self._key(key))
+
+    async def stats(self) -> dict:
+        """Return hit/miss/refresh counters and the current entry count."""
+        return {
+            **self._counters,
+            "entries": await self.backend.size(),
+            "backend": type(self.backend).__name__,
+            "ttl_seconds": self.ttl_seconds,
+            "stale_seconds": self.stale_seconds,
+        }
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run_loader(key, loader))
+            self._inflight[key] = task
+        else:
+            self._count("coalesced")
+        # Shield so a cancelled request does not cancel the load other callers share
+        return await asyncio.shield(task)
+
+    async def _run_loader(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        leased = False
+        try:
+            requested_at = time.time()
+            if self.backend.shared:
+                leased = await self.backend.acquire_lease(key, self.lease_seconds)
+                if not leased:
+                    entry = await self._wait_for_peer(key, requested_at)
+                    if entry is not None:
+                        self._count("peer_loads")
+                        return entry.value
+
+            value = await loader()
+            await self.backend.set(key, CacheEntry(value=value, stored_at=time.time()))
+            return value
+        finally:
+            self._inflight.pop(key, None)
+            if leased:
+                await self.backend.release_lease(key)
+
+    async def _wait_for_peer(
+        self, key: str, requested_at: float
+    ) -> Optional[CacheEntry]:
+        """Wait for the worker holding the lease to store a fresh entry."""
+        deadline = requested_at + self.lease_seconds
+        while time.time() < deadline:
+            await asyncio.sleep(LEASE_POLL_SECONDS)
+            entry = await self.backend.get(key)
+            if entry is not None and entry.stored_at >= requested_at:
+                return entry
+            if await self.backend.acquire_lease(key, self.lease_seconds):
+                # The peer finished without storing (e.g. its load failed)
+                await self.backend.release_lease(key)
+                return None
+        return None
+
+    def _schedule_refresh(self, key: str, loader: Callable[[], Awaitable[Any]]) -> None:
+        if key in self._inflight:
+            return
+        self._count("refreshes")
+        task = asyncio.create_task(self._run_loader(key, loader))
+        self._inflight[key] = task
+        task.add_done_callback(lambda t: self._on_refresh_done(key, t))
+
+    def _on_refresh_done(self, key: str, task: asyncio.Task) -> None:
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self._count("refresh_errors")
+            logger.error(f"Background refresh failed for cache key {key}: {str(error)}")
@@ -0,0 +1,131 @@
+"""
+Time-bucketed sentiment and topic rollups.
+
+Counts are accumulated per hour and per day for each product as feedback is
+analyzed (see src/jobs/rollup_stage.py), so trend reads sum a few hundred
+`feedback_rollups` rows instead of aggregating over the index.
+"""
+
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.feedback_rollup import FeedbackRollup
+from src.services.analysis_service import SENTIMENTS
+
+GRANULARITIES = {"hour": timedelta(hours=1), "day": timedelta(days=1)}
+
+# Primary key columns, in the order count_rollups() builds its keys
+ROLLUP_KEY = ("granularity", "bucket_start", "product_name", "dimension", "value")
+
+
+def bucket_start(moment: datetime, granularity: str) -> datetime:
+    """Truncate `moment` to the start of its UTC hour or day."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    moment = moment.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    if granularity == "day":
+        moment = moment.replace(hour=0)
+    return moment
+
+
+def count_rollups(rows: Iterable[dict], docs: Iterable[dict]) -> Counter:
+    """
+    Count analyzed documents by
+    (granularity, bucket_start, product_name, dimension, value).
+    """
+    counts = Counter()
+    for row, doc in zip(rows, docs):
+        created_at = row.get("created_at") or datetime.now(timezone.utc)
+        product_name = row.get("product_name") or ""
+        values = [("total", "")]
+        if doc.get("sentiment"):
+            values.append(("sentiment", doc["sentiment"]))
+        values.extend(("topic", topic) for topic in set(doc.get("topics") or []))
+        for granularity in GRANULARITIES:
+            start = bucket_start(created_at, granularity)
+            for dimension, value in values:
+                counts[(granularity, start, product_name, dimension, value)] += 1
+    return counts
+
+
+def apply_rollups(session, counts: Counter) -> None:
+    """
+    Add counts to the rollups within the caller's transaction.
+    Rows are upserted in key order so concurrent writers cannot deadlock.
+    """
+    if not counts:
+        return
+    stmt = insert(FeedbackRollup).values(
+        [
+            {**dict(zip(ROLLUP_KEY, key)), "count": count}
+            for key, count in sorted(counts.items())
+        ]
+    )
+    session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=list(ROLLUP_KEY),
+            set_={"count": FeedbackRollup.count + stmt.excluded.count},
+        )
+    )
+
+
+async def get_trends(
+    db: AsyncSession,
+    granularity: str = "day",
+    periods: int = 30,
+    product_name: Optional[str] = None,
+    now: Optional[datetime] = None,
+) -> List[dict]:
+    """
+    Return the last `periods` buckets, oldest first and including the current
+    one, with message, sentiment and topic counts. Empty buckets are zeros.
+    """
+    step = GRANULARITIES[granularity]
+    last = bucket_start(now or datetime.now(timezone.utc), granularity)
+    first = last - step * (periods - 1)
+
+    query = (
+        select(
+            FeedbackRollup.bucket_start,
+            FeedbackRollup.dimension,
+            FeedbackRollup.value,
+            func.sum(FeedbackRollup.count),
+        )
+        .where(
+            FeedbackRollup.granularity == granularity,
+            FeedbackRollup.bucket_start >= first,
+        )
+        .group_by(
+            FeedbackRollup.bucket_start, FeedbackRollup.dimension, FeedbackRollup.value
+        )
+    )
+    if product_name is not None:
+        query = query.where(FeedbackRollup.product_name == product_name)
+
+    buckets = {}
+    for i in range(periods):
+        start = first + step * i
+        buckets[start] = {
+            "bucket_start": start.isoformat(),
+            "num_messages": 0,
+            "sentiment": {sentiment: 0 for sentiment in SENTIMENTS},
+            "topics": {},
+        }
+
+    result = await db.execute(query)
+    for start, dimension, value, count in result:
+        bucket = buckets.get(bucket_start(start, granularity))
+        if bucket is None:
+            continue
+        if dimension == "total":
+            bucket["num_messages"] += int(count)
+        elif dimension == "sentiment":
+            bucket["sentiment"][value] = bucket["sentiment"].get(value, 0) + int(count)
+        elif dimension == "topic":
+            bucket["topics"][value] = bucket["topics"].get(value, 0) + int(count)
+    return list(buckets.values())
@@ -1,34 +1,143 @@
-from opensearchpy import OpenSearch
+import base64
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional
+
+from src.services.cache_backends import create_cache_backend
+from src.services.index_manager import AliasResolver, RolloverIndex
+from src.services.result_cache import ResultCache
 from src.utils.logger import get_logger
+from src.utils.metrics import SearchTimer
 from config import get_config
 
+if TYPE_CHECKING:
+    from opensearchpy import AsyncOpenSearch
+
 logger = get_logger(__name__)
 
+# Fields returned for each message document
+MESSAGE_SOURCE_FIELDS = [
+    "feedback_id",
+    "feedback_text",
+    "sentiment",
+    "topics",
+    "product_name",
+    "media_urls",
+    "created_at",
+]
 
-class SearchService:
-    _instance = None
+# OpenSearch rejects from + size beyond index.max_result_window
+MAX_RESULT_WINDOW = 10000
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(SearchService, cls).__new__(cls)
-            cls._instance._initialize()
-        return cls._instance
+# How long a point-in-time snapshot stays open between cursor pages
+PIT_KEEP_ALIVE = "5m"
 
-    def _initialize(self):
-        """Initialize OpenSearch client with configuration."""
-        config = get_config()
-        self.opensearch_client = OpenSearch(
-            hosts=[config["OPENSEARCH_ENDPOINT"]],
-            http_auth=(config["OPENSEARCH_USERNAME"], config["OPENSEARCH_PASSWORD"]),
-            use_ssl=True,
-            verify_certs=True,
-        )
-        self.feedback_analysis_index = "feedback-analysis"
+# Message order; feedback_id is the document _id, so it is unique per index
+MESSAGES_SORT = [{"feedback_id": {"order": "desc"}}]
+
+# Point-in-time walks span indices, so ties are broken by shard and doc id
+PIT_TIEBREAKER = {"_shard_doc": {"order": "asc"}}
+
+
+class CursorExpiredError(RuntimeError):
+    """Raised when the point-in-time behind a cursor has expired or is gone."""
+
+
+def _is_missing_pit(error: Exception) -> bool:
+    """OpenSearch answers 404 (search_context_missing) for an expired PIT."""
+    return getattr(error, "status_code", None) == 404
+
+
+@dataclass(frozen=True)
+class SearchFilters:
+    """Optional filters applied as non-scoring `filter` clauses."""
+
+    sentiment: Optional[str] = None
+    topic: Optional[str] = None
+    product_name: Optional[str] = None
+    # Inclusive bounds on created_at
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+
+    def cache_key(self) -> dict:
+        """Return the filters as a JSON-friendly dict for ResultCache keys."""
+        return {
+            name: value.isoformat() if isinstance(value, datetime) else value
+            for name, value in asdict(self).items()
+            if value is not None
+        }
+
+    def to_clauses(self) -> list:
+        """Return the bool `filter` clauses for the filters that are set."""
+        clauses = []
+        if self.sentiment:
+            clauses.append(
+                {
+                    "term": {
+                        "sentiment": {"value": self.sentiment, "case_insensitive": True}
+                    }
+                }
+            )
+        if self.topic:
+            clauses.append(
+                {"term": {"topics": {"value": self.topic, "case_insensitive": True}}}
+            )
+        if self.product_name:
+            clauses.append({"term": {"product_name": self.product_name}})
+        if self.created_from or self.created_to:
+            created_range = {}
+            if self.created_from:
+                created_range["gte"] = self.created_from.isoformat()
+            if self.created_to:
+                created_range["lte"] = self.created_to.isoformat()
+            clauses.append({"range": {"created_at": created_range}})
+        return clauses
 
-    def _get_dashboard_query(self):
+
+def encode_cursor(state: dict) -> str:
+    """Encode pagination state as an opaque URL-safe token."""
+    raw = json.dumps(state, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict:
+    """Decode a token from encode_cursor(). Raises ValueError if it is malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(state, dict) or not isinstance(state.get("search_after"), list):
+        raise ValueError("Invalid cursor")
+    return state
+
+
+def cursor_fingerprint(filters: Optional[SearchFilters], page_size: int) -> str:
+    """
+    Identify the query a cursor belongs to, so a cursor is only continued
+    with the filters and page size it was issued for.
+    """
+    query = {
+        "filters": filters.cache_key() if filters else {},
+        "page_size": page_size,
+    }
+    raw = json.dumps(query, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+
+class BaseSearchService:
+    """Query builders and response parsing shared by the sync and async services."""
+
+    feedback_analysis_index = "feedback-analysis"
+    wordcount_analysis_index = "wordcount-analysis"
+
+    def _get_dashboard_query(self, filters: Optional[SearchFilters] = None):
         """Return the OpenSearch query for dashboard statistics."""
         return {
             "size": 0,
+            "query": self._build_query(filters),
             "aggs": {
                 "total_documents": {"value_count": {"field": "feedback_id"}},
                 "sentiment_breakdown": {"terms": {"field": "sentiment"}},
@@ -46,109 +155,93 @@ class SearchService:
             "top_topics": [],
         }
 
-    def get_dashboard_statistics(self) -> dict:
-        """
-        Get statistics about documents in the feedback analysis index.
-        Returns counts for total documents, sentiment breakdowns, and top topics.
-        """
-        try:
-            response = self.opensearch_client.search(
-                index=self.feedback_analysis_index, body=self._get_dashboard_query()
-            )
-
-            aggregations = response.get("aggregations", {})
+    def _parse_dashboard_statistics(self, response: dict) -> dict:
+        """Transform a dashboard aggregation response into statistics."""
+        aggregations = response.get("aggregations", {})
 
-            # Get total documents count
-            total_docs = aggregations.get("total_documents", {}).get("value", 0)
+        # Get total documents count
+        total_docs = aggregations.get("total_documents", {}).get("value", 0)
 
-            # Process sentiment counts
-            sentiment_counts = {"positive": 0, "negative": 0, "neutral": 0}
-            sentiment_buckets = aggregations.get("sentiment_breakdown", {}).get(
-                "buckets", []
-            )
-            for bucket in sentiment_buckets:
-                sentiment = bucket["key"].lower()
-                if sentiment in sentiment_counts:
-                    sentiment_counts[sentiment] = bucket["doc_count"]
+        # Process sentiment counts
+        sentiment_counts = {"positive": 0, "negative": 0, "neutral": 0}
+        sentiment_buckets = aggregations.get("sentiment_breakdown", {}).get(
+            "buckets", []
+        )
+        for bucket in sentiment_buckets:
+            sentiment = bucket["key"].lower()
+            if sentiment in sentiment_counts:
+                sentiment_counts[sentiment] = bucket["doc_count"]
 
-            # Process top topics
-            top_topics = [
-                {"topic": bucket["key"], "count": bucket["doc_count"]}
-                for bucket in aggregations.get("top_topics", {}).get("buckets", [])
-            ]
+        # Process top topics
+        top_topics = [
+            {"topic": bucket["key"], "count": bucket["doc_count"]}
+            for bucket in aggregations.get("top_topics", {}).get("buckets", [])
+        ]
 
-            return {
-                "num_messages": total_docs,
-                "num_positive_messages": sentiment_counts["positive"],
-                "num_negative_messages": sentiment_counts["negative"],
-                "num_neutral_messages": sentiment_counts["neutral"],
-                "top_topics": top_topics,
-            }
+        return {
+            "num_messages": total_docs,
+            "num_positive_messages": sentiment_counts["positive"],
+            "num_negative_messages": sentiment_counts["negative"],
+            "num_neutral_messages": sentiment_counts["neutral"],
+            "top_topics": top_topics,
+        }
 
-        except Exception as e:
-            logger.error(f"Error fetching OpenSearch statistics: {str(e)}")
-            return self._get_default_stats()
+    def _build_query(self, filters: Optional[SearchFilters] = None) -> dict:
+        """Return a match_all query, or a bool filter query when filters are set."""
+        clauses = filters.to_clauses() if filters else []
+        if not clauses:
+            return {"match_all": {}}
+        return {"bool": {"filter": clauses}}
 
-    def _get_messages_query(self, page: int = 0, page_size: int = 100):
+    def _get_messages_query(
+        self,
+        page: int = 0,
+        page_size: int = 100,
+        filters: Optional[SearchFilters] = None,
+        search_after: Optional[list] = None,
+        pit: bool = False,
+    ):
         """
         Return the OpenSearch query for fetching messages with pagination.
 
         Args:
-            page: Page number (0-based)
+            page: Page number (0-based), ignored when search_after is given
             page_size: Number of items per page
+            filters: Optional sentiment/topic/product/created_at filters
+            search_after: Sort values of the last hit of the previous page
+            pit: The query runs against a point-in-time
         """
-        return {
+        query = {
             "size": page_size,
-            "from": page * page_size,
-            "query": {"match_all": {}},
-            "sort": [{"feedback_id": {"order": "desc"}}],
-            "_source": [
-                "feedback_id",
-                "feedback_text",
-                "sentiment",
-                "topics",
-                "product_name",
-                "media_urls",
-            ],
+            "query": self._build_query(filters),
+            "sort": MESSAGES_SORT + [PIT_TIEBREAKER] if pit else list(MESSAGES_SORT),
+            "_source": MESSAGE_SOURCE_FIELDS,
         }
+        if search_after is not None:
+            query["search_after"] = search_after
+        else:
+            query["from"] = page * page_size
+        return query
 
-    def get_dashboard_messages(self, page: int = 0, page_size: int = 100) -> dict:
-        """
-        Get messages from the feedback analysis index with pagination.
+    def _parse_messages(self, response: dict, page: int, page_size: int) -> dict:
+        """Transform a messages search response into a page of messages."""
+        hits = response.get("hits", {})
+        messages = [hit["_source"] for hit in hits.get("hits", [])]
 
-        Args:
-            page: Page number (0-based)
-            page_size: Number of items per page (default 100)
-
-        Returns:
-            dict containing:
-                - messages: List of message documents
-                - total: Total number of messages
-                - page: Current page number
-                - page_size: Number of items per page
-        """
-        try:
-            response = self.opensearch_client.search(
-                index=self.feedback_analysis_index,
-                body=self._get_messages_query(page, page_size),
-            )
-
-            hits = response.get("hits", {})
-            messages = [hit["_source"] for hit in hits.get("hits", [])]
-
-            return {
-                "messages": messages,
-                "total": hits.get("total", {}).get("value", 0),
-                "page": page,
-                "page_size": page_size,
-            }
-
-        except Exception as e:
-            logger.error(f"Error fetching OpenSearch messages: {str(e)}")
-            return {"messages": [], "total": 0, "page": page, "page_size": page_size}
+        return {
+            "messages": messages,
+            "total": hits.get("total", {}).get("value", 0),
+            "page": page,
+            "page_size": page_size,
+        }
 
     def _get_wordcount_query(self):
-        """Return the OpenSearch query for word count analysis with nested aggregation."""
+        """
+        Return the OpenSearch query for word count analysis with nested aggregation.
+        wordcount-analysis documents carry no product, sentiment, topic or date
+        fields, so it is never filtered; filtered top words come from the
+        word-count store.
+        """
         return {
             "size": 0,
             "aggs": {
@@ -170,6 +263,96 @@ class SearchService:
             },
         }
 
+    def _parse_wordcount_analysis(self, response: dict) -> dict:
+        """Transform a nested word count aggregation response into a word list."""
+        # Navigate through the aggregation response
+        buckets = (
+            response.get("aggregations", {})
+            .get("top_words", {})
+            .get("words", {})
+            .get("buckets", [])
+        )
+
+        # Transform buckets into word count list
+        word_counts = [
+            {"word": bucket["key"], "count": int(bucket["sum_count"]["value"])}
+            for bucket in buckets
+        ]
+
+        return {"words": word_counts}
+
+
+class SearchService(BaseSearchService):
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(SearchService, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        """Initialize OpenSearch client with configuration."""
+        from opensearchpy import OpenSearch
+
+        config = get_config()
+        self.opensearch_client = OpenSearch(
+            hosts=[config["OPENSEARCH_ENDPOINT"]],
+            http_auth=(config["OPENSEARCH_USERNAME"], config["OPENSEARCH_PASSWORD"]),
+            use_ssl=True,
+            verify_certs=True,
+            pool_maxsize=config["OPENSEARCH_POOL_MAXSIZE"],
+            timeout=config["OPENSEARCH_TIMEOUT"],
+        )
+
+    def get_dashboard_statistics(self, filters: Optional[SearchFilters] = None) -> dict:
+        """
+        Get statistics about documents in the feedback analysis index.
+        Returns counts for total documents, sentiment breakdowns, and top topics.
+        """
+        try:
+            response = self.opensearch_client.search(
+                index=self.feedback_analysis_index,
+                body=self._get_dashboard_query(filters),
+            )
+            return self._parse_dashboard_statistics(response)
+
+        except Exception as e:
+            logger.error(f"Error fetching OpenSearch statistics: {str(e)}")
+            return self._get_default_stats()
+
+    def get_dashboard_messages(
+        self,
+        page: int = 0,
+        page_size: int = 100,
+        filters: Optional[SearchFilters] = None,
+    ) -> dict:
+        """
+        Get messages from the feedback analysis index with pagination.
+
+        Args:
+            page: Page number (0-based)
+            page_size: Number of items per page (default 100)
+            filters: Optional sentiment/topic/product/created_at filters
+
+        Returns:
+            dict containing:
+                - messages: List of message documents
+                - total: Total number of messages
+                - page: Current page number
+                - page_size: Number of items per page
+        """
+        try:
+            response = self.opensearch_client.search(
+                index=self.feedback_analysis_index,
+                body=self._get_messages_query(page, page_size, filters),
+            )
+            return self._parse_messages(response, page, page_size)
+
+        except Exception as e:
+            logger.error(f"Error fetching OpenSearch messages: {str(e)}")
+            return {"messages": [], "total": 0, "page": page, "page_size": page_size}
+
     def get_wordcount_analysis(self) -> dict:
         """
         Get word count analysis from the wordcount-analysis index.
@@ -177,30 +360,472 @@ class SearchService:
         """
         try:
             response = self.opensearch_client.search(
-                index="wordcount-analysis", body=self._get_wordcount_query()
+                index=self.wordcount_analysis_index, body=self._get_wordcount_query()
+            )
+            return self._parse_wordcount_analysis(response)
+
+        except Exception as e:
+            logger.error(f"Error fetching word count analysis: {str(e)}")
+            return {"words": []}
+
+
+class AsyncSearchService(BaseSearchService):
+    """
+    Non-blocking variant of SearchService for use from async route handlers.
+
+    All instances share the worker's pooled AsyncOpenSearch client, which is
+    created by the app lifespan hook via init_async_search_client(). Aggregation
+    results go through a ResultCache, since the indices only change when the
+    analysis job runs.
+
+    With a rollover `index_period`, feedback queries that carry a created_at
+    range only search the period indices overlapping it.
+    """
+
+    def __init__(
+        self,
+        client: "AsyncOpenSearch",
+        cache: Optional[ResultCache] = None,
+        index_period: str = "none",
+        alias_cache_seconds: float = 60,
+    ):
+        self.opensearch_client = client
+        self.cache = cache or ResultCache(ttl_seconds=0)
+        self.feedback_index = RolloverIndex(self.feedback_analysis_index, index_period)
+        self.alias_resolver = AliasResolver(client, ttl_seconds=alias_cache_seconds)
+
+    async def _feedback_index_for(self, filters: Optional[SearchFilters]) -> str:
+        """Return the feedback indices to search, narrowed by the created_at range."""
+        if (
+            not self.feedback_index.rolls_over
+            or filters is None
+            or (filters.created_from is None and filters.created_to is None)
+        ):
+            return self.feedback_analysis_index
+        try:
+            indices = await self.alias_resolver.indices(self.feedback_index.read_alias)
+        except Exception as e:
+            logger.warning(f"Failed to resolve feedback indices: {str(e)}")
+            return self.feedback_analysis_index
+        selected = self.feedback_index.select(
+            indices, filters.created_from, filters.created_to
+        )
+        # An empty selection would mean "all indices" to OpenSearch, so fall
+        # back to the alias and let the range filter match nothing
+        if not selected or len(selected) == len(indices):
+            return self.feedback_analysis_index
+        return ",".join(selected)
+
+    async def _fetch_dashboard_statistics(
+        self, filters: Optional[SearchFilters] = None
+    ) -> dict:
+        index = await self._feedback_index_for(filters)
+        with SearchTimer("statistics") as timer:
+            response = await self.opensearch_client.search(
+                index=index, body=self._get_dashboard_query(filters)
+            )
+            timer.record(response)
+        return self._parse_dashboard_statistics(response)
+
+    async def get_dashboard_statistics(
+        self, filters: Optional[SearchFilters] = None
+    ) -> dict:
+        """
+        Get statistics about documents in the feedback analysis index.
+        Returns counts for total documents, sentiment breakdowns, and top topics.
+        """
+        filters = filters or SearchFilters()
+        try:
+            return await self.cache.get_or_load(
+                ("statistics", filters.cache_key()),
+                lambda: self._fetch_dashboard_statistics(filters),
+            )
+
+        except Exception as e:
+            logger.error(f"Error fetching OpenSearch statistics: {str(e)}")
+            return self._get_default_stats()
+
+    async def get_dashboard_messages(
+        self,
+        page: int = 0,
+        page_size: int = 100,
+        filters: Optional[SearchFilters] = None,
+        cursor: Optional[str] = None,
+        snapshot: bool = False,
+    ) -> dict:
+        """
+        Get messages from the feedback analysis index.
+
+        Without a cursor this returns `page` using from/size. Every response
+        carries a `next_cursor` backed by search_after, so callers can walk any
+        number of documents at constant cost per page. With `snapshot` the
+        walk runs against a point-in-time so it is unaffected by concurrent
+        indexing.
+
+        Args:
+            page: Page number (0-based) for the first request
+            page_size: Number of items per page (default 100)
+            filters: Optional sentiment/topic/product/created_at filters
+            cursor: Token from a previous response's next_cursor
+            snapshot: Open a point-in-time for consistent scrolling
+
+        A failed first page without `snapshot` degrades to an empty page.
+        Cursor and snapshot pages raise instead, so a failure is never
+        mistaken for the end of the walk.
+
+        Raises:
+            ValueError: If the cursor is malformed or was issued for other
+                filters or another page size.
+            CursorExpiredError: If the cursor's point-in-time has expired.
+        """
+        state = decode_cursor(cursor) if cursor else None
+        if state is not None and state.get("query") != cursor_fingerprint(
+            filters, page_size
+        ):
+            raise ValueError(
+                "cursor was issued for different filters or page_size; "
+                "repeat the original query parameters with it"
+            )
+        if state is not None or snapshot:
+            return await self._fetch_messages_page(
+                page, page_size, filters, state, snapshot
+            )
+        try:
+            return await self._fetch_messages_page(
+                page, page_size, filters, state, snapshot
             )
 
-            # Navigate through the aggregation response
-            buckets = (
-                response.get("aggregations", {})
-                .get("top_words", {})
-                .get("words", {})
-                .get("buckets", [])
+        except Exception as e:
+            logger.error(f"Error fetching OpenSearch messages: {str(e)}")
+            return {
+                "messages": [],
+                "total": 0,
+                "page": page,
+                "page_size": page_size,
+                "next_cursor": None,
+            }
+
+    async def _fetch_messages_page(
+        self,
+        page: int,
+        page_size: int,
+        filters: Optional[SearchFilters],
+        state: Optional[dict],
+        snapshot: bool,
+    ) -> dict:
+        search_after = state["search_after"] if state else None
+        pit_id = state.get("pit_id") if state else None
+        index = await self._feedback_index_for(filters)
+        opened_pit = None
+        if snapshot and state is None:
+            with SearchTimer("create_pit"):
+                pit = await self.opensearch_client.create_pit(
+                    index=index,
+                    params={"keep_alive": PIT_KEEP_ALIVE},
+                )
+            pit_id = opened_pit = pit["pit_id"]
+
+        body = self._get_messages_query(
+            page, page_size, filters, search_after, pit=pit_id is not None
+        )
+        # Count every match on the first page only; later pages reuse its total
+        body["track_total_hits"] = state is None
+        try:
+            with SearchTimer("messages") as timer:
+                if pit_id:
+                    body["pit"] = {"id": pit_id, "keep_alive": PIT_KEEP_ALIVE}
+                    response = await self.opensearch_client.search(body=body)
+                    pit_id = response.get("pit_id", pit_id)
+                else:
+                    response = await self.opensearch_client.search(
+                        index=index, body=body
+                    )
+                timer.record(response)
+        except Exception as e:
+            # No cursor will reference a snapshot opened for this request
+            if opened_pit:
+                await self._close_pit(opened_pit)
+            elif pit_id and _is_missing_pit(e):
+                raise CursorExpiredError(
+                    "the cursor's snapshot has expired; start a new walk"
+                ) from e
+            raise
+
+        result = self._parse_messages(response, page, page_size)
+        if state is not None:
+            result["total"] = state.get("total", result["total"])
+            # Cursor pages are not numbered
+            result["page"] = None
+
+        result["next_cursor"] = self._next_cursor(
+            response,
+            page_size,
+            result["total"],
+            pit_id,
+            cursor_fingerprint(filters, page_size),
+        )
+        if result["next_cursor"] is None and pit_id:
+            await self._close_pit(pit_id)
+        return result
+
+    def _next_cursor(
+        self,
+        response: dict,
+        page_size: int,
+        total: int,
+        pit_id: Optional[str] = None,
+        query: Optional[str] = None,
+    ) -> Optional[str]:
+        """Return the cursor for the page after `response`, or None if it was the last."""
+        hits = response.get("hits", {}).get("hits", [])
+        if len(hits) < page_size:
+            return None
+        next_state = {"search_after": hits[-1]["sort"], "total": total, "query": query}
+        if pit_id:
+            next_state["pit_id"] = pit_id
+        return encode_cursor(next_state)
+
+    async def iter_message_pages(
+        self, filters: Optional[SearchFilters] = None, batch_size: int = 1000
+    ) -> AsyncIterator[List[dict]]:
+        """
+        Yield every matching message document, one search_after page at a time.
+
+        The walk runs against a point-in-time, so memory stays bounded by
+        `batch_size` and the result is consistent regardless of index size.
+        """
+        index = await self._feedback_index_for(filters)
+        with SearchTimer("create_pit"):
+            pit = await self.opensearch_client.create_pit(
+                index=index, params={"keep_alive": PIT_KEEP_ALIVE}
             )
+        pit_id = pit["pit_id"]
+        search_after = None
+        try:
+            while True:
+                body = self._get_messages_query(
+                    page_size=batch_size,
+                    filters=filters,
+                    search_after=search_after,
+                    pit=True,
+                )
+                body.pop("from", None)
+                body["track_total_hits"] = False
+                body["pit"] = {"id": pit_id, "keep_alive": PIT_KEEP_ALIVE}
+                with SearchTimer("export") as timer:
+                    response = await self.opensearch_client.search(body=body)
+                    timer.record(response)
+                pit_id = response.get("pit_id", pit_id)
+
+                hits = response.get("hits", {}).get("hits", [])
+                if hits:
+                    yield [hit["_source"] for hit in hits]
+                if len(hits) < batch_size:
+                    break
+                search_after = hits[-1]["sort"]
+        finally:
+            await self._close_pit(pit_id)
+
+    async def _close_pit(self, pit_id: str) -> None:
+        """Release a point-in-time once its walk is finished."""
+        try:
+            with SearchTimer("delete_pit"):
+                await self.opensearch_client.delete_pit(body={"pit_id": [pit_id]})
+        except Exception as e:
+            logger.warning(f"Failed to delete point-in-time: {str(e)}")
 
-            # Transform buckets into word count list
-            word_counts = [
-                {"word": bucket["key"], "count": int(bucket["sum_count"]["value"])}
-                for bucket in buckets
-            ]
+    async def _fetch_wordcount_analysis(self) -> dict:
+        with SearchTimer("wordcount") as timer:
+            response = await self.opensearch_client.search(
+                index=self.wordcount_analysis_index, body=self._get_wordcount_query()
+            )
+            timer.record(response)
+        return self._parse_wordcount_analysis(response)
 
-            return {"words": word_counts}
+    async def get_wordcount_analysis(self) -> dict:
+        """
+        Get word count analysis from the wordcount-analysis index.
+        Returns the top words with their summed counts in descending order.
+        """
+        try:
+            return await self.cache.get_or_load(
+                ("wordcount",), self._fetch_wordcount_analysis
+            )
 
         except Exception as e:
             logger.error(f"Error fetching word count analysis: {str(e)}")
             return {"words": []}
 
+    async def get_dashboard_overview(
+        self,
+        filters: Optional[SearchFilters] = None,
+        page_size: int = 100,
+        include_wordcount: bool = True,
+    ) -> dict:
+        """
+        Get statistics, word counts and the first messages page in one
+        `_msearch` round-trip. Aggregations still fresh in the cache are not
+        re-queried, and fresh results are stored back.
+
+        Each section degrades independently: a failed sub-query yields that
+        section's empty default and its name in `errors`. Word counts are
+        unfiltered (see _get_wordcount_query), so callers only include them
+        for unfiltered overviews.
+        """
+        filters = filters or SearchFilters()
+        stats_key = ("statistics", filters.cache_key())
+        wordcount_key = ("wordcount",)
+
+        overview = {
+            "statistics": await self.cache.peek(stats_key),
+            "words": None,
+            "messages": None,
+            "errors": [],
+        }
+        if include_wordcount:
+            cached_words = await self.cache.peek(wordcount_key)
+            overview["words"] = cached_words["words"] if cached_words else None
+
+        messages_body = self._get_messages_query(0, page_size, filters)
+        messages_body["track_total_hits"] = True
+        feedback_index = await self._feedback_index_for(filters)
+        searches = {"messages": (feedback_index, messages_body)}
+        if overview["statistics"] is None:
+            searches["statistics"] = (
+                feedback_index,
+                self._get_dashboard_query(filters),
+            )
+        if include_wordcount and overview["words"] is None:
+            searches["words"] = (
+                self.wordcount_analysis_index,
+                self._get_wordcount_query(),
+            )
+
+        body = []
+        for index, search_body in searches.values():
+            body.extend([{"index": index}, search_body])
+        try:
+            with SearchTimer("overview") as timer:
+                response = await self.opensearch_client.msearch(body=body)
+                timer.record(response)
+            responses = response["responses"]
+        except Exception as e:
+            logger.error(f"Error fetching OpenSearch overview: {str(e)}")
+            responses = [{"error": str(e)}] * len(searches)
+
+        for section, response in zip(searches, responses):
+            if "error" in response:
+                logger.error(f"Overview section {section} failed: {response['error']}")
+                overview["errors"].append(section)
+            elif section == "statistics":
+                overview["statistics"] = self._parse_dashboard_statistics(response)
+                await self.cache.put(stats_key, overview["statistics"])
+            elif section == "words":
+                wordcount = self._parse_wordcount_analysis(response)
+                overview["words"] = wordcount["words"]
+                await self.cache.put(wordcount_key, wordcount)
+            else:
+                messages = self._parse_messages(response, 0, page_size)
+                messages["next_cursor"] = self._next_cursor(
+                    response,
+                    page_size,
+                    messages["total"],
+                    query=cursor_fingerprint(filters, page_size),
+                )
+                overview["messages"] = messages
+
+        if overview["statistics"] is None:
+            overview["statistics"] = self._get_default_stats()
+        if include_wordcount and overview["words"] is None:
+            overview["words"] = []
+        if overview["messages"] is None:
+            overview["messages"] = {
+                "messages": [],
+                "total": 0,
+                "page": 0,
+                "page_size": page_size,
+                "next_cursor": None,
+            }
+        return overview
+
+
+_async_client: Optional["AsyncOpenSearch"] = None
+_async_service: Optional[AsyncSearchService] = None
+
+
+def _create_async_client(config: dict) -> "AsyncOpenSearch":
+    """Build a connection-pooled AsyncOpenSearch client."""
+    # opensearch-py and aiohttp take a third of import time; load them on first use
+    from opensearchpy import AsyncOpenSearch
+
+    return AsyncOpenSearch(
+        hosts=[config["OPENSEARCH_ENDPOINT"]],
+        http_auth=(config["OPENSEARCH_USERNAME"], config["OPENSEARCH_PASSWORD"]),
+        use_ssl=True,
+        verify_certs=True,
+        maxsize=config["OPENSEARCH_POOL_MAXSIZE"],
+        timeout=config["OPENSEARCH_TIMEOUT"],
+    )
+
+
+async def init_async_search_client(
+    config: Optional[dict] = None,
+) -> "AsyncOpenSearch":
+    """
+    Create the worker-wide AsyncOpenSearch client. Called from the app
+    lifespan, so no request pays for the import and construction.
+    """
+    global _async_client, _async_service
+    if _async_client is None:
+        config = config or get_config()
+        _async_client = _create_async_client(config)
+        cache = ResultCache(
+            ttl_seconds=config["SEARCH_CACHE_TTL_SECONDS"],
+            stale_seconds=config["SEARCH_CACHE_STALE_SECONDS"],
+            backend=create_cache_backend(config),
+            lease_seconds=config["OPENSEARCH_TIMEOUT"],
+        )
+        _async_service = AsyncSearchService(
+            _async_client,
+            cache=cache,
+            index_period=config["FEEDBACK_INDEX_PERIOD"],
+            alias_cache_seconds=config["INDEX_ALIAS_CACHE_SECONDS"],
+        )
+        logger.info("Async OpenSearch client initialized")
+    return _async_client
+
+
+async def close_async_search_client() -> None:
+    """Close the worker-wide AsyncOpenSearch client and release its connections."""
+    global _async_client, _async_service
+    if _async_client is not None:
+        try:
+            _async_service.cache.backend.close()
+            await _async_client.close()
+            logger.info("Async OpenSearch client closed")
+        except Exception as e:
+            logger.error(f"Error closing async OpenSearch client: {str(e)}")
+        finally:
+            _async_client = None
+            _async_service = None
+
 
 def get_search_service() -> SearchService:
     """Dependency function to get SearchService instance."""
     return SearchService()
+
+
+async def get_async_search_service() -> AsyncSearchService:
+    """Dependency function to get the AsyncSearchService for this worker."""
+    if _async_service is None:
+        # Only without the lifespan (e.g. scripts). No await before the client
+        # is assigned, so concurrent callers cannot create two clients
+        await init_async_search_client()
+    return _async_service
+
+
+async def get_search_cache_stats() -> Optional[dict]:
+    """Counters of this worker's search result cache, or None before it exists."""
+    if _async_service is None:
+        return None
+    return await _async_service.cache.stats()
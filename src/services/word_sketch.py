@@ -0,0 +1,254 @@
+"""
+Streaming heavy-hitters sketch for approximate top-K word counts.
+
+A Count-Min Sketch of `width` x `depth` counters estimates every word's
+frequency in fixed memory; a bounded candidate table keeps the `capacity`
+words with the highest estimates. With N total words counted, each estimate
+is never below the true count and, with probability at least 1 - e^-depth,
+exceeds it by at most (e / width) * N. Sketches with the same dimensions
+merge by adding counters, so sketches of consecutive feedback id ranges
+(say, built by separate workers) can be combined.
+"""
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import heapq
+import json
+import math
+import os
+import time
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class HeavyHitters:
+    def __init__(self, width: int = 16384, depth: int = 4, capacity: int = 200):
+        self.width = width
+        self.depth = depth
+        self.capacity = capacity
+        self.total = 0
+        # Feedback ids counted are those in (from_id, through_id]; through_id
+        # lets replayed batches be skipped, and both decide what may merge
+        self.from_id = 0
+        self.through_id = 0
+        self.counters = array("q", bytes(8 * width * depth))
+        self.candidates: Dict[str, int] = {}
+        # One (estimate, word) entry per candidate, see _weakest()
+        self._heap: List[Tuple[int, str]] = []
+
+    @property
+    def epsilon(self) -> float:
+        return math.e / self.width
+
+    @property
+    def delta(self) -> float:
+        return math.exp(-self.depth)
+
+    @property
+    def error_bound(self) -> int:
+        """Maximum overestimate of any count, with probability 1 - delta."""
+        return math.ceil(self.epsilon * self.total)
+
+    def _rebuild_heap(self) -> None:
+        self._heap = [(estimate, word) for word, estimate in self.candidates.items()]
+        heapq.heapify(self._heap)
+
+    def _weakest(self) -> Tuple[int, str]:
+        """
+        Return the candidate with the lowest estimate. Estimates only grow, so
+        a heap entry may understate its candidate but never overstate it; it
+        is refreshed lazily once it reaches the top.
+        """
+        while True:
+            estimate, word = self._heap[0]
+            current = self.candidates[word]
+            if current == estimate:
+                return estimate, word
+            heapq.heapreplace(self._heap, (current, word))
+
+    def _cells(self, word: str) -> List[int]:
+        # Stable across processes (unlike hash()) so sketches can be merged
+        digest = hashlib.blake2b(word.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [
+            row * self.width + (h1 + row * h2) % self.width for row in range(self.depth)
+        ]
+
+    def estimate(self, word: str) -> int:
+        return min(self.counters[cell] for cell in self._cells(word))
+
+    def add(self, word: str, count: int = 1) -> None:
+        cells = self._cells(word)
+        for cell in cells:
+            self.counters[cell] += count
+        self.total += count
+        self._offer(word, min(self.counters[cell] for cell in cells))
+
+    def update(self, words: Iterable[str]) -> None:
+        """Count many words, hashing each distinct word once."""
+        for word, count in Counter(words).items():
+            self.add(word, count)
+
+    def _offer(self, word: str, estimate: int) -> None:
+        if word in self.candidates:
+            self.candidates[word] = estimate
+            return
+        if len(self.candidates) < self.capacity:
+            self.candidates[word] = estimate
+            heapq.heappush(self._heap, (estimate, word))
+            return
+        weakest_estimate, weakest = self._weakest()
+        if estimate > weakest_estimate:
+            del self.candidates[weakest]
+            self.candidates[word] = estimate
+            heapq.heapreplace(self._heap, (estimate, word))
+
+    def top(self, k: int) -> List[dict]:
+        """Return the k words with the highest estimated counts."""
+        ranked = sorted(self.candidates.items(), key=lambda item: (-item[1], item[0]))
+        return [{"word": word, "count": count} for word, count in ranked[:k]]
+
+    @property
+    def is_empty(self) -> bool:
+        return self.from_id == self.through_id
+
+    def merge(self, other: "HeavyHitters") -> None:
+        """
+        Add another sketch's counts into this one. The two must cover
+        adjacent id ranges, in either order, so the merged sketch covers one
+        contiguous range and through_id still means every id up to it was
+        counted. Overlapping ranges would count ids twice, and a gap would
+        make the stage skip ids neither sketch counted.
+        """
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("Cannot merge sketches with different dimensions")
+        if other.is_empty:
+            return
+        if self.is_empty:
+            from_id, through_id = other.from_id, other.through_id
+        elif self.through_id == other.from_id:
+            from_id, through_id = self.from_id, other.through_id
+        elif other.through_id == self.from_id:
+            from_id, through_id = other.from_id, self.through_id
+        else:
+            raise ValueError(
+                f"Cannot merge sketches of ids ({self.from_id}, {self.through_id}] "
+                f"and ({other.from_id}, {other.through_id}]: the ranges must be "
+                "adjacent"
+            )
+        for i, value in enumerate(other.counters):
+            if value:
+                self.counters[i] += value
+        self.total += other.total
+        self.from_id, self.through_id = from_id, through_id
+        for word in set(self.candidates) | set(other.candidates):
+            self._offer(word, self.estimate(word))
+        # Re-read every candidate against the merged counters
+        self.candidates = {word: self.estimate(word) for word in self.candidates}
+        self._rebuild_heap()
+
+    def to_dict(self) -> dict:
+        return {
+            "width": self.width,
+            "depth": self.depth,
+            "capacity": self.capacity,
+            "total": self.total,
+            "from_id": self.from_id,
+            "through_id": self.through_id,
+            "counters": base64.b64encode(self.counters.tobytes()).decode(),
+            "candidates": self.candidates,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HeavyHitters":
+        sketch = cls(data["width"], data["depth"], data["capacity"])
+        sketch.total = data["total"]
+        sketch.from_id = data.get("from_id", 0)
+        sketch.through_id = data.get("through_id", 0)
+        sketch.counters = array("q")
+        sketch.counters.frombytes(base64.b64decode(data["counters"]))
+        sketch.candidates = dict(data["candidates"])
+        sketch._rebuild_heap()
+        return sketch
+
+    def save(self, path: str) -> None:
+        """Write a gzipped snapshot atomically (write then rename)."""
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with gzip.open(tmp_path, "wt") as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "HeavyHitters":
+        with gzip.open(path, "rt") as f:
+            return cls.from_dict(json.load(f))
+
+    @classmethod
+    def load_or_create(cls, path: str, **kwargs) -> "HeavyHitters":
+        if os.path.exists(path):
+            return cls.load(path)
+        return cls(**kwargs)
+
+
+class SketchReader:
+    """
+    Serves top-K from the snapshot on disk, reloading it when the file changes.
+    The modification time is checked at most once per `check_interval`, and
+    the reload runs in a thread so it does not block the event loop.
+    """
+
+    def __init__(self, path: str, check_interval: float = 1.0):
+        self.path = path
+        self.check_interval = check_interval
+        self._sketch: Optional[HeavyHitters] = None
+        self._mtime = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> Optional[HeavyHitters]:
+        if time.monotonic() - self._checked_at >= self.check_interval:
+            # Concurrent requests wait for one reload instead of starting more
+            async with self._lock:
+                if time.monotonic() - self._checked_at >= self.check_interval:
+                    await asyncio.to_thread(self._reload)
+                    self._checked_at = time.monotonic()
+        return self._sketch
+
+    def _reload(self) -> None:
+        try:
+            mtime = os.stat(self.path).st_mtime
+            if mtime != self._mtime:
+                self._sketch = HeavyHitters.load(self.path)
+                self._mtime = mtime
+        except FileNotFoundError:
+            self._sketch, self._mtime = None, None
+        except Exception as e:
+            logger.error(f"Failed to load word sketch snapshot: {str(e)}")
+
+    async def top_words(self, k: int) -> dict:
+        """Return top words in the wordcount dashboard shape, plus its error bound."""
+        sketch = await self.get()
+        if sketch is None:
+            return {"words": [], "error_bound": 0}
+        return {"words": sketch.top(k), "error_bound": sketch.error_bound}
+
+
+_reader: Optional[SketchReader] = None
+
+
+def get_sketch_reader() -> SketchReader:
+    """Return the per-worker reader for the snapshot at WORD_SKETCH_PATH."""
+    global _reader
+    if _reader is None:
+        from config import get_config
+
+        _reader = SketchReader(get_config()["WORD_SKETCH_PATH"])
+    return _reader
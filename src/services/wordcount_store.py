@@ -0,0 +1,115 @@
+"""
+Incremental word-frequency store.
+
+Word counts are accumulated as feedback is processed (see
+src/jobs/wordcount_stage.py) into `word_totals` and `word_daily_counts`, so
+top-N reads are an index scan instead of a nested aggregation over every
+`word_counts` entry in OpenSearch.
+"""
+
+from collections import Counter
+from datetime import date, datetime, timezone
+from typing import Iterable, Optional, Tuple
+
+from sqlalchemy import desc, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.word_count import WordDailyCount, WordTotal
+from src.utils.tokenizer import tokenize_words
+
+# Words returned by the wordcount dashboard
+WORDCOUNT_TOP_N = 15
+
+
+def utc_day(moment: datetime) -> date:
+    """Return the UTC calendar day of `moment`; naive values are taken as UTC."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).date()
+
+
+def count_words(rows: Iterable[dict]) -> Tuple[Counter, Counter]:
+    """
+    Count words in feedback rows.
+    Returns (totals by word, counts by (day, product_name, word)).
+    """
+    totals = Counter()
+    daily = Counter()
+    for row in rows:
+        created_at = row.get("created_at") or datetime.now(timezone.utc)
+        day = utc_day(created_at)
+        product_name = row.get("product_name") or ""
+        for word in tokenize_words(row.get("feedback_text") or ""):
+            totals[word] += 1
+            daily[(day, product_name, word)] += 1
+    return totals, daily
+
+
+def apply_word_counts(session, totals: Counter, daily: Counter) -> None:
+    """
+    Add counts to the store within the caller's transaction.
+    Rows are upserted in key order so concurrent writers cannot deadlock.
+    """
+    if totals:
+        stmt = insert(WordTotal).values(
+            [{"word": word, "count": totals[word]} for word in sorted(totals)]
+        )
+        session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["word"],
+                set_={"count": WordTotal.count + stmt.excluded.count},
+            )
+        )
+    if daily:
+        stmt = insert(WordDailyCount).values(
+            [
+                {"day": day, "product_name": product, "word": word, "count": count}
+                for (day, product, word), count in sorted(daily.items())
+            ]
+        )
+        session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["day", "product_name", "word"],
+                set_={"count": WordDailyCount.count + stmt.excluded.count},
+            )
+        )
+
+
+async def get_top_words(
+    db: AsyncSession,
+    limit: int = WORDCOUNT_TOP_N,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    product_name: Optional[str] = None,
+) -> dict:
+    """
+    Return the top `limit` words in the same shape as
+    SearchService.get_wordcount_analysis().
+
+    Unfiltered reads walk the `word_totals` count index; date or product
+    filters sum the matching `word_daily_counts` rows.
+    """
+    if start_date is None and end_date is None and product_name is None:
+        query = (
+            select(WordTotal.word, WordTotal.count)
+            .order_by(desc(WordTotal.count), WordTotal.word)
+            .limit(limit)
+        )
+    else:
+        total = func.sum(WordDailyCount.count).label("count")
+        query = select(WordDailyCount.word, total)
+        if start_date is not None:
+            query = query.where(WordDailyCount.day >= start_date)
+        if end_date is not None:
+            query = query.where(WordDailyCount.day <= end_date)
+        if product_name is not None:
+            query = query.where(WordDailyCount.product_name == product_name)
+        query = (
+            query.group_by(WordDailyCount.word)
+            .order_by(desc(total), WordDailyCount.word)
+            .limit(limit)
+        )
+
+    result = await db.execute(query)
+    return {"words": [{"word": row[0], "count": int(row[1])} for row in result]}
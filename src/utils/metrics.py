@@ -0,0 +1,127 @@
+"""
+Prometheus metrics for request latency and backend calls.
+
+Each gunicorn worker records into its own files under PROMETHEUS_MULTIPROC_DIR
+(set before the app starts, wiped by gunicorn.conf.py on boot), and /metrics
+merges them, so a scrape sees the whole host whichever worker answers.
+Without that variable the metrics are kept in memory for the single process.
+"""
+
+import os
+import time
+from typing import Optional
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+
+# Metric values are written to files here on first use, which fails if the
+# directory is missing (e.g. in a job run before gunicorn creates it)
+if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+    os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+# Pool checkouts are usually sub-millisecond, so add finer buckets below 5ms
+POOL_WAIT_BUCKETS = (0.0005, 0.001, 0.0025) + Histogram.DEFAULT_BUCKETS
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time to serve a request, by route template and status code.",
+    ["method", "route", "status"],
+)
+SEARCH_REQUEST_DURATION = Histogram(
+    "opensearch_request_duration_seconds",
+    "Wall time of OpenSearch calls, including network and client overhead.",
+    ["operation"],
+)
+SEARCH_TOOK = Histogram(
+    "opensearch_took_seconds",
+    "Time OpenSearch reports spending on a search (the `took` field).",
+    ["operation"],
+)
+DB_POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Time to check out a database connection from the pool.",
+    ["engine"],
+    buckets=POOL_WAIT_BUCKETS,
+)
+CACHE_EVENTS = Counter(
+    "cache_events_total",
+    "Cache hits, misses and other events, by cache.",
+    ["cache", "event"],
+)
+
+
+class SearchTimer:
+    """
+    Times one OpenSearch call into SEARCH_REQUEST_DURATION; `record(response)`
+    adds the server-side `took` so the two can be compared.
+
+        with SearchTimer("statistics") as timer:
+            response = await client.search(...)
+            timer.record(response)
+    """
+
+    def __init__(self, operation: str):
+        self.operation = operation
+
+    def __enter__(self) -> "SearchTimer":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        SEARCH_REQUEST_DURATION.labels(self.operation).observe(
+            time.perf_counter() - self.started
+        )
+
+    def record(self, response: Optional[dict]) -> None:
+        took = (response or {}).get("took")
+        if took is not None:
+            SEARCH_TOOK.labels(self.operation).observe(took / 1000)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording HTTP_REQUEST_DURATION for every HTTP request."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # The matched route template, so /topic/{topic_id} is one series
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.labels(
+                scope["method"],
+                route.path if route is not None else "unmatched",
+                str(status),
+            ).observe(time.perf_counter() - started)
+
+
+def render_metrics() -> tuple:
+    """Return (body, content type) for the /metrics endpoint."""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
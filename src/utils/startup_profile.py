@@ -0,0 +1,164 @@
+"""
+Startup profiling: per-module import times and init-phase timings of a
+worker boot, for tracking boot regressions in CI.
+
+With STARTUP_PROFILE=true the app records its init phases through `phase()`.
+Running this module boots the app in a child interpreter under
+`python -X importtime`, runs its lifespan, and reports the phases along with
+the slowest imports, both per top-level package (self time, so nothing is
+counted twice) and per module (cumulative):
+
+Usage:
+    python -m src.utils.startup_profile --top 20
+    python -m src.utils.startup_profile --json startup.json --budget-seconds 2.5
+
+With --budget-seconds the exit status is 1 when the boot takes longer.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, List
+
+ENABLED = os.getenv("STARTUP_PROFILE", "false").lower() == "true"
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_phases: Dict[str, float] = {}
+
+# Run in the child: import the app, run its lifespan, print timings as JSON
+BOOT_SCRIPT = """
+import asyncio, json, time
+started = time.perf_counter()
+import app
+imported = time.perf_counter() - started
+import config
+from src.utils import startup_profile
+
+
+async def lifespan():
+    async with app.app.router.lifespan_context(app.app):
+        pass
+
+
+with startup_profile.phase("lifespan"):
+    asyncio.run(lifespan())
+print(json.dumps({
+    "import_seconds": imported,
+    "total_seconds": time.perf_counter() - started,
+    "config": config.load_report,
+    "phases": startup_profile.phases(),
+}))
+"""
+
+
+@contextmanager
+def phase(name: str):
+    """Record how long an init phase takes when profiling is enabled."""
+    if not ENABLED:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _phases[name] = round(time.perf_counter() - started, 4)
+
+
+def phases() -> Dict[str, float]:
+    """Seconds per recorded phase, in the order they ran."""
+    return dict(_phases)
+
+
+def parse_importtime(output: str) -> List[dict]:
+    """Parse `-X importtime` lines into {module, self_us, cumulative_us}."""
+    modules = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        modules.append(
+            {
+                "module": fields[2].strip(),
+                "self_us": int(fields[0]),
+                "cumulative_us": int(fields[1]),
+            }
+        )
+    return modules
+
+
+def profile_startup(top: int = 20) -> dict:
+    """Boot the app in a child interpreter and return its timings."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", BOOT_SCRIPT],
+        cwd=ROOT,
+        env={**os.environ, "STARTUP_PROFILE": "true"},
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"App failed to boot:\n{result.stderr[-4000:]}")
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+
+    modules = parse_importtime(result.stderr)
+    packages = defaultdict(int)
+    for module in modules:
+        packages[module["module"].split(".")[0]] += module["self_us"]
+    report["packages"] = [
+        {"package": name, "seconds": round(us / 1e6, 4)}
+        for name, us in sorted(packages.items(), key=lambda item: -item[1])[:top]
+    ]
+    slowest = sorted(modules, key=lambda module: -module["cumulative_us"])[:top]
+    report["modules"] = [
+        {"module": module["module"], "seconds": round(module["cumulative_us"] / 1e6, 4)}
+        for module in slowest
+    ]
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile app import and startup")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--json", default=None, help="Also write the report here")
+    parser.add_argument("--budget-seconds", type=float, default=None)
+    args = parser.parse_args()
+
+    report = profile_startup(args.top)
+    print(
+        f"Boot took {report['total_seconds']:.3f}s "
+        f"(imports {report['import_seconds']:.3f}s)"
+    )
+    print(
+        f"Config loaded in {report['config'].get('seconds', 0):.3f}s "
+        f"(secrets: {report['config'].get('method')})"
+    )
+    print("\nPhases:")
+    for name, seconds in report["phases"].items():
+        print(f"  {seconds:>8.3f}s  {name}")
+    print("\nImport time by package (self):")
+    for entry in report["packages"]:
+        print(f"  {entry['seconds']:>8.3f}s  {entry['package']}")
+    print("\nSlowest modules (cumulative):")
+    for entry in report["modules"]:
+        print(f"  {entry['seconds']:>8.3f}s  {entry['module']}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    if (
+        args.budget_seconds is not None
+        and report["total_seconds"] > args.budget_seconds
+    ):
+        print(f"\nBoot exceeded the {args.budget_seconds:.3f}s budget", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
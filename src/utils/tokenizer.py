@@ -0,0 +1,52 @@
+"""
+Text tokenization shared by analysis and word counting
+"""
+
+import re
+from typing import List
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9']+")
+
+# Longest token kept by tokenize_words; longer ones are usually URLs or noise
+MAX_WORD_LENGTH = 50
+
+STOPWORDS = frozenset(
+    """
+    a about above after again against all am an and any are aren't as at be
+    because been before being below between both but by can can't cannot could
+    couldn't did didn't do does doesn't doing don't down during each few for
+    from further get got had hadn't has hasn't have haven't having he her here
+    hers herself him himself his how i i'm i've if in into is isn't it it's its
+    itself just let's me more most mustn't my myself no nor not of off on once
+    only or other ought our ours ourselves out over own same shan't she should
+    shouldn't so some such than that that's the their theirs them themselves
+    then there there's these they they're this those through to too under until
+    up very was wasn't we we're were weren't what what's when where which while
+    who whom why will with won't would wouldn't you you're your yours yourself
+    yourselves also im u ur pls please
+    """.split()
+)
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase and collapse whitespace."""
+    return " ".join((text or "").lower().split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens, dropping punctuation."""
+    return [token.strip("'") for token in TOKEN_PATTERN.findall(normalize_text(text))]
+
+
+def tokenize_words(text: str, min_length: int = 2) -> List[str]:
+    """
+    Tokenize for word counting: drops stopwords, bare numbers, and tokens
+    shorter than `min_length` or longer than MAX_WORD_LENGTH.
+    """
+    return [
+        token
+        for token in tokenize(text)
+        if min_length <= len(token) <= MAX_WORD_LENGTH
+        and token not in STOPWORDS
+        and not token.isdigit()
+    ]
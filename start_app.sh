@@ -13,5 +13,6 @@ while IFS= read -r line; do
   fi
 done < .env
 
-# Start the FastAPI application
-uvicorn app:app --host 0.0.0.0 --port 8100 --reload 
\ No newline at end of file
+# Start the FastAPI application (settings in gunicorn.conf.py; for a
+# development server with auto-reload use `uvicorn app:app --reload`)
+exec gunicorn -c gunicorn.conf.py --bind 0.0.0.0:8100 app:app
@@ -0,0 +1,108 @@
+from typing import List, Sequence
+
+from src.jobs.analysis_stage import AnalysisStage
+from src.services.analysis_memo import AnalysisMemo, text_hash, topic_set_version
+from src.services.analysis_service import (
+    AnalysisResult,
+    FeedbackClassifier,
+    TopicLabel,
+)
+
+
+class RecordingClassifier(FeedbackClassifier):
+    name = "recording"
+
+    def __init__(self):
+        self.calls: List[List[str]] = []
+
+    async def classify(
+        self, texts: Sequence[str], topics: Sequence[TopicLabel]
+    ) -> List[AnalysisResult]:
+        self.calls.append(list(texts))
+        return [AnalysisResult(sentiment=f"s:{text}") for text in texts]
+
+
+class DictMemo:
+    """In-memory stand-in for AnalysisMemo."""
+
+    def __init__(self):
+        self.rows = {}
+
+    def lookup(self, hashes):
+        hashes = list(hashes)
+        assert None not in hashes
+        return {key: self.rows[key] for key in hashes if key in self.rows}
+
+    def store(self, results):
+        assert None not in results
+        self.rows.update(results)
+
+
+def test_text_hash_ignores_case_whitespace_and_punctuation():
+    assert text_hash("Good!!") == text_hash("  good ")
+    assert text_hash("Great service") != text_hash("Great services")
+
+
+def test_text_hash_keeps_non_latin_text_apart():
+    assert text_hash("Отлично") is not None
+    assert text_hash("Отлично") != text_hash("Ужасно")
+    assert text_hash("ОТЛИЧНО!") == text_hash("отлично")
+    assert text_hash("很好") != text_hash("很差")
+
+
+def test_text_hash_is_none_without_words():
+    assert text_hash("") is None
+    assert text_hash("👍") is None
+    assert text_hash(" ?! ") is None
+
+
+def test_topic_set_version_changes_with_topics():
+    topics = [TopicLabel("delivery"), TopicLabel("price", "cost")]
+    assert topic_set_version(topics, "a") == topic_set_version(topics[::-1], "a")
+    assert topic_set_version(topics, "a") != topic_set_version(topics[:1], "a")
+    assert topic_set_version(topics, "a") != topic_set_version(topics, "b")
+
+
+def test_store_skips_fallback_results():
+    opened = []
+
+    def session_factory():
+        opened.append(True)
+        raise AssertionError("no session expected")
+
+    memo = AnalysisMemo(session_factory, "v")
+    memo.store({"a": AnalysisResult(sentiment="neutral", fallback=True)})
+    assert opened == []
+
+
+def test_stage_classifies_unhashable_texts_without_memo():
+    classifier = RecordingClassifier()
+    memo = DictMemo()
+    stage = AnalysisStage(classifier, topics=[], memo=memo)
+    try:
+        rows = [
+            {"feedback_text": "👍"},
+            {"feedback_text": "Отлично"},
+            {"feedback_text": "👎"},
+            {"feedback_text": "отлично!"},
+            {"feedback_text": "Ужасно"},
+        ]
+        docs = [{} for _ in rows]
+        stage.enrich(rows, docs)
+
+        assert [doc["sentiment"] for doc in docs] == [
+            "s:👍",
+            "s:Отлично",
+            "s:👎",
+            "s:Отлично",
+            "s:Ужасно",
+        ]
+        assert sorted(classifier.calls[0]) == sorted(["Отлично", "Ужасно", "👍", "👎"])
+        assert len(memo.rows) == 2
+
+        docs = [{} for _ in rows]
+        stage.enrich(rows, docs)
+        assert sorted(classifier.calls[1]) == ["👍", "👎"]
+        assert stage.counters["memo_hits"] == 2
+    finally:
+        stage.close()
@@ -0,0 +1,95 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from src.services.analysis_service import (
+    KeywordClassifier,
+    OpenAIClassifier,
+    TopicLabel,
+)
+
+TOPICS = [TopicLabel("delivery time"), TopicLabel("price")]
+
+
+class FakeCompletions:
+    """Answers every request with the next queued reply (an exception raises)."""
+
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.requests = []
+
+    async def create(self, **kwargs):
+        self.requests.append(kwargs)
+        reply = self.replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        message = SimpleNamespace(content=json.dumps(reply))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def openai_classifier(replies, **kwargs):
+    classifier = OpenAIClassifier(api_key="test", **kwargs)
+    completions = FakeCompletions(replies)
+    classifier.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return classifier, completions
+
+
+def test_keyword_sentiment_and_negation():
+    classifier = KeywordClassifier()
+    assert classifier.classify_one("Great service", []).sentiment == "positive"
+    assert classifier.classify_one("not good at all", []).sentiment == "negative"
+    assert classifier.classify_one("The parcel arrived", []).sentiment == "neutral"
+
+
+def test_keyword_topics_need_every_word():
+    classifier = KeywordClassifier()
+    result = classifier.classify_one("Delivery times were late, fair prices", TOPICS)
+    assert result.topics == ["delivery time", "price"]
+    assert classifier.classify_one("Delivery was late", TOPICS).topics == []
+
+
+def test_openai_results_are_mapped_and_filtered():
+    classifier, completions = openai_classifier(
+        [
+            {
+                "results": [
+                    {"i": 1, "sentiment": "Negative", "topics": ["price", "unknown"]},
+                    {"i": 0, "sentiment": "positive", "topics": "price"},
+                ]
+            }
+        ]
+    )
+    results = asyncio.run(classifier.classify(["great", "too expensive"], TOPICS))
+    assert [(r.sentiment, r.topics, r.fallback) for r in results] == [
+        ("positive", [], False),
+        ("negative", ["price"], False),
+    ]
+    assert len(completions.requests) == 1
+
+
+def test_unanswered_items_use_the_fallback():
+    classifier, _ = openai_classifier(
+        [{"results": [{"i": 0, "sentiment": "neutral"}, {"i": 7, "sentiment": "x"}]}]
+    )
+    results = asyncio.run(classifier.classify(["ok", "terrible price"], TOPICS))
+    assert (results[0].sentiment, results[0].fallback) == ("neutral", False)
+    assert (results[1].sentiment, results[1].topics) == ("negative", ["price"])
+    assert results[1].fallback
+
+
+def test_failed_batches_fall_back_and_keep_order():
+    classifier, completions = openai_classifier(
+        [
+            RuntimeError("rate limited"),
+            {"results": [{"i": 0, "sentiment": "neutral", "topics": []}]},
+        ],
+        batch_size=2,
+        concurrency=1,
+    )
+    results = asyncio.run(classifier.classify(["love it", "bad", "fine"], TOPICS))
+    assert [(r.sentiment, r.fallback) for r in results] == [
+        ("positive", True),
+        ("negative", True),
+        ("neutral", False),
+    ]
+    assert len(completions.requests) == 2
@@ -0,0 +1,57 @@
+import json
+
+import pytest
+from cryptography.fernet import Fernet
+
+import config
+from config import REQUIRED_SECRETS, SECRET_KEYS, fetch_secrets, get_aws_secrets
+
+ALL_NAMES = sorted(set(SECRET_KEYS.values()))
+
+
+class StubSecretsClient:
+    def __init__(self, values: dict):
+        self.values = values
+
+    def get_secret_value(self, SecretId):
+        return {"SecretString": json.dumps(self.values)}
+
+
+@pytest.fixture
+def json_secret(monkeypatch, tmp_path):
+    monkeypatch.setenv("AWS_SECRETS_JSON_ID", "app/secrets")
+    monkeypatch.setenv("SECRETS_CACHE_PATH", str(tmp_path / "secrets.cache"))
+    monkeypatch.setenv("SECRETS_CACHE_KEY", Fernet.generate_key().decode())
+
+    def use(values):
+        client = StubSecretsClient(values)
+        monkeypatch.setattr(config, "get_secrets_client", lambda: client)
+
+    return use
+
+
+def test_complete_json_secret_is_cached(json_secret):
+    json_secret({name: f"value-{name}" for name in ALL_NAMES})
+    assert get_aws_secrets()["DATABASE_URL"] == "value-DATABASE_URL"
+    assert config.read_secrets_cache()["DATABASE_URL"] == "value-DATABASE_URL"
+
+
+def test_missing_optional_key_keeps_the_environment_value(json_secret, caplog):
+    values = {name: f"value-{name}" for name in ALL_NAMES}
+    del values["TWILIO_AUTH_TOKEN"]
+    json_secret(values)
+
+    aws_config = get_aws_secrets()
+    assert "TWILIO_AUTH_TOKEN" not in aws_config
+    assert aws_config["JWT_SECRET_KEY"] == "value-INTELLIGENCE_API_SECRET"
+    assert "TWILIO_AUTH_TOKEN" in caplog.text
+    assert config.read_secrets_cache() == {}
+
+
+@pytest.mark.parametrize("name", sorted(REQUIRED_SECRETS))
+def test_missing_required_key_raises(name, monkeypatch):
+    monkeypatch.setenv("AWS_SECRETS_JSON_ID", "app/secrets")
+    values = {other: "x" for other in ALL_NAMES if other != name}
+    client = StubSecretsClient(values)
+    with pytest.raises(RuntimeError, match=name):
+        fetch_secrets(client)
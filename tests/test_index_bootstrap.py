@@ -0,0 +1,87 @@
+from datetime import datetime, timezone
+
+from src.jobs.index_bootstrap import apply_index, bulk_load_settings
+from src.services.index_manager import RolloverIndex, closed_period_indices
+
+CONFIG = {
+    "OPENSEARCH_SHARDS": 1,
+    "OPENSEARCH_REPLICAS": 1,
+    "OPENSEARCH_REFRESH_INTERVAL": "5s",
+}
+
+
+class StubIndices:
+    """Records index API calls against a fixed set of indices and aliases."""
+
+    def __init__(self, aliases):
+        # {index: {alias: is_write_index}}
+        self.aliases = aliases
+        self.calls = []
+
+    def exists(self, index):
+        return index in self.aliases
+
+    def exists_alias(self, name):
+        return any(name in aliases for aliases in self.aliases.values())
+
+    def get_alias(self, name):
+        return {index: {} for index, aliases in self.aliases.items() if name in aliases}
+
+    def get_settings(self, index, name):
+        return {
+            index: {"settings": {"index": {"refresh_interval": "1s"}}}
+            for index in self.get_alias(index)
+        }
+
+    def __getattr__(self, method):
+        return lambda **kwargs: self.calls.append((method, kwargs))
+
+
+class StubClient:
+    def __init__(self, aliases):
+        self.indices = StubIndices(aliases)
+
+
+def methods(client):
+    return [method for method, _ in client.indices.calls]
+
+
+def test_existing_index_keeps_its_settings_unless_asked():
+    client = StubClient({"feedback-analysis": {}})
+    apply_index(client, RolloverIndex("feedback-analysis"), CONFIG)
+    assert methods(client) == ["put_mapping"]
+
+    apply_index(client, RolloverIndex("feedback-analysis"), CONFIG, apply_settings=True)
+    assert methods(client)[-1] == "put_settings"
+
+
+def test_closed_period_indices_skip_the_write_index_and_open_periods():
+    rollover_index = RolloverIndex("feedback-analysis", "month")
+    client = StubClient(
+        {
+            "feedback-analysis-2026.08": {"feedback-analysis": False},
+            "feedback-analysis-2026.09": {
+                "feedback-analysis": False,
+                "feedback-analysis-write": True,
+            },
+            "feedback-analysis-2026.10": {"feedback-analysis": False},
+        }
+    )
+    now = datetime(2026, 10, 17, tzinfo=timezone.utc)
+    assert closed_period_indices(client, rollover_index, now) == [
+        "feedback-analysis-2026.08"
+    ]
+    assert closed_period_indices(client, RolloverIndex("feedback-analysis")) == []
+
+
+def test_bulk_load_restores_settings_without_merging():
+    client = StubClient({"feedback-analysis-2026.08": {"feedback-analysis": False}})
+    with bulk_load_settings(client, "feedback-analysis") as restore:
+        assert restore == {
+            "feedback-analysis-2026.08": {
+                "refresh_interval": "1s",
+                "number_of_replicas": None,
+            }
+        }
+    assert "forcemerge" not in methods(client)
+    assert methods(client) == ["put_settings", "put_settings", "refresh"]
@@ -0,0 +1,78 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import create_engine
+
+from src.jobs import migrate as migrate_job
+
+# The advisory lock only exists on Postgres; point this at a disposable database
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+needs_postgres = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set"
+)
+
+
+@pytest.fixture
+def pg_engine():
+    engine = create_engine(TEST_DATABASE_URL)
+    yield engine
+    engine.dispose()
+
+
+def test_other_databases_are_not_locked():
+    engine = create_engine("sqlite://")
+    with engine.connect() as connection:
+        with migrate_job.migration_lock(connection, wait=False) as locked:
+            assert locked
+
+
+@needs_postgres
+def test_lock_excludes_other_sessions(pg_engine):
+    with pg_engine.connect() as holder, pg_engine.connect() as other:
+        with migrate_job.migration_lock(holder) as locked:
+            assert locked
+            with migrate_job.migration_lock(other, wait=False) as other_locked:
+                assert not other_locked
+        with migrate_job.migration_lock(other, wait=False) as other_locked:
+            assert other_locked
+
+
+@needs_postgres
+def test_waiting_session_gets_the_lock_after_release(pg_engine):
+    acquired = threading.Event()
+
+    def wait_for_lock():
+        with pg_engine.connect() as connection:
+            with migrate_job.migration_lock(connection):
+                acquired.set()
+
+    with pg_engine.connect() as holder:
+        with migrate_job.migration_lock(holder):
+            waiter = threading.Thread(target=wait_for_lock)
+            waiter.start()
+            assert not acquired.wait(0.5)
+        waiter.join(5)
+    assert acquired.is_set()
+
+
+@needs_postgres
+def test_concurrent_migrations_upgrade_once(pg_engine, monkeypatch):
+    upgrades = []
+    done = threading.Event()
+
+    def upgrade(alembic_cfg, revision):
+        upgrades.append(revision)
+        time.sleep(0.3)
+        done.set()
+
+    monkeypatch.setattr(migrate_job, "engine", pg_engine)
+    monkeypatch.setattr(migrate_job, "is_at_head", lambda *args: done.is_set())
+    monkeypatch.setattr(migrate_job.command, "upgrade", upgrade)
+
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(lambda _: migrate_job.migrate(), range(4)))
+    assert upgrades == ["head"]
+    assert sorted(results) == [False, False, False, True]
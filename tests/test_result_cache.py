@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+
+from src.services.cache_backends import InMemoryLRUBackend, SQLiteBackend
+from src.services.result_cache import ResultCache
+
+
+class CountingLoader:
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"value": self.calls}
+
+
+async def age_entry(cache: ResultCache, key, seconds: float) -> None:
+    entry = await cache.backend.get(cache._key(key))
+    entry.stored_at -= seconds
+    await cache.backend.set(cache._key(key), entry)
+
+
+def test_fresh_entries_are_served_from_the_cache():
+    async def run():
+        cache = ResultCache(ttl_seconds=60)
+        loader = CountingLoader()
+        assert await cache.get_or_load(("stats", {}), loader) == {"value": 1}
+        assert await cache.get_or_load(("stats", {}), loader) == {"value": 1}
+        assert loader.calls == 1
+        stats = await cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+    asyncio.run(run())
+
+
+def test_concurrent_misses_share_one_load():
+    async def run():
+        cache = ResultCache(ttl_seconds=60)
+        loader = CountingLoader(delay=0.05)
+        results = await asyncio.gather(
+            *(cache.get_or_load("key", loader) for _ in range(10))
+        )
+        assert loader.calls == 1
+        assert results == [{"value": 1}] * 10
+        assert (await cache.stats())["coalesced"] == 9
+
+    asyncio.run(run())
+
+
+def test_stale_entries_are_served_while_refreshing():
+    async def run():
+        cache = ResultCache(ttl_seconds=60, stale_seconds=300)
+        loader = CountingLoader()
+        await cache.get_or_load("key", loader)
+        await age_entry(cache, "key", 120)
+
+        assert await cache.get_or_load("key", loader) == {"value": 1}
+        await asyncio.sleep(0.01)
+        assert loader.calls == 2
+        assert await cache.get_or_load("key", loader) == {"value": 2}
+        stats = await cache.stats()
+        assert (stats["stale_hits"], stats["refreshes"]) == (1, 1)
+
+    asyncio.run(run())
+
+
+def test_entries_past_the_stale_window_are_reloaded():
+    async def run():
+        cache = ResultCache(ttl_seconds=60, stale_seconds=300)
+        loader = CountingLoader()
+        await cache.get_or_load("key", loader)
+        await age_entry(cache, "key", 400)
+        assert await cache.get_or_load("key", loader) == {"value": 2}
+
+    asyncio.run(run())
+
+
+def test_failed_loads_are_not_cached():
+    async def run():
+        cache = ResultCache(ttl_seconds=60)
+
+        async def failing():
+            raise TimeoutError("timed out")
+
+        with pytest.raises(TimeoutError):
+            await cache.get_or_load("key", failing)
+        assert await cache.backend.size() == 0
+        assert await cache.get_or_load("key", CountingLoader()) == {"value": 1}
+
+    asyncio.run(run())
+
+
+def test_lru_backend_evicts_the_least_recently_used_entry():
+    async def run():
+        cache = ResultCache(ttl_seconds=60, backend=InMemoryLRUBackend(max_entries=2))
+        await cache.put("a", 1)
+        await cache.put("b", 2)
+        assert await cache.peek("a") == 1
+        await cache.put("c", 3)
+        assert await cache.peek("b") is None
+        assert await cache.peek("a") == 1
+
+    asyncio.run(run())
+
+
+def test_sqlite_backend_shares_one_load_across_workers(tmp_path):
+    """Two caches on one file stand in for two workers on a host."""
+    path = str(tmp_path / "cache.sqlite3")
+
+    async def run():
+        workers = [
+            ResultCache(ttl_seconds=60, backend=SQLiteBackend(path)) for _ in range(2)
+        ]
+        loader = CountingLoader(delay=0.2)
+        try:
+            results = await asyncio.gather(
+                *(cache.get_or_load("key", loader) for cache in workers)
+            )
+            assert results == [{"value": 1}] * 2
+            assert loader.calls == 1
+            peer_loads = [(await cache.stats())["peer_loads"] for cache in workers]
+            assert sorted(peer_loads) == [0, 1]
+            assert await workers[1].backend.size() == 1
+        finally:
+            for cache in workers:
+                cache.backend.close()
+
+    asyncio.run(run())
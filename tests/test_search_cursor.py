@@ -0,0 +1,148 @@
+import asyncio
+
+import pytest
+
+from src.services.search_service import (
+    AsyncSearchService,
+    CursorExpiredError,
+    SearchFilters,
+    cursor_fingerprint,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+class NotFoundError(Exception):
+    status_code = 404
+
+
+class FakeOpenSearch:
+    """Serves feedback_id-sorted pages and tracks point-in-time lifetimes."""
+
+    def __init__(self, count: int):
+        self.docs = [{"feedback_id": f"{i:05d}"} for i in range(count)]
+        self.open_pits = set()
+        self.bodies = []
+        self.fail_with = None
+
+    async def create_pit(self, index, params):
+        pit_id = f"pit-{len(self.open_pits)}"
+        self.open_pits.add(pit_id)
+        return {"pit_id": pit_id}
+
+    async def delete_pit(self, body):
+        self.open_pits.difference_update(body["pit_id"])
+
+    async def search(self, body, index=None):
+        self.bodies.append(body)
+        if self.fail_with is not None:
+            raise self.fail_with
+        if "pit" in body and body["pit"]["id"] not in self.open_pits:
+            raise NotFoundError("search_context_missing_exception")
+        ordered = sorted(self.docs, key=lambda doc: doc["feedback_id"], reverse=True)
+        if "search_after" in body:
+            after = body["search_after"][0]
+            ordered = [doc for doc in ordered if doc["feedback_id"] < after]
+        else:
+            ordered = ordered[body.get("from", 0) :]
+        hits = [
+            {"_source": doc, "sort": [doc["feedback_id"], 0]}
+            for doc in ordered[: body["size"]]
+        ]
+        return {"hits": {"hits": hits, "total": {"value": len(self.docs)}}}
+
+
+def walk(service, page_size, snapshot=False, filters=None):
+    async def run():
+        pages = []
+        result = await service.get_dashboard_messages(
+            page_size=page_size, filters=filters, snapshot=snapshot
+        )
+        pages.append(result)
+        while result["next_cursor"]:
+            result = await service.get_dashboard_messages(
+                page_size=page_size, filters=filters, cursor=result["next_cursor"]
+            )
+            pages.append(result)
+        return pages
+
+    return asyncio.run(run())
+
+
+def test_cursor_round_trip():
+    state = {"search_after": ["00042", 7], "total": 3, "query": "abc"}
+    assert decode_cursor(encode_cursor(state)) == state
+
+
+@pytest.mark.parametrize("cursor", ["", "not base64!", encode_cursor({"a": 1})])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_fingerprint_depends_on_filters_and_page_size():
+    base = cursor_fingerprint(SearchFilters(product_name="a"), 10)
+    assert base == cursor_fingerprint(SearchFilters(product_name="a"), 10)
+    assert base != cursor_fingerprint(SearchFilters(product_name="b"), 10)
+    assert base != cursor_fingerprint(SearchFilters(product_name="a"), 20)
+    assert cursor_fingerprint(None, 10) == cursor_fingerprint(SearchFilters(), 10)
+
+
+@pytest.mark.parametrize("snapshot", [False, True])
+def test_walk_returns_every_document_once(snapshot):
+    client = FakeOpenSearch(25)
+    pages = walk(AsyncSearchService(client), page_size=10, snapshot=snapshot)
+
+    ids = [doc["feedback_id"] for page in pages for doc in page["messages"]]
+    assert len(ids) == len(set(ids)) == 25
+    assert [page["page"] for page in pages] == [0, None, None]
+    assert all(page["total"] == 25 for page in pages)
+    assert client.open_pits == set()
+    for body in client.bodies:
+        tiebreaker = [key for sort in body["sort"] for key in sort] == [
+            "feedback_id",
+            "_shard_doc",
+        ]
+        assert tiebreaker == ("pit" in body)
+
+
+def test_cursor_for_other_query_is_rejected():
+    client = FakeOpenSearch(25)
+    service = AsyncSearchService(client)
+    first = asyncio.run(service.get_dashboard_messages(page_size=10))
+    with pytest.raises(ValueError):
+        asyncio.run(
+            service.get_dashboard_messages(page_size=20, cursor=first["next_cursor"])
+        )
+
+
+def test_expired_snapshot_raises():
+    client = FakeOpenSearch(25)
+    service = AsyncSearchService(client)
+    first = asyncio.run(service.get_dashboard_messages(page_size=10, snapshot=True))
+    client.open_pits.clear()
+    with pytest.raises(CursorExpiredError):
+        asyncio.run(
+            service.get_dashboard_messages(page_size=10, cursor=first["next_cursor"])
+        )
+
+
+def test_cursor_page_failure_is_not_an_empty_page():
+    client = FakeOpenSearch(25)
+    service = AsyncSearchService(client)
+    first = asyncio.run(service.get_dashboard_messages(page_size=10))
+    client.fail_with = TimeoutError("timed out")
+    with pytest.raises(TimeoutError):
+        asyncio.run(
+            service.get_dashboard_messages(page_size=10, cursor=first["next_cursor"])
+        )
+    with pytest.raises(TimeoutError):
+        asyncio.run(service.get_dashboard_messages(page_size=10, snapshot=True))
+    assert client.open_pits == set()
+
+
+def test_first_page_failure_degrades_to_empty_page():
+    client = FakeOpenSearch(25)
+    client.fail_with = TimeoutError("timed out")
+    result = asyncio.run(AsyncSearchService(client).get_dashboard_messages())
+    assert result["messages"] == [] and result["next_cursor"] is None
@@ -0,0 +1,62 @@
+import asyncio
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+
+from src.routes.dashboard import get_search_filters
+from src.services.search_service import SearchFilters
+from src.services.wordcount_store import utc_day
+
+app = FastAPI()
+
+
+@app.get("/filters")
+async def filters_route(filters: SearchFilters = Depends(get_search_filters)):
+    return filters.cache_key()
+
+
+def get_filters(**params) -> httpx.Response:
+    async def request():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            return await c.get("/filters", params=params)
+
+    return asyncio.run(request())
+
+
+def test_date_only_created_to_covers_the_whole_day():
+    response = get_filters(created_from="2024-05-01", created_to="2024-05-01")
+    assert response.json() == {
+        "created_from": "2024-05-01T00:00:00+00:00",
+        "created_to": "2024-05-01T23:59:59.999999+00:00",
+    }
+    created_to = datetime.fromisoformat(response.json()["created_to"])
+    assert utc_day(created_to) == created_to.date()
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2024-05-01T00:00:00", "2024-05-01T00:00:00"),
+        ("2024-05-01T10:30:00Z", "2024-05-01T10:30:00+00:00"),
+    ],
+)
+def test_created_to_with_a_time_is_kept(value, expected):
+    assert get_filters(created_to=value).json() == {"created_to": expected}
+
+
+def test_reversed_range_is_rejected():
+    response = get_filters(created_from="2024-05-02", created_to="2024-05-01")
+    assert response.status_code == 400
+    assert get_filters(created_to="not a date").status_code == 422
+
+
+def test_range_clause_is_inclusive():
+    filters = SearchFilters(
+        created_to=datetime(2024, 5, 1, 23, 59, 59, 999999, tzinfo=timezone.utc)
+    )
+    assert filters.to_clauses() == [
+        {"range": {"created_at": {"lte": "2024-05-01T23:59:59.999999+00:00"}}}
+    ]
@@ -0,0 +1,88 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import delete, insert, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.auth import user_states as user_states_module
+from src.auth.user_states import UserStates
+from src.models.user import User
+
+START = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def session_factory(monkeypatch):
+    """SQLite stand-in for the users table; updated_at is set by hand."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+
+    async def setup():
+        async with engine.begin() as conn:
+            await conn.run_sync(User.__table__.create)
+            await conn.execute(
+                insert(User),
+                [
+                    {"id": 1, "email": "a@x", "token_version": 0, "updated_at": START},
+                    {"id": 2, "email": "b@x", "token_version": 0, "updated_at": START},
+                ],
+            )
+
+    asyncio.run(setup())
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    monkeypatch.setattr(user_states_module, "AsyncSessionLocal", factory)
+    yield factory
+    asyncio.run(engine.dispose())
+
+
+def run_sql(factory, statement):
+    async def execute():
+        async with factory() as db:
+            await db.execute(statement)
+            await db.commit()
+
+    asyncio.run(execute())
+
+
+def test_refresh_applies_changed_rows(session_factory):
+    states = UserStates(refresh_seconds=30)
+    assert states.get(1) is None
+    asyncio.run(states.refresh())
+    assert states.get(1) == (0, True)
+
+    run_sql(
+        session_factory,
+        update(User)
+        .where(User.id == 1)
+        .values(token_version=1, updated_at=START + timedelta(hours=1)),
+    )
+    run_sql(
+        session_factory,
+        update(User)
+        .where(User.id == 2)
+        .values(is_active=False, updated_at=START + timedelta(minutes=1)),
+    )
+    asyncio.run(states.refresh())
+    assert states.get(1) == (1, True)
+    # Committed late with an older updated_at, but inside the overlap
+    assert states.get(2) == (0, False)
+
+
+def test_full_reload_drops_deleted_users(session_factory):
+    states = UserStates(refresh_seconds=30, full_reload_every=2)
+    asyncio.run(states.refresh())
+    run_sql(session_factory, delete(User).where(User.id == 2))
+    asyncio.run(states.refresh())
+    assert states.get(2) == (0, True)
+    asyncio.run(states.refresh())
+    assert states.get(2) is None
+
+
+def test_stale_states_fail_closed(session_factory, monkeypatch):
+    states = UserStates(refresh_seconds=30, max_stale_intervals=3)
+    asyncio.run(states.refresh())
+    clock = states._loaded_at
+    monkeypatch.setattr(user_states_module.time, "monotonic", lambda: clock + 89)
+    assert states.get(1) == (0, True)
+    monkeypatch.setattr(user_states_module.time, "monotonic", lambda: clock + 91)
+    assert states.get(1) is None
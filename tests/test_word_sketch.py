@@ -0,0 +1,78 @@
+from collections import Counter
+
+import pytest
+
+from src.jobs.word_sketch_stage import WordSketchStage
+from src.services.word_sketch import HeavyHitters
+
+WORDS = ["delivery"] * 50 + ["price"] * 30 + ["support"] * 20 + ["late"] * 5
+
+
+def sketch_of(words, from_id, through_id, **kwargs):
+    sketch = HeavyHitters(width=256, depth=4, capacity=3, **kwargs)
+    sketch.update(words)
+    sketch.from_id, sketch.through_id = from_id, through_id
+    return sketch
+
+
+def test_counts_are_never_understated():
+    sketch = sketch_of(WORDS, 0, 1)
+    for word, count in Counter(WORDS).items():
+        assert count <= sketch.estimate(word) <= count + sketch.error_bound
+    assert [entry["word"] for entry in sketch.top(2)] == ["delivery", "price"]
+
+
+def test_candidates_keep_the_heaviest_words():
+    sketch = HeavyHitters(width=1024, depth=4, capacity=2)
+    for word in ["a", "b", "c", "d"] + ["x"] * 10 + ["y"] * 8 + ["e"]:
+        sketch.add(word)
+    assert [entry["word"] for entry in sketch.top(2)] == ["x", "y"]
+
+
+def test_round_trip(tmp_path):
+    sketch = sketch_of(WORDS, 10, 20)
+    path = str(tmp_path / "sketch.json.gz")
+    sketch.save(path)
+    loaded = HeavyHitters.load(path)
+    assert (loaded.from_id, loaded.through_id, loaded.total) == (10, 20, len(WORDS))
+    assert loaded.top(3) == sketch.top(3)
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_merge_adjacent_ranges(reverse):
+    first = sketch_of(WORDS[:60], 0, 100)
+    second = sketch_of(WORDS[60:], 100, 250)
+    if reverse:
+        first, second = second, first
+    first.merge(second)
+    whole = sketch_of(WORDS, 0, 250)
+    assert (first.from_id, first.through_id) == (0, 250)
+    assert first.total == whole.total
+    assert first.top(3) == whole.top(3)
+
+
+@pytest.mark.parametrize("other_range", [(50, 150), (120, 200), (0, 100)])
+def test_merge_rejects_overlaps_and_gaps(other_range):
+    sketch = sketch_of(WORDS, 0, 100)
+    other = sketch_of(WORDS, *other_range)
+    with pytest.raises(ValueError):
+        sketch.merge(other)
+    assert (sketch.from_id, sketch.through_id, sketch.total) == (0, 100, len(WORDS))
+
+
+def test_merge_with_an_empty_sketch_keeps_the_range():
+    sketch = HeavyHitters(width=256, depth=4, capacity=3)
+    sketch.merge(sketch_of(WORDS, 40, 90))
+    assert (sketch.from_id, sketch.through_id) == (40, 90)
+
+
+def test_stage_skips_counted_rows_and_starts_at_the_first_batch(tmp_path):
+    stage = WordSketchStage(
+        str(tmp_path / "sketch.json.gz"), width=256, depth=4, capacity=3
+    )
+    rows = [{"id": i, "feedback_text": "late delivery"} for i in range(11, 14)]
+    stage.after_checkpoint(rows, [])
+    stage.after_checkpoint(rows, [])
+    assert (stage.sketch.from_id, stage.sketch.through_id) == (10, 13)
+    assert stage.sketch.estimate("delivery") == 3
+    assert stage.counters == {"documents": 3, "skipped": 3, "snapshots": 0}